@@ -1,10 +1,10 @@
 """Streamlit UI for PowerPoint Generator."""
 
+import copy
+import json
 import streamlit as st
 import yaml
 import sys
-import tempfile
-import shutil
 from pathlib import Path
 
 # Add src directory to path for imports
@@ -14,8 +14,15 @@ src_dir = project_root / "src"
 if str(src_dir) not in sys.path:
     sys.path.insert(0, str(src_dir))
 
+from iltci_pptx.artifact_store import get_artifact_store
 from iltci_pptx.config import Config
-from iltci_pptx.generator import PresentationGenerator
+from iltci_pptx.jobs import GenerationJob, DONE, CANCELLED
+from iltci_pptx.timing import PHASES
+
+PPTX_MIME = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+
+# Streamlit 1.52+ accepts a callable for download data and only calls it on click
+DEFERRED_DOWNLOADS = tuple(int(part) for part in st.__version__.split('.')[:2]) >= (1, 52)
 
 
 def load_base_config() -> dict:
@@ -25,16 +32,166 @@ def load_base_config() -> dict:
         return yaml.safe_load(f)
 
 
+def file_stamp(path: Path):
+    """Return (mtime_ns, size) for a file, or None if it does not exist."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def get_config(config_json: str, template_config_stamp) -> Config:
+    """Build a Config for merged settings once and share it across reruns.
+    
+    The Config also caches lookups and derived builder settings, so keeping
+    it warm avoids re-reading template-config.yaml and re-deriving styles on
+    every click. Parsed templates and slides are cached by the generator
+    itself, keyed by content hash.
+    
+    Args:
+        config_json: Merged configuration as canonical JSON (the cache key)
+        template_config_stamp: Stamp of template-config.yaml, so edits to it reload
+    """
+    return Config.from_dict(json.loads(config_json), app_dir)
+
+
+def session_config(base_config: dict, overwrite: bool, log_level: str) -> dict:
+    """Merge one generation's settings into a copy of the base configuration.
+    
+    App generations are always deterministic: without fixed ZIP timestamps
+    the same deck generated by two sessions would differ in bytes and get
+    two entries in the content-addressed artifact store.
+    
+    Args:
+        base_config: Configuration loaded from config.yaml
+        overwrite: Whether an existing output file may be overwritten
+        log_level: Logging level name
+        
+    Returns:
+        Merged configuration dictionary
+    """
+    merged_config = copy.deepcopy(base_config)
+    merged_config['settings']['overwrite_output'] = overwrite
+    merged_config['settings']['logging']['level'] = log_level
+    merged_config.setdefault('package', {})['deterministic'] = True
+    return merged_config
+
+
 def init_session_state():
     """Initialize session state with base configuration."""
     if 'base_config' not in st.session_state:
         st.session_state.base_config = load_base_config()
-    if 'pptx_bytes' not in st.session_state:
-        st.session_state.pptx_bytes = None
-    if 'output_filename' not in st.session_state:
-        st.session_state.output_filename = None
+    if 'artifact' not in st.session_state:
+        st.session_state.artifact = None
     if 'template_path' not in st.session_state:
         st.session_state.template_path = None
+    if 'job' not in st.session_state:
+        st.session_state.job = None
+
+
+def format_phase_times(phases: dict) -> str:
+    """Format per-phase seconds from a progress event as one caption line."""
+    names = [name for name in PHASES if name in phases]
+    return " · ".join(f"{name} {phases[name] * 1000:.0f} ms" for name in names)
+
+
+@st.fragment(run_every=0.5)
+def show_job_progress():
+    """Poll the running generation job; only this fragment reruns while it builds."""
+    job = st.session_state.job
+    if job is None:
+        return
+    if job.finished:
+        # Rerun the whole page to show the result
+        st.rerun()
+    
+    progress = job.progress
+    total = progress['total']
+    if progress['phase'] == 'build' and total:
+        st.progress(progress['slide'] / total,
+                    text=f"Building slide {progress['slide']} of {total}: {progress['title']}")
+    else:
+        label = {'parse': 'Parsing content', 'template_load': 'Loading template',
+                 'save': 'Saving presentation'}.get(progress['phase'], 'Starting')
+        st.progress(1.0 if progress['phase'] == 'save' else 0.0, text=f"{label}...")
+    st.caption(f"Elapsed {job.elapsed:.1f} s · {format_phase_times(progress['phases'])}")
+    
+    if st.button("⏹ Cancel", key="cancel_generation"):
+        job.cancel()
+        st.info("Cancelling after the current step...")
+
+
+def read_artifact(store, handle: str) -> bytes:
+    """Read a stored deck when its deferred download button is clicked.
+    
+    The deck may have been evicted or expired since the button was shown.
+    Streamlit then reports the download as failed, and the next rerun shows
+    the expired notice from artifact_download_button.
+    """
+    data = store.read(handle)
+    if data is None:
+        raise FileNotFoundError(f"Artifact {handle[:12]} expired before it was downloaded")
+    return data
+
+
+def artifact_download_button(artifact: dict, label: str) -> None:
+    """Offer a stored deck for download, reading it from disk.
+    
+    Sessions keep only the artifact handle. With deferred downloads the file
+    is read only when the button is clicked.
+    """
+    store, handle = artifact['store'], artifact['handle']
+    if DEFERRED_DOWNLOADS:
+        data = (lambda: read_artifact(store, handle)) if store.path(handle) else None
+    else:
+        data = store.read(handle)
+    if data is None:
+        st.warning("⌛ The generated file has expired on the server. Please generate it again.")
+        return
+    st.download_button(
+        label=label,
+        data=data,
+        file_name=artifact['filename'],
+        mime=PPTX_MIME,
+        use_container_width=True
+    )
+
+
+def show_job_result(job: GenerationJob) -> None:
+    """Show the outcome of a finished job and keep its deck for download."""
+    output = st.session_state.job_output
+    if job.state == DONE:
+        pptx_bytes = job.result
+        
+        # Optionally keep a copy in the output folder
+        if output['save_copy']:
+            output_path = project_root / "output" / output['filename']
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path.write_bytes(pptx_bytes)
+        
+        # Keep the deck in the shared artifact store; the session only holds its handle
+        store = get_artifact_store(job.config)
+        st.session_state.artifact = {
+            'store': store,
+            'handle': store.put(pptx_bytes),
+            'filename': output['filename'],
+        }
+        job.result = None
+        
+        st.success(f"✅ PowerPoint generated successfully in {job.elapsed:.1f} s!")
+        st.caption(format_phase_times(job.report.phases))
+        
+        # Download button
+        artifact_download_button(st.session_state.artifact, "📥 Download PowerPoint")
+    elif job.state == CANCELLED:
+        st.warning(f"⏹ Generation cancelled after {job.elapsed:.1f} s.")
+    elif isinstance(job.error, FileNotFoundError):
+        st.error(f"❌ File not found: {job.error}")
+    else:
+        st.error(f"❌ Generation failed: {job.error}")
+        st.exception(job.error)
 
 
 def main():
@@ -137,9 +294,9 @@ def main():
     
     with col4:
         use_temp_output = st.checkbox(
-            "Use temporary directory (recommended)",
+            "Download only (recommended)",
             value=defaults.get('use_temp_output', True),
-            help="Generate file in temp directory for clean download"
+            help="Generate in memory for download without saving a copy to the output folder"
         )
         
         overwrite = st.checkbox(
@@ -151,111 +308,57 @@ def main():
     # === Generate Button ===
     st.divider()
     
-    generate_clicked = st.button("🚀 Generate PPTX", type="primary", use_container_width=True)
+    job = st.session_state.job
+    job_running = job is not None and not job.finished
+    generate_clicked = st.button("🚀 Generate PPTX", type="primary", use_container_width=True,
+                                 disabled=job_running)
     if generate_clicked:
         # Validate inputs
         if content_source == "Upload custom file" and uploaded_file is None:
             st.error("❌ Please upload a Markdown file first.")
             return
         
-        temp_dir = None
-        temp_content_file = None
-        temp_template_file = None
-        
         try:
             # Build merged configuration
-            import copy
-            merged_config = copy.deepcopy(st.session_state.base_config)
+            merged_config = session_config(st.session_state.base_config, overwrite,
+                                           st.session_state.get('log_level', 'INFO'))
             
-            # Handle content path
+            # Uploads are passed to the generator in memory, not through temp files
+            markdown = None
             if content_source == "Upload custom file" and uploaded_file:
-                # Write uploaded content to temp file
-                temp_content_file = tempfile.NamedTemporaryFile(
-                    mode='wb',
-                    suffix='.md',
-                    delete=False
-                )
-                temp_content_file.write(uploaded_file.read())
-                temp_content_file.close()
-                merged_config['paths']['content'] = temp_content_file.name
+                markdown = uploaded_file.getvalue()
             # else: use default content path from config
             
-            # Handle template path
-            if template_source == "Upload" and uploaded_template:
-                # Write uploaded template to temp file
-                temp_template_file = tempfile.NamedTemporaryFile(
-                    mode='wb',
-                    suffix='.pptx',
-                    delete=False
-                )
-                temp_template_file.write(uploaded_template.read())
-                temp_template_file.close()
-                template_path = temp_template_file.name
-                st.session_state.template_path = template_path
-                merged_config['paths']['template'] = template_path
+            template_bytes = None
+            if template_source == "Upload custom template" and uploaded_template:
+                template_bytes = uploaded_template.getvalue()
             # else: use default template path from config
             
-            # Update settings
-            merged_config['settings']['overwrite_output'] = overwrite
-            merged_config['settings']['logging']['level'] = st.session_state.get('log_level', 'INFO')
+            template_config = merged_config['paths'].get('template_config', '')
+            cfg = get_config(json.dumps(merged_config, sort_keys=True),
+                             file_stamp(project_root / template_config))
+            if markdown is None:
+                markdown = cfg.content_path.read_bytes()
             
-            # Handle output path
-            if use_temp_output:
-                temp_dir = Path(tempfile.mkdtemp(prefix='iltci_pptx_'))
-                output_path = temp_dir / output_filename
-            else:
-                output_path = project_root / "output" / output_filename
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            merged_config['paths']['output'] = str(output_path)
-            
-            # Create Config and generate
-            with st.spinner('🔄 Generating presentation...'):
-                cfg = Config.from_dict(merged_config, app_dir)
-                generator = PresentationGenerator(cfg)
-                generator.generate()
-            
-            # Read generated file
-            pptx_bytes = output_path.read_bytes()
-            st.session_state.pptx_bytes = pptx_bytes
-            st.session_state.output_filename = output_filename
-            
-            st.success("✅ PowerPoint generated successfully!")
-            
-            # Download button
-            st.download_button(
-                label="📥 Download PowerPoint",
-                data=pptx_bytes,
-                file_name=output_filename,
-                mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
-                use_container_width=True
-            )
+            # Generate on a background thread; the progress fragment polls it
+            job = st.session_state.job = GenerationJob(cfg, markdown, template_bytes).start()
+            st.session_state.job_output = {'filename': output_filename, 'save_copy': not use_temp_output}
+            job_running = True
             
         except FileNotFoundError as e:
             st.error(f"❌ File not found: {e}")
         except Exception as e:
             st.error(f"❌ Generation failed: {e}")
             st.exception(e)
-        
-        finally:
-            # Cleanup temp files
-            if temp_content_file and Path(temp_content_file.name).exists():
-                try:
-                    Path(temp_content_file.name).unlink()
-                except Exception:
-                    pass
-            
-            if temp_template_file and Path(temp_template_file.name).exists():
-                try:
-                    Path(temp_template_file.name).unlink()
-                except Exception:
-                    pass
-            
-            if temp_dir and temp_dir.exists():
-                try:
-                    shutil.rmtree(temp_dir)
-                except Exception:
-                    pass
+    
+    # Progress while the job runs, then its result once
+    job_finished = False
+    if job_running:
+        show_job_progress()
+    elif job is not None:
+        show_job_result(job)
+        st.session_state.job = None
+        job_finished = True
     
     # === Advanced Settings (collapsible) - shown after Generate button ===
     st.divider()
@@ -303,15 +406,10 @@ def main():
             )
     
     # Show previous download if available (when not just generated)
-    if st.session_state.pptx_bytes is not None and not generate_clicked:
+    artifact = st.session_state.artifact
+    if artifact is not None and not job_running and not job_finished:
         st.info("💾 Previous generation available for download:")
-        st.download_button(
-            label=f"📥 Download {st.session_state.output_filename}",
-            data=st.session_state.pptx_bytes,
-            file_name=st.session_state.output_filename,
-            mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
-            use_container_width=True
-        )
+        artifact_download_button(artifact, f"📥 Download {artifact['filename']}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""Benchmark presentation generation on synthetic decks.
+
+Usage:
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --sizes 10,100,1000,10000 --repeat 2
+    python benchmarks/run_benchmarks.py --compare benchmarks/results/<earlier>.json
+    python benchmarks/run_benchmarks.py --set package.store_media=false --set package.compress_level=1
+
+Each deck size runs in a fresh subprocess so peak RSS is measured per size.
+Within a size, the first run starts with empty template, image and index
+caches (cold); further runs reuse them (warm). Every run records the time
+spent in each phase (config load, then the phases of the GenerationReport
+returned by generate(): template load, parse, slide building per builder,
+image preparation and embedding, content text, save) and the results are
+written as JSON so runs on different commits or configurations (--set) can be
+compared. With several sizes, a scaling table shows whether the per-slide
+build cost stays flat as decks grow. Each size also records a digest of the
+generated slide XML, so --compare tells whether two code paths produce the
+same slides, e.g. the direct text emitter against python-pptx:
+
+    python benchmarks/run_benchmarks.py --set formatting.text_emitter=pptx --output pptx.json
+    python benchmarks/run_benchmarks.py --compare pptx.json
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import yaml
+import zipfile
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / 'src'))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+DEFAULT_SIZES = [10, 100, 1000]
+DEFAULT_CONFIG = REPO_ROOT / 'app' / 'config.yaml'
+RESULTS_DIR = Path(__file__).resolve().parent / 'results'
+
+# Phases reported for every run, in display order
+PHASES = ['config_load', 'template_load', 'parse', 'build', 'image_prepare', 'image_embed', 'text', 'save']
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB (None where unsupported)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def parse_overrides(items: List[str]) -> Dict[str, Any]:
+    """Parse --set KEY=VALUE items, reading values as YAML scalars."""
+    overrides = {}
+    for item in items:
+        key, sep, value = item.partition('=')
+        if not sep or not key:
+            raise SystemExit(f"--set expects KEY=VALUE, got {item!r}")
+        overrides[key] = yaml.safe_load(value)
+    return overrides
+
+
+def slides_digest(pptx_path: Path) -> str:
+    """SHA1 over the slide parts and their relationships, in partname order.
+
+    Unlike the whole file, this does not change with ZIP timestamps or
+    document properties, so it identifies the generated slide XML.
+    """
+    h = hashlib.sha1()
+    with zipfile.ZipFile(pptx_path) as archive:
+        for name in sorted(archive.namelist()):
+            if name.startswith('ppt/slides/'):
+                h.update(name.encode('utf-8'))
+                h.update(archive.read(name))
+    return h.hexdigest()
+
+
+def run_size(num_slides: int, repeat: int, config_path: Path,
+             overrides: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Generate a synthetic deck `repeat` times in this process and time each run.
+
+    Args:
+        num_slides: Deck size
+        repeat: Number of runs (the first is cold)
+        config_path: Main configuration file
+        overrides: Dotted configuration keys to set before each run
+
+    Returns:
+        Result dictionary for this size
+    """
+    import logging
+    from synthetic_deck import make_deck
+    from iltci_pptx.config import Config
+    from iltci_pptx.generator import PresentationGenerator
+
+    # Image paths in the deck are relative to the repository root
+    os.chdir(REPO_ROOT)
+
+    with tempfile.TemporaryDirectory(prefix='iltci-bench-') as tmp:
+        tmp_dir = Path(tmp)
+        deck_path = tmp_dir / f"deck-{num_slides}.md"
+        output_path = tmp_dir / f"deck-{num_slides}.pptx"
+        deck_path.write_text(make_deck(num_slides), encoding='utf-8')
+
+        runs = []
+        for run in range(repeat):
+            start = time.perf_counter()
+            config = Config(str(config_path))
+            config_load = time.perf_counter() - start
+
+            config.set('paths.content', str(deck_path))
+            config.set('paths.output', str(output_path))
+            config.set('image_processing.cache_dir', str(tmp_dir / 'images'))
+            config.set('image_index.path', str(tmp_dir / 'image-index.json'))
+            config.set('incremental.enabled', False)
+            config.set('result_cache.enabled', False)
+            for key, value in (overrides or {}).items():
+                config.set(key, value)
+            # Keep log formatting out of the measurements
+            logging.getLogger().setLevel(logging.WARNING)
+
+            report = PresentationGenerator(config).generate()
+
+            phases = {phase: report.phases.get(phase, 0.0) for phase in PHASES}
+            phases['config_load'] = config_load
+            runs.append({
+                'cold': run == 0,
+                'total_seconds': config_load + report.total_seconds,
+                'phases': phases,
+                'builders': report.builder_totals(),
+            })
+
+        return {
+            'slides': num_slides,
+            'deck_bytes': deck_path.stat().st_size,
+            'output_bytes': output_path.stat().st_size,
+            'slides_sha1': slides_digest(output_path),
+            'peak_rss_mb': peak_rss_mb(),
+            'runs': runs,
+        }
+
+
+def run_size_subprocess(num_slides: int, repeat: int, config_path: Path,
+                        overrides: List[str]) -> Dict[str, Any]:
+    """Run one size in a fresh interpreter so its peak RSS is not shared."""
+    with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
+        result_path = Path(f.name)
+    try:
+        command = [sys.executable, __file__, '--single', str(num_slides),
+                   '--repeat', str(repeat), '--config', str(config_path),
+                   '--output', str(result_path)]
+        for item in overrides:
+            command += ['--set', item]
+        subprocess.run(command, check=True)
+        return json.loads(result_path.read_text(encoding='utf-8'))
+    finally:
+        result_path.unlink(missing_ok=True)
+
+
+def environment_info() -> Dict[str, Any]:
+    """Describe the code and machine a benchmark ran on."""
+    import pptx
+
+    def git(*args: str) -> str:
+        try:
+            return subprocess.run(['git', *args], cwd=REPO_ROOT, capture_output=True,
+                                  text=True, check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return ''
+
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': git('rev-parse', '--short', 'HEAD'),
+        'dirty': bool(git('status', '--porcelain', '--untracked-files=no')),
+        'python': platform.python_version(),
+        'python_pptx': pptx.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def best_run(result: Dict[str, Any]) -> Dict[str, Any]:
+    """The fastest run of a size (warm runs are usually the most stable)."""
+    return min(result['runs'], key=lambda run: run['total_seconds'])
+
+
+def comparable_runs(result: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """The cold run and the fastest warm run of a size, keyed 'cold' and 'warm'."""
+    runs = {'cold': result['runs'][0]}
+    warm = result['runs'][1:]
+    if warm:
+        runs['warm'] = min(warm, key=lambda run: run['total_seconds'])
+    return runs
+
+
+def print_summary(results: List[Dict[str, Any]]) -> None:
+    """Print one line per deck size using its fastest run."""
+    header = f"{'slides':>7} {'total s':>8} {'ms/slide':>9}"
+    header += ''.join(f" {phase:>13}" for phase in PHASES) + f" {'peak MB':>8} {'out MB':>7}"
+    print(header)
+    for result in results:
+        run = best_run(result)
+        line = f"{result['slides']:>7} {run['total_seconds']:>8.2f} "
+        line += f"{run['total_seconds'] * 1000 / result['slides']:>9.1f}"
+        line += ''.join(f" {run['phases'][phase]:>13.3f}" for phase in PHASES)
+        rss = result['peak_rss_mb']
+        line += f" {rss:>8.0f}" if rss is not None else f" {'-':>8}"
+        line += f" {result['output_bytes'] / (1024 * 1024):>7.1f}"
+        print(line)
+
+    print("\nPer-builder time (fastest run), ms per slide:")
+    for result in results:
+        builders = best_run(result)['builders']
+        parts = [f"{name} {entry['seconds'] * 1000 / entry['count']:.1f}"
+                 for name, entry in sorted(builders.items())]
+        print(f"{result['slides']:>7}: " + ', '.join(parts))
+
+    if len(results) > 1:
+        print_scaling(results)
+
+
+def print_scaling(results: List[Dict[str, Any]]) -> None:
+    """Print per-slide build cost of each size relative to the smallest one.
+
+    Image preparation is left out: it is dominated by the few distinct images
+    every deck shares, not by the slide count. A ratio near 1.0x means the
+    build grows linearly with the deck; quadratic work shows as ratios that
+    keep climbing with the size.
+    """
+    def per_slide_ms(result: Dict[str, Any]) -> float:
+        phases = best_run(result)['phases']
+        return (phases['build'] - phases.get('image_prepare', 0.0)) * 1000 / result['slides']
+
+    ordered = sorted(results, key=lambda result: result['slides'])
+    base = per_slide_ms(ordered[0])
+    print(f"\nScaling (build excluding image_prepare, relative to {ordered[0]['slides']} slides):")
+    for result in ordered:
+        ms = per_slide_ms(result)
+        ratio = ms / base if base > 0 else float('nan')
+        print(f"{result['slides']:>7}: {ms:6.2f} ms/slide  {ratio:5.2f}x")
+
+
+def print_comparison(baseline: Dict[str, Any], current: Dict[str, Any]) -> None:
+    """Print per-phase changes between two result files for the sizes both contain."""
+    old_by_size = {result['slides']: result for result in baseline['results']}
+    print(f"\nCompared with {baseline['meta'].get('commit') or 'baseline'} "
+          f"({baseline['meta'].get('timestamp', '?')}):")
+    for result in current['results']:
+        old = old_by_size.get(result['slides'])
+        if old is None:
+            continue
+        old_runs, new_runs = comparable_runs(old), comparable_runs(result)
+        for kind in ('cold', 'warm'):
+            if kind not in old_runs or kind not in new_runs:
+                continue
+            old_run, new_run = old_runs[kind], new_runs[kind]
+            changes = []
+            for phase in ['total'] + PHASES:
+                before = old_run['total_seconds'] if phase == 'total' else old_run['phases'].get(phase, 0.0)
+                after = new_run['total_seconds'] if phase == 'total' else new_run['phases'].get(phase, 0.0)
+                if before > 0:
+                    changes.append(f"{phase} {(after - before) / before * 100:+.0f}%")
+            if old.get('output_bytes'):
+                changes.append(f"output size {(result['output_bytes'] - old['output_bytes']) / old['output_bytes'] * 100:+.1f}%")
+            print(f"{result['slides']:>7} {kind}: " + ', '.join(changes))
+        if old.get('slides_sha1') and result.get('slides_sha1'):
+            same = old['slides_sha1'] == result['slides_sha1']
+            print(f"{result['slides']:>7} slide XML: {'identical' if same else 'differs'}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark generation on synthetic decks')
+    parser.add_argument('--sizes', default=','.join(str(s) for s in DEFAULT_SIZES),
+                        help='Comma-separated deck sizes in slides (default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=2,
+                        help='Runs per size; the first is cold (default: %(default)s)')
+    parser.add_argument('--config', default=str(DEFAULT_CONFIG),
+                        help='Main configuration file (default: app/config.yaml)')
+    parser.add_argument('--output', help='Results JSON path (default: benchmarks/results/<commit>-<time>.json)')
+    parser.add_argument('--compare', metavar='JSON', help='Earlier results file to compare against')
+    parser.add_argument('--set', action='append', default=[], metavar='KEY=VALUE',
+                        help='Override a configuration key for every run (repeatable)')
+    parser.add_argument('--single', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single is not None:
+        result = run_size(args.single, args.repeat, Path(args.config), parse_overrides(args.set))
+        Path(args.output).write_text(json.dumps(result), encoding='utf-8')
+        return 0
+
+    parse_overrides(args.set)
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    results = []
+    for size in sizes:
+        print(f"Benchmarking {size} slides...", flush=True)
+        results.append(run_size_subprocess(size, args.repeat, Path(args.config), args.set))
+
+    report = {'meta': environment_info(), 'overrides': parse_overrides(args.set), 'results': results}
+    if args.output:
+        output_path = Path(args.output)
+    else:
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        output_path = RESULTS_DIR / f"{report['meta']['commit'] or 'nocommit'}-{stamp}.json"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(report, indent=2), encoding='utf-8')
+
+    print()
+    print_summary(results)
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding='utf-8'))
+        print_comparison(baseline, report)
+    print(f"\nResults written to {output_path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Synthesize markdown decks of any length for benchmarking.
+
+Decks cycle through every slide kind the generator supports: title slides,
+plain content slides and the image-side, content-bg, title-bg and
+dual-image-text-bottom layouts. Images are taken from the repository's
+assets directory, so decks must be generated with the repository root as
+the working directory.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Slide kinds in the order they repeat through a deck
+SLIDE_KINDS = ['title', 'content', 'image-side', 'content-bg', 'title-bg', 'dual-image-text-bottom']
+
+# Background images are kept separate: they are much larger than the rest
+BACKGROUND_IMAGES = ['assets/title_slide_bg_image1.png', 'assets/title_slide_bg_image2.png']
+
+
+def list_images() -> List[str]:
+    """Return the repository's content images as paths relative to the repo root."""
+    return sorted(f"assets/{p.name}" for p in (REPO_ROOT / 'assets').glob('*.png')
+                  if f"assets/{p.name}" not in BACKGROUND_IMAGES)
+
+
+def _title_slide(i: int) -> str:
+    return f"""<!-- _class: title -->
+
+<!-- section: Section {i} -->
+# Benchmark Deck, Part {i}
+## Synthetic subtitle {i}
+
+### Generated for timing runs
+Author Name, Conference {2000 + i % 30}"""
+
+
+def _content_slide(i: int) -> str:
+    return f"""# Content Slide {i}
+
+## Overview
+Plain paragraph with **bold**, *italic* and `code` spans for slide {i}.
+
+- First bullet with a [link](https://example.com/{i})
+- Second bullet with **emphasis**
+- Third bullet
+
+1. First numbered item
+2. Second numbered item
+3. Third numbered item
+
+#### Detail heading
+##### Footnote-sized heading"""
+
+
+def _image_side_slide(i: int, image: str) -> str:
+    return f"""# Image Side {i}
+<!-- _layout: image-side -->
+<!-- _image_fit: contain -->
+
+- Point one about the figure
+- Point two about the figure
+- Point three about the figure
+
+<div class="image-container">
+  <img src="{image}"
+    alt="Figure {i}"
+    class="img-large">
+</div>"""
+
+
+def _content_bg_slide(i: int, background: str) -> str:
+    return f"""# Content on Background {i}
+<!-- _layout: content-bg -->
+<!-- _bg_image: {background} -->
+
+## Key message
+- Supporting point one
+- Supporting point two"""
+
+
+def _title_bg_slide(i: int, background: str) -> str:
+    return f"""# Title on Background {i}
+<!-- _layout: title-bg -->
+<!-- _bg_image: {background} -->
+
+A one-line subtitle for slide {i}"""
+
+
+def _dual_image_slide(i: int, first: str, second: str) -> str:
+    return f"""# Two Images {i}
+<!-- _layout: dual-image-text-bottom -->
+<!-- _image_fit: contain -->
+
+<div class="image-row">
+  <img src="{first}" alt="Left" data-caption="Left caption {i}">
+  <img src="{second}" alt="Right" data-caption="Right caption {i}">
+</div>
+
+Comparison of the two figures above"""
+
+
+def make_deck(num_slides: int, images: List[str] = None) -> str:
+    """Build a markdown deck with the given number of slides.
+
+    Args:
+        num_slides: Number of slides to generate
+        images: Image paths to cycle through (default: repository assets)
+
+    Returns:
+        Markdown text, including YAML frontmatter
+    """
+    images = images or list_images()
+    slides = []
+    for i in range(num_slides):
+        kind = SLIDE_KINDS[i % len(SLIDE_KINDS)]
+        image = images[i % len(images)]
+        background = BACKGROUND_IMAGES[i % len(BACKGROUND_IMAGES)]
+        if kind == 'title':
+            slides.append(_title_slide(i))
+        elif kind == 'content':
+            slides.append(_content_slide(i))
+        elif kind == 'image-side':
+            slides.append(_image_side_slide(i, image))
+        elif kind == 'content-bg':
+            slides.append(_content_bg_slide(i, background))
+        elif kind == 'title-bg':
+            slides.append(_title_bg_slide(i, background))
+        else:
+            slides.append(_dual_image_slide(i, image, images[(i + 1) % len(images)]))
+
+    frontmatter = f"---\ntitle: Synthetic benchmark deck ({num_slides} slides)\n---\n\n"
+    return frontmatter + '\n\n---\n\n'.join(slides) + '\n'
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Write a synthetic markdown deck')
+    parser.add_argument('slides', type=int, help='Number of slides')
+    parser.add_argument('-o', '--output', help='Output file (default: stdout)')
+    args = parser.parse_args()
+
+    deck = make_deck(args.slides)
+    if args.output:
+        Path(args.output).write_text(deck, encoding='utf-8')
+    else:
+        sys.stdout.write(deck)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
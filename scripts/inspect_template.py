@@ -1,11 +1,22 @@
 #!/usr/bin/env python3
-"""Inspect PPTX template structure: slide masters, layouts, placeholders."""
+"""Inspect PPTX template structure: slide masters, layouts, placeholders, part sizes.
+
+With --slim OUTPUT, also write a slimmed copy of the template (see
+iltci_pptx.template_slim; the CLI exposes the same as --slim-template).
+"""
 
 from pptx import Presentation
 from pptx.util import Inches, Emu
+from pathlib import Path
+import argparse
 import json
 import sys
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from iltci_pptx.config import Config
+from iltci_pptx.template_slim import part_sizes, slim_template, format_slim_report
+
 def emu_to_inches(emu):
     """Convert EMUs to inches for readability."""
     return round(emu / 914400, 2) if emu else 0
@@ -74,15 +85,35 @@ def inspect_template(template_path: str):
         
         result["slide_masters"].append(master_data)
     
+    # Size attribution: what each part contributes to the template
+    sizes = part_sizes(Path(template_path))
+    result["parts"] = {name: {"bytes": raw, "compressed_bytes": packed} for name, (raw, packed) in sizes.items()}
+    print(f"--- Parts by size ({sum(packed for _, packed in sizes.values()) / 1024:.1f} KB in the file) ---")
+    for name, (raw, packed) in sorted(sizes.items(), key=lambda item: -item[1][0]):
+        print(f"  {name:<48} {raw / 1024:9.1f} KB  ({packed / 1024:.1f} KB compressed)")
+    
     return result
 
 if __name__ == "__main__":
-    template_path = sys.argv[1] if len(sys.argv) > 1 else "templates/template-alt.pptx"
+    parser = argparse.ArgumentParser(description="Inspect a PPTX template, optionally writing a slimmed copy")
+    parser.add_argument("template", nargs="?", default="templates/template-alt.pptx")
+    parser.add_argument("--slim", metavar="OUTPUT", help="Write a slimmed copy of the template to OUTPUT")
+    parser.add_argument("--config", default="app/config.yaml",
+                        help="Config selecting the layouts to keep and the slimming settings")
+    args = parser.parse_args()
+    template_path = args.template
     
     result = inspect_template(template_path)
     
+    if args.slim:
+        report = slim_template(Path(template_path), Path(args.slim), Config(args.config))
+        print(f"\n=== Slimmed copy: {args.slim} ===")
+        print(format_slim_report(report))
+        result["slim"] = report
+    
     # Write JSON output for easier processing
     output_path = "plans/template-inspection.json"
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
     with open(output_path, "w") as f:
         json.dump(result, f, indent=2)
     print(f"\nJSON output written to: {output_path}")
@@ -0,0 +1,229 @@
+"""Content-addressed on-disk store for generated decks.
+
+Servers (such as the Streamlit app) keep generated decks here instead of in
+per-session memory and hand out the content hash as a handle. Identical
+decks share one file. The store is bounded by total size, evicting the
+least recently used artifacts first, and artifacts not used for the
+configured TTL expire.
+
+An artifact's file mtime records its last use (stored or opened), so the
+store needs no separate index and several processes can share a directory.
+Callers may also supply their own SHA1 key instead of the content hash; the
+result cache keys decks by the fingerprint of their inputs this way.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+from .config import Config
+
+# Handles are SHA1 hex digests; anything else is rejected before touching the disk
+_HANDLE_PATTERN = re.compile(r'^[0-9a-f]{40}$')
+
+
+class ArtifactStore:
+    """Size-bounded, TTL-expiring store of files keyed by SHA1 (the content hash by default)."""
+
+    def __init__(self, root: Path, max_bytes: int, ttl_seconds: Optional[float] = None,
+                 suffix: str = '.pptx'):
+        """Initialize the store.
+
+        Args:
+            root: Directory holding the artifacts (created on first write)
+            max_bytes: Total size above which least recently used artifacts are evicted
+            ttl_seconds: Artifacts unused for longer than this expire (None: never)
+            suffix: File extension of stored artifacts
+        """
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.suffix = suffix
+        self._lock = threading.Lock()
+
+    def _path(self, handle: str) -> Path:
+        if not _HANDLE_PATTERN.match(handle):
+            raise ValueError(f"Invalid artifact handle: {handle!r}")
+        return self.root / f"{handle}{self.suffix}"
+
+    def put(self, data: bytes, handle: Optional[str] = None) -> str:
+        """Store bytes, or refresh the existing copy stored under the same handle.
+
+        Args:
+            data: Artifact contents
+            handle: SHA1 hex key to store under (default: hash of the contents)
+
+        Returns:
+            Handle of the artifact
+        """
+        handle = handle or hashlib.sha1(data).hexdigest()
+        self._store(handle, lambda f: f.write(data))
+        return handle
+
+    def put_file(self, source: Path, handle: str) -> str:
+        """Store a copy of a file under a caller-supplied handle (see put).
+
+        Args:
+            source: File to copy into the store
+            handle: SHA1 hex key to store under
+
+        Returns:
+            Handle of the artifact
+        """
+        def copy(f):
+            with open(source, 'rb') as src:
+                shutil.copyfileobj(src, f)
+        self._store(handle, copy)
+        return handle
+
+    def _store(self, handle: str, write) -> None:
+        """Create the artifact for a handle with write(file), unless it exists."""
+        path = self._path(handle)
+        with self._lock:
+            try:
+                os.utime(path)
+                logging.debug(f"Artifact {handle[:12]} already stored, shared")
+            except FileNotFoundError:
+                self.root.mkdir(parents=True, exist_ok=True)
+                # Write to a temp file first so readers never see partial artifacts
+                fd, tmp_name = tempfile.mkstemp(dir=self.root, suffix='.tmp')
+                try:
+                    with os.fdopen(fd, 'wb') as f:
+                        write(f)
+                    os.replace(tmp_name, path)
+                except BaseException:
+                    Path(tmp_name).unlink(missing_ok=True)
+                    raise
+        # The caller is about to hand out this artifact, even if it alone exceeds the cap
+        self.evict(keep=path)
+
+    def path(self, handle: str) -> Optional[Path]:
+        """Return the file of a live artifact and mark it as used.
+
+        Args:
+            handle: Handle returned by put()
+
+        Returns:
+            Path to the artifact, or None if it was evicted or expired
+        """
+        path = self._path(handle)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        if self._expired(stat.st_mtime, time.time()):
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def read(self, handle: str) -> Optional[bytes]:
+        """Return an artifact's bytes, or None if it is gone (see path())."""
+        path = self.path(handle)
+        if path is None:
+            return None
+        try:
+            return path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def _expired(self, mtime: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - mtime > self.ttl_seconds
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        """(mtime, size, path) of every stored artifact."""
+        entries = []
+        if not self.root.exists():
+            return entries
+        for path in self.root.glob(f"*{self.suffix}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def evict(self, keep: Optional[Path] = None) -> int:
+        """Delete expired artifacts, then the least recently used ones over the size cap.
+
+        Args:
+            keep: Artifact never deleted by this call (the one just stored)
+
+        Returns:
+            Number of artifacts deleted
+        """
+        now = time.time()
+        removed = 0
+        with self._lock:
+            live = []
+            for mtime, size, path in self._entries():
+                if path == keep:
+                    continue
+                if self._expired(mtime, now):
+                    path.unlink(missing_ok=True)
+                    removed += 1
+                else:
+                    live.append((mtime, size, path))
+
+            total = sum(size for _, size, _ in live)
+            # The kept artifact counts towards the cap, so the others make room for it
+            if keep is not None:
+                try:
+                    total += keep.stat().st_size
+                except FileNotFoundError:
+                    pass
+            for mtime, size, path in sorted(live, key=lambda entry: entry[0]):
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                removed += 1
+        if removed:
+            logging.info(f"Artifact store: evicted {removed} artifact(s) from {self.root}")
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Count and total size of stored artifacts."""
+        entries = self._entries()
+        return {'count': len(entries), 'bytes': sum(size for _, size, _ in entries)}
+
+
+# Stores keyed by resolved directory
+_stores: Dict[str, ArtifactStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_artifact_store(config: Config) -> ArtifactStore:
+    """Return the shared artifact store configured under artifacts.
+
+    Args:
+        config: Configuration object (artifacts.dir, artifacts.max_mb, artifacts.ttl_hours)
+
+    Returns:
+        Shared ArtifactStore instance
+    """
+    root = Path(config.get('artifacts.dir', '.cache/artifacts'))
+    if not root.is_absolute():
+        root = config.project_root / root
+    max_bytes = int(config.get('artifacts.max_mb', 512) * 1024 * 1024)
+    ttl_hours = config.get('artifacts.ttl_hours', 24)
+    ttl_seconds = ttl_hours * 3600 if ttl_hours else None
+
+    key = str(root.resolve())
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = ArtifactStore(root, max_bytes, ttl_seconds)
+        else:
+            # Limits may change when the configuration is reloaded
+            store.max_bytes, store.ttl_seconds = max_bytes, ttl_seconds
+    return store
@@ -0,0 +1,155 @@
+"""Batch generation of many markdown decks in one process."""
+
+import copy
+import glob
+import logging
+import os
+import time
+import yaml
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+from .config import Config
+from .generator import PresentationGenerator
+from .template_cache import get_snapshot
+
+
+def collect_batch_inputs(spec: str, output_dir: Path, project_root: Path) -> List[Tuple[Path, Path]]:
+    """Resolve a batch spec into (content, output) path pairs.
+
+    The spec may be:
+    - a directory: every ``*.md`` file in it (non-recursive)
+    - a glob pattern: e.g. ``content/**/*.md``
+    - a YAML manifest: a list whose entries are either a markdown path or a
+      mapping with ``content`` and optional ``output`` keys
+
+    Relative paths are resolved against project_root. Outputs default to
+    ``<output_dir>/<markdown stem>.pptx``.
+
+    Args:
+        spec: Directory, glob pattern or manifest path
+        output_dir: Directory for outputs without an explicit path
+        project_root: Base directory for relative paths
+
+    Returns:
+        List of (content_path, output_path) tuples, in a stable order
+    """
+    def resolve(value: str) -> Path:
+        p = Path(value)
+        return p if p.is_absolute() else project_root / p
+
+    def default_output(content: Path) -> Path:
+        return output_dir / f"{content.stem}.pptx"
+
+    spec_path = resolve(spec)
+    pairs = []
+
+    if spec_path.is_dir():
+        for content in sorted(spec_path.glob('*.md')):
+            pairs.append((content, default_output(content)))
+    elif spec_path.suffix in ('.yaml', '.yml') and spec_path.exists():
+        with open(spec_path, 'r', encoding='utf-8') as f:
+            entries = yaml.safe_load(f) or []
+        for entry in entries:
+            if isinstance(entry, dict):
+                content = resolve(entry['content'])
+                output = resolve(entry['output']) if entry.get('output') else default_output(content)
+            else:
+                content = resolve(str(entry))
+                output = default_output(content)
+            pairs.append((content, output))
+    elif glob.has_magic(spec):
+        pattern = spec if Path(spec).is_absolute() else str(project_root / spec)
+        for match in sorted(glob.glob(pattern, recursive=True)):
+            content = Path(match)
+            pairs.append((content, default_output(content)))
+    else:
+        raise FileNotFoundError(f"Batch input not found: {spec}")
+
+    # Two inputs with the same stem would silently overwrite each other
+    seen = {}
+    for content, output in pairs:
+        if output in seen:
+            raise ValueError(f"Batch inputs {seen[output]} and {content} both write to {output}")
+        seen[output] = content
+
+    return pairs
+
+
+# Per-worker state, set once by _init_worker
+_worker_config: Optional[Config] = None
+
+
+def _init_worker(config: Config) -> None:
+    """Install a private copy of the Config in a worker and warm its template cache."""
+    global _worker_config
+    # _generate_one sets each deck's paths; the caller's Config must not follow
+    _worker_config = copy.deepcopy(config)
+    _worker_config._setup_logging()
+    try:
+        get_snapshot(config.template_path)
+    except OSError as e:
+        logging.warning(f"Could not pre-load template {config.template_path}: {e}")
+
+
+def _generate_one(content_path: Path, output_path: Path) -> Dict[str, Any]:
+    """Generate one deck with the worker's Config.
+
+    Returns:
+        Result dictionary with content, output, seconds, bytes and error keys
+    """
+    config = _worker_config
+    config.set('paths.content', str(content_path))
+    config.set('paths.output', str(output_path))
+
+    start = time.perf_counter()
+    error = None
+    try:
+        PresentationGenerator(config).generate()
+    except Exception as e:
+        logging.exception(f"Error generating {content_path}")
+        error = str(e)
+    elapsed = time.perf_counter() - start
+
+    size = output_path.stat().st_size if error is None and output_path.exists() else 0
+    return {
+        'content': content_path,
+        'output': output_path,
+        'seconds': elapsed,
+        'bytes': size,
+        'error': error,
+    }
+
+
+def run_batch(config: Config, pairs: List[Tuple[Path, Path]], jobs: int = 1) -> List[Dict[str, Any]]:
+    """Generate every deck, in-process for one job or over a process pool.
+
+    Each worker receives a copy of the already-loaded Config once and keeps
+    its parsed template and derived builder styles cached between decks;
+    config itself is left unchanged.
+
+    Args:
+        config: Loaded configuration shared by all decks
+        pairs: (content_path, output_path) tuples from collect_batch_inputs
+        jobs: Number of worker processes
+
+    Returns:
+        Result dictionaries in input order
+    """
+    global _worker_config
+    if jobs <= 1 or len(pairs) <= 1:
+        _init_worker(config)
+        try:
+            return [_generate_one(content, output) for content, output in pairs]
+        finally:
+            _worker_config = None
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                             initargs=(config,)) as pool:
+        futures = [pool.submit(_generate_one, content, output) for content, output in pairs]
+        return [future.result() for future in futures]
+
+
+def default_jobs() -> int:
+    """Number of worker processes to use when none is given."""
+    return os.cpu_count() or 1
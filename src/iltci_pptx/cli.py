@@ -1,11 +1,18 @@
 """Command-line interface for ILTCI presentation generator."""
 
 import argparse
+import importlib.util
 import sys
+import time
 import logging
 from pathlib import Path
+from typing import Callable
 from .config import Config
 from .generator import PresentationGenerator
+from .timing import GenerationReport
+from .template_slim import slim_template, format_slim_report
+from .batch import collect_batch_inputs, run_batch, default_jobs
+from .watch import watch
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -25,7 +32,7 @@ def parse_arguments() -> argparse.Namespace:
         help='Path to config YAML (default: app/config.yaml)'
     )
     
-    # Path overrides (note: not implemented yet, would require CLI override logic in Config)
+    # Path overrides
     parser.add_argument(
         '--template',
         help='Path to PowerPoint template file (overrides config)'
@@ -41,9 +48,261 @@ def parse_arguments() -> argparse.Namespace:
         help='Path to output PowerPoint file (overrides config)'
     )
     
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Only rebuild slides whose markdown changed since the last build of the output'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always rebuild, bypassing the whole-deck result cache'
+    )
+    
+    parser.add_argument(
+        '--deterministic',
+        action='store_true',
+        help='Write byte-reproducible output (fixed timestamps and part order)'
+    )
+    
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Parse, build and write one slide at a time to keep memory flat for very large decks'
+    )
+    
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='Keep running and regenerate whenever the content, config, template or images change'
+    )
+    
+    parser.add_argument(
+        '--watch-interval',
+        type=float,
+        default=0.25,
+        help='Polling interval in seconds for --watch (default: 0.25)'
+    )
+    
+    parser.add_argument(
+        '--profile',
+        metavar='PATH',
+        help='Profile the generation and print its timing report: writes cProfile stats to PATH, '
+             'or a pyinstrument HTML report if PATH ends in .html (requires pyinstrument)'
+    )
+    
+    parser.add_argument(
+        '--slim-template',
+        metavar='OUTPUT',
+        help='Write a slimmed copy of the template to OUTPUT (unused layouts, sample slides, '
+             'thumbnail and oversized images removed), print per-part sizes, and exit'
+    )
+    
+    # Batch mode
+    parser.add_argument(
+        '--batch',
+        metavar='SPEC',
+        help='Generate many decks: a directory of .md files, a glob pattern, '
+             'or a YAML manifest listing markdown files'
+    )
+    
+    parser.add_argument(
+        '--output-dir',
+        help='Output directory for batch decks (default: directory of the configured output)'
+    )
+    
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=None,
+        help='Number of worker processes for batch mode (default: CPU count)'
+    )
+    
     return parser.parse_args()
 
 
+def apply_overrides(config: Config, args: argparse.Namespace) -> None:
+    """Apply command-line overrides to a loaded configuration.
+    
+    Args:
+        config: Configuration object to modify
+        args: Parsed command-line arguments
+    """
+    if args.template:
+        config.set('paths.template', args.template)
+    if args.content:
+        config.set('paths.content', args.content)
+    if args.output:
+        config.set('paths.output', args.output)
+    if args.incremental:
+        config.set('incremental.enabled', True)
+    if args.no_cache or args.profile:
+        # A profile of a cache hit would only time a file copy
+        config.set('result_cache.enabled', False)
+    if args.deterministic:
+        config.set('package.deterministic', True)
+    if args.stream:
+        config.set('package.streaming', True)
+
+
+def run_watch_mode(args: argparse.Namespace) -> int:
+    """Regenerate the presentation on every change to its inputs.
+    
+    Args:
+        args: Parsed command-line arguments
+        
+    Returns:
+        Exit code
+    """
+    def load_config() -> Config:
+        config = Config(args.config)
+        apply_overrides(config, args)
+        return config
+    
+    try:
+        config = load_config()
+    except FileNotFoundError as e:
+        print(f"Error: {e}")
+        return 1
+    
+    print("=" * 60)
+    print("ILTCI Presentation Generator (watch)")
+    print("=" * 60)
+    print(f"Configuration: {args.config}")
+    print(f"Content:       {config.content_path}")
+    print(f"Output:        {config.output_path}")
+    print("=" * 60)
+    return watch(load_config, interval=args.watch_interval)
+
+
+def run_batch_mode(args: argparse.Namespace, config: Config) -> int:
+    """Generate every deck matched by --batch and print timings.
+    
+    Args:
+        args: Parsed command-line arguments
+        config: Loaded configuration
+        
+    Returns:
+        Exit code (0 if every deck succeeded, 1 otherwise)
+    """
+    output_dir = Path(args.output_dir) if args.output_dir else config.output_path.parent
+    if not output_dir.is_absolute():
+        output_dir = config.project_root / output_dir
+    
+    try:
+        pairs = collect_batch_inputs(args.batch, output_dir, config.project_root)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Error: {e}")
+        return 1
+    
+    if not pairs:
+        print(f"Error: No markdown files matched: {args.batch}")
+        return 1
+    
+    jobs = args.jobs or default_jobs()
+    jobs = max(1, min(jobs, len(pairs)))
+    
+    print("=" * 60)
+    print("ILTCI Presentation Generator (batch)")
+    print("=" * 60)
+    print(f"Configuration: {args.config}")
+    print(f"Template:      {config.template_path}")
+    print(f"Inputs:        {len(pairs)} deck(s) from {args.batch}")
+    print(f"Output dir:    {output_dir}")
+    print(f"Workers:       {jobs}")
+    print("=" * 60)
+    
+    start = time.perf_counter()
+    results = run_batch(config, pairs, jobs=jobs)
+    wall = time.perf_counter() - start
+    
+    failed = 0
+    total_bytes = 0
+    for result in results:
+        name = result['content'].name
+        if result['error']:
+            failed += 1
+            print(f"  FAIL  {name:<32} {result['seconds']:7.2f}s  {result['error']}")
+        else:
+            total_bytes += result['bytes']
+            print(f"  ok    {name:<32} {result['seconds']:7.2f}s  -> {result['output']}")
+    
+    succeeded = len(results) - failed
+    deck_seconds = sum(r['seconds'] for r in results)
+    print("\n" + "=" * 60)
+    print(f"Decks:      {succeeded} succeeded, {failed} failed")
+    print(f"Wall time:  {wall:.2f}s (sum of per-deck time {deck_seconds:.2f}s)")
+    print(f"Throughput: {len(results) / wall:.2f} decks/s, {total_bytes / wall / 1e6:.1f} MB/s written")
+    print("=" * 60)
+    return 1 if failed else 0
+
+
+def run_slim_mode(args: argparse.Namespace, config: Config) -> int:
+    """Write a slimmed copy of the configured template and print its size report.
+    
+    Args:
+        args: Parsed command-line arguments
+        config: Loaded configuration
+        
+    Returns:
+        Exit code
+    """
+    if not config.template_path.exists():
+        print(f"Error: Template not found: {config.template_path}")
+        return 1
+    
+    print("=" * 60)
+    print("ILTCI Presentation Generator (slim template)")
+    print("=" * 60)
+    print(f"Template:      {config.template_path}")
+    print(f"Output:        {args.slim_template}")
+    print("=" * 60)
+    
+    try:
+        report = slim_template(config.template_path, Path(args.slim_template), config)
+    except Exception as e:
+        logging.exception("Error slimming template")
+        print(f"\nError slimming template: {e}")
+        return 1
+    print(format_slim_report(report))
+    return 0
+
+
+def run_profiled(generate: Callable[[], GenerationReport], profile_path: Path) -> GenerationReport:
+    """Run a generation under a profiler and write the profile.
+    
+    Args:
+        generate: Runs the generation and returns its report
+        profile_path: Output file; .html selects pyinstrument, anything else cProfile
+        
+    Returns:
+        The generation's timing report
+        
+    Raises:
+        RuntimeError: If a pyinstrument report is requested but pyinstrument is not installed
+    """
+    profile_path.parent.mkdir(parents=True, exist_ok=True)
+    if profile_path.suffix.lower() == '.html':
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            raise RuntimeError("pyinstrument is not installed; use a .prof path for cProfile output")
+        profiler = Profiler()
+        profiler.start()
+        try:
+            report = generate()
+        finally:
+            profiler.stop()
+        profile_path.write_text(profiler.output_html(), encoding='utf-8')
+    else:
+        import cProfile
+        profiler = cProfile.Profile()
+        report = profiler.runcall(generate)
+        profiler.dump_stats(str(profile_path))
+    return report
+
+
 def main() -> int:
     """Main entry point for the CLI.
     
@@ -53,6 +312,9 @@ def main() -> int:
     # Parse command-line arguments
     args = parse_arguments()
     
+    if args.watch:
+        return run_watch_mode(args)
+    
     # Load configuration
     try:
         config = Config(args.config)
@@ -64,14 +326,17 @@ def main() -> int:
         print(f"Error loading configuration: {e}")
         return 1
     
-    # Apply CLI overrides if provided
-    # Note: This is a simple implementation; a more robust version would modify Config
-    if args.template:
-        config._config['paths']['template'] = args.template
-    if args.content:
-        config._config['paths']['content'] = args.content
-    if args.output:
-        config._config['paths']['output'] = args.output
+    apply_overrides(config, args)
+    
+    if args.batch:
+        return run_batch_mode(args, config)
+    
+    if args.slim_template:
+        return run_slim_mode(args, config)
+    
+    if args.profile and Path(args.profile).suffix.lower() == '.html' and not importlib.util.find_spec('pyinstrument'):
+        print("Error: pyinstrument is not installed; use a .prof path for cProfile output")
+        return 1
     
     # Print banner and configuration
     print("=" * 60)
@@ -86,7 +351,10 @@ def main() -> int:
     # Generate presentation
     try:
         generator = PresentationGenerator(config)
-        generator.generate()
+        if args.profile:
+            report = run_profiled(generator.generate, Path(args.profile))
+        else:
+            report = generator.generate()
     except FileNotFoundError as e:
         print(f"\nError: {e}")
         return 1
@@ -95,6 +363,13 @@ def main() -> int:
         print(f"\nError generating presentation: {e}")
         return 1
     
+    if report.cached:
+        print("\nInputs unchanged: copied the deck from the result cache (--no-cache to rebuild)")
+    
+    if args.profile:
+        print("\n" + report.format_summary())
+        print(f"\nProfile written to {args.profile}")
+    
     print("\n" + "=" * 60)
     print("Done!")
     print("=" * 60)
@@ -1,9 +1,11 @@
 """Configuration management for ILTCI presentation generator."""
 
+import copy
 import yaml
 import logging
 from pathlib import Path
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Callable, Mapping, Optional
 
 
 def load_yaml_file(file_path: Path) -> Dict[str, Any]:
@@ -26,8 +28,46 @@ def merge_dicts(base: Dict[str, Any], overlay: Dict[str, Any]) -> Dict[str, Any]
     return result
 
 
+def flatten_dict(data: Dict[str, Any], prefix: str = '') -> Dict[str, Any]:
+    """Map every dot-separated key path of a nested dictionary to its value.
+    
+    Intermediate dictionaries are included, so 'fonts' and 'fonts.title_slide'
+    resolve as well as leaf keys. Keys that are not strings or contain a dot
+    cannot be addressed with dot notation and are skipped.
+    
+    Args:
+        data: Nested dictionary
+        prefix: Key path of `data` itself ('' for the root)
+        
+    Returns:
+        Flat dictionary of key path to value
+    """
+    flat = {}
+    for key, value in data.items():
+        if not isinstance(key, str) or '.' in key:
+            continue
+        path = f"{prefix}.{key}" if prefix else key
+        flat[path] = value
+        if isinstance(value, dict):
+            flat.update(flatten_dict(value, path))
+    return flat
+
+
 class Config:
-    """Configuration manager that loads and merges main and template configs."""
+    """Configuration manager that loads and merges main and template configs.
+    
+    Lookups go through a flattened, read-only view of the merged
+    configuration, built on first use. Sections and lists are returned as
+    copies, so editing a looked-up value cannot make the view stale. Values
+    derived from the configuration (see derived) are cached alongside it.
+    Both are dropped by set() and invalidate() (setting a path keeps the
+    derived values), so changes must go through those rather than editing
+    _config in place.
+    """
+    
+    # Caches; class-level None so from_dict() instances start empty too
+    _flat: Optional[Mapping[str, Any]] = None
+    _derived: Optional[Dict[Callable, Any]] = None
     
     def __init__(self, config_path: str = 'config.yaml'):
         """Initialize configuration by loading main config and template config.
@@ -157,18 +197,74 @@ class Config:
             default: Default value if key not found
             
         Returns:
-            Configuration value or default
+            Configuration value or default; a copy for sections and lists
+        """
+        flat = self._flat
+        if flat is None:
+            flat = self._flat = MappingProxyType(flatten_dict(self._config))
+        value = flat.get(key_path, default)
+        if isinstance(value, (dict, list)) and key_path in flat:
+            # Changes must go through set(); editing the live value would bypass invalidate()
+            return copy.deepcopy(value)
+        return value
+    
+    def set(self, key_path: str, value: Any) -> None:
+        """Set a configuration value using dot notation, creating sections as needed.
+        
+        Args:
+            key_path: Dot-separated path to config value (e.g., 'paths.output')
+            value: New value
         """
         keys = key_path.split('.')
-        value = self._config
+        node = self._config
+        for key in keys[:-1]:
+            if not isinstance(node.get(key), dict):
+                node[key] = {}
+            node = node[key]
+        node[keys[-1]] = value
+        
+        if keys[0] == 'paths':
+            # No derived value reads paths, so switching decks (batch, watch, the
+            # app) keeps the builder styles and only rebuilds the lookup view
+            self._paths = self._config['paths']
+            self._flat = None
+        else:
+            self.invalidate()
+    
+    def invalidate(self) -> None:
+        """Drop cached lookups and derived values after the configuration changed."""
+        self._flat = None
+        self._derived = None
+    
+    def derived(self, factory: Callable[['Config'], Any]) -> Any:
+        """Return factory(self), computed once until the configuration changes.
         
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
-                return default
+        Builders use this to turn many lookups into one precomputed settings
+        dictionary. The result is shared and must be treated as read-only.
+        Factories must not read paths.*, which set() changes without
+        dropping derived values.
         
-        return value
+        Args:
+            factory: Function computing a value from this configuration
+            
+        Returns:
+            The cached value
+        """
+        derived = self._derived
+        if derived is None:
+            derived = self._derived = {}
+        try:
+            return derived[factory]
+        except KeyError:
+            value = derived[factory] = factory(self)
+            return value
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle without caches (sent to batch worker processes)."""
+        state = self.__dict__.copy()
+        state.pop('_flat', None)
+        state.pop('_derived', None)
+        return state
     
     def get_path(self, key: str) -> Path:
         """Get a path from configuration, resolved relative to project_root.
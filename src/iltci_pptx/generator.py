@@ -1,79 +1,432 @@
 """Main presentation generation orchestration."""
 
+import hashlib
+import io
 import logging
+import os
+import shutil
+import time
 from pathlib import Path
-from pptx import Presentation
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, BinaryIO, Callable, Iterable, Iterator, Optional, TextIO, Union
 from .config import Config
-from .markdown_parser import parse_markdown_slides
+from .markdown_parser import iter_markdown_file, parse_markdown_slides, parse_markdown_text
 from .slide_builders import build_title_slide, build_content_slide, build_layout_slide
+from .template_cache import get_snapshot, get_snapshot_for_bytes, template_digest
+from .image_index import save_image_indexes
+from .incremental import IncrementalBuild
+from .package_writer import StreamingPackageWriter, save_presentation
+from .result_cache import get_result_cache, deck_fingerprint
+from .timing import GenerationReport, recording
+
+# Markdown accepted by the in-memory API: text, or a text or binary file-like object
+MarkdownSource = Union[str, TextIO, BinaryIO]
+
+# Template accepted by the in-memory API: .pptx bytes or a binary file-like object
+TemplateSource = Union[bytes, BinaryIO]
+
+# Receives progress event dictionaries (see PresentationGenerator)
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
+
+class GenerationCancelled(Exception):
+    """Raised by a progress callback to stop a generation before it saves."""
+
+
+def _read_markdown(markdown: MarkdownSource) -> str:
+    """Return markdown text from a string or file-like object (bytes decoded as UTF-8)."""
+    if hasattr(markdown, 'read'):
+        markdown = markdown.read()
+    if isinstance(markdown, bytes):
+        markdown = markdown.decode('utf-8')
+    return markdown
+
+
+def _read_template(template: TemplateSource) -> bytes:
+    """Return template bytes from bytes or a binary file-like object."""
+    if hasattr(template, 'read'):
+        template = template.read()
+    return bytes(template)
+
+
+def _timed_iter(report: GenerationReport, phase: str, iterable: Iterable) -> Iterator:
+    """Yield the items of a lazy iterable, timing each step into a report phase."""
+    iterator = iter(iterable)
+    end = object()
+    while True:
+        with report.phase(phase):
+            item = next(iterator, end)
+        if item is end:
+            return
+        yield item
+
+
+class _CountingIter:
+    """Iterator over a lazy iterable that counts the items taken."""
+    
+    def __init__(self, iterable: Iterable):
+        self._iterator = iter(iterable)
+        self.count = 0
+    
+    def __iter__(self) -> '_CountingIter':
+        return self
+    
+    def __next__(self) -> Any:
+        item = next(self._iterator)
+        self.count += 1
+        return item
 
 
 class PresentationGenerator:
-    """Orchestrates the creation of PowerPoint presentations from markdown."""
+    """Orchestrates the creation of PowerPoint presentations from markdown.
+    
+    When result_cache.enabled is set, a deck whose inputs are unchanged is
+    copied from the result cache instead of being built (report.cached).
+    With package.streaming, generate() parses, builds and writes one slide
+    at a time so memory stays flat for very large decks.
+    
+    An optional progress callback receives an event dictionary when each
+    phase starts and after every slide:
     
-    def __init__(self, config: Config):
+        phase:  'parse', 'template_load', 'build', 'save' or 'done'
+        slide:  1-based number of the slide just built (build events)
+        total:  Number of slides in the deck (0 until parsing finished,
+                and until 'done' when streaming)
+        title:  Title of the slide just built (build events)
+        phases: Seconds spent so far in each completed phase (see timing)
+    
+    The callback runs on the generating thread. Raising GenerationCancelled
+    from it stops the generation before anything is written, except from
+    'done', which is emitted once the deck has been saved.
+    """
+    
+    def __init__(self, config: Config, progress: Optional[ProgressCallback] = None):
         """Initialize the generator with configuration.
         
         Args:
             config: Configuration object
+            progress: Optional callback receiving progress events
         """
         self.config = config
+        self.progress = progress
     
-    def generate(self, template_override: Optional[Path] = None) -> None:
+    def generate(self, template_override: Optional[Path] = None) -> GenerationReport:
         """Generate the PowerPoint presentation from markdown content.
         
         Args:
             template_override: Optional path to override the template from config
+            
+        Returns:
+            GenerationReport with the time spent in each phase and on each slide
+        """
+        report = GenerationReport()
+        start = time.perf_counter()
+        with recording(report):
+            if self.config.get('package.streaming', False):
+                slide_count = self._generate_streaming(report, template_override)
+            else:
+                slide_count = self._generate(report, template_override)
+        report.total_seconds = time.perf_counter() - start
+        self._emit(report, 'done', total=slide_count)
+        return report
+    
+    def generate_to_stream(self, markdown: MarkdownSource, output: BinaryIO,
+                           template: Optional[TemplateSource] = None) -> GenerationReport:
+        """Generate a presentation from in-memory markdown into a writable stream.
+        
+        Nothing is read from paths.content or written to paths.output.
+        Incremental regeneration does not apply, since there is no previous
+        output to reuse slides from, and neither does package.streaming.
+        
+        Args:
+            markdown: Markdown text, or a text or binary file-like object
+            output: Binary stream the .pptx is written to (e.g. io.BytesIO)
+            template: Template as .pptx bytes or a binary file-like object;
+                defaults to the frontmatter template, then paths.template
+        
+        Returns:
+            GenerationReport with the time spent in each phase and on each slide
+        """
+        report = GenerationReport()
+        start = time.perf_counter()
+        with recording(report):
+            self._emit(report, 'parse')
+            with report.phase('parse'):
+                frontmatter, parsed_slides = parse_markdown_text(_read_markdown(markdown), self.config)
+            
+            template_blob = template_path = None
+            if template is not None:
+                template_blob = _read_template(template)
+                template_sha1 = hashlib.sha1(template_blob).hexdigest()
+            else:
+                template_path = self._template_path(frontmatter, None)
+                template_sha1 = template_digest(template_path)
+            
+            result_cache, key, cached = self._lookup_result(report, frontmatter, parsed_slides, template_sha1)
+            if cached is not None:
+                with report.phase('save'), open(cached, 'rb') as f:
+                    shutil.copyfileobj(f, output)
+            else:
+                self._emit(report, 'template_load', total=len(parsed_slides))
+                with report.phase('template_load'):
+                    if template_blob is not None:
+                        snapshot = get_snapshot_for_bytes(template_blob)
+                    else:
+                        snapshot = get_snapshot(template_path)
+                    prs, all_layouts, layout_map = snapshot.clone()
+                self._log_template(all_layouts, snapshot)
+                
+                self._build_slides(prs, parsed_slides, all_layouts, layout_map, report, None)
+                
+                self._emit(report, 'save', total=len(parsed_slides))
+                with report.phase('save'):
+                    if result_cache:
+                        buffer = io.BytesIO()
+                        save_presentation(prs, buffer, self.config)
+                        output.write(buffer.getvalue())
+                        result_cache.add(key, buffer.getvalue())
+                    else:
+                        save_presentation(prs, output, self.config)
+            save_image_indexes()
+        report.total_seconds = time.perf_counter() - start
+        self._emit(report, 'done', total=len(parsed_slides))
+        return report
+    
+    def generate_bytes(self, markdown: MarkdownSource,
+                       template: Optional[TemplateSource] = None) -> bytes:
+        """Generate a presentation from in-memory markdown and return the .pptx bytes.
+        
+        Args:
+            markdown: Markdown text, or a text or binary file-like object
+            template: Template as .pptx bytes or a binary file-like object (optional)
+        
+        Returns:
+            The generated .pptx file contents
+        """
+        stream = io.BytesIO()
+        self.generate_to_stream(markdown, stream, template)
+        return stream.getvalue()
+    
+    def _template_path(self, frontmatter: Dict[str, Any], template_override: Optional[Path]) -> Path:
+        """Determine the template path: override > frontmatter > config."""
+        if template_override:
+            return template_override
+        if 'template' in frontmatter:
+            # Resolve template path from frontmatter relative to project root
+            return self.config.project_root / frontmatter['template']
+        return self.config.template_path
+    
+    def _lookup_result(self, report: GenerationReport, frontmatter: Dict[str, Any],
+                       parsed_slides: Iterable[Dict[str, Any]], template_sha1: str):
+        """Fingerprint the deck and look it up in the result cache.
+        
+        Returns:
+            Tuple of (result cache or None, fingerprint, cached .pptx path or None)
+        """
+        result_cache = get_result_cache(self.config)
+        if result_cache is None:
+            return None, None, None
+        with report.phase('result_cache'):
+            key = deck_fingerprint(self.config, frontmatter, parsed_slides, template_sha1)
+            cached = result_cache.lookup(key)
+        report.cached = cached is not None
+        return result_cache, key, cached
+    
+    def _emit(self, report: GenerationReport, phase: str, **fields: Any) -> None:
+        """Send a progress event to the callback, if there is one."""
+        if self.progress is None:
+            return
+        event = {'phase': phase, 'slide': 0, 'total': 0, 'title': '', 'phases': dict(report.phases)}
+        event.update(fields)
+        self.progress(event)
+    
+    @staticmethod
+    def _log_template(all_layouts: List, snapshot) -> None:
+        """Log what the loaded template contains."""
+        logging.info(f"Template has {snapshot.master_count} slide master(s)")
+        logging.info(f"Template has {len(all_layouts)} total layout(s) across all masters:")
+        for i, layout in enumerate(all_layouts):
+            logging.debug(f"  Layout {i}: {layout.name}")
+        logging.info(f"Template has {snapshot.original_slide_count} existing slides (removed in cached copy, "
+                     f"{snapshot.pruned_parts} part(s) / {snapshot.dead_bytes / 1024:.1f} KB of slide-only "
+                     f"content left out of the output)")
+    
+    def _generate(self, report: GenerationReport, template_override: Optional[Path]) -> int:
+        """Run one generation, recording timings into report.
+        
+        Returns:
+            Number of slides in the deck
         """
         # Validate paths exist
         self.config.validate_paths()
         
         # Parse markdown content first to get frontmatter
         content_path = self.config.content_path
-        frontmatter, parsed_slides = parse_markdown_slides(content_path, self.config)
+        self._emit(report, 'parse')
+        with report.phase('parse'):
+            frontmatter, parsed_slides = parse_markdown_slides(content_path, self.config)
         
-        # Determine template path: override > frontmatter > config
-        if template_override:
-            template_path = template_override
-        elif 'template' in frontmatter:
-            # Resolve template path from frontmatter relative to project root
-            template_path = self.config.project_root / frontmatter['template']
-        else:
-            template_path = self.config.template_path
+        template_path = self._template_path(frontmatter, template_override)
+        output_path = self.config.output_path
+        report.output_path = output_path
+        
+        # Unchanged inputs: copy the deck generated last time
+        result_cache, key, cached = None, None, None
+        if get_result_cache(self.config):
+            result_cache, key, cached = self._lookup_result(report, frontmatter, parsed_slides,
+                                                            template_digest(template_path))
+        if cached is not None:
+            self._copy_cached(report, cached, output_path)
+            return len(parsed_slides)
         
         logging.info(f"Loading template: {template_path}")
-        prs = Presentation(str(template_path))
+        self._emit(report, 'template_load', total=len(parsed_slides))
+        with report.phase('template_load'):
+            snapshot = get_snapshot(template_path)
+            prs, all_layouts, layout_map = snapshot.clone()
+        self._log_template(all_layouts, snapshot)
         
-        # Collect all layouts from all slide masters
-        all_layouts = []
-        for master in prs.slide_masters:
-            all_layouts.extend(master.slide_layouts)
+        # Output path is needed up front to find the previous build
+        incremental = None
+        if self.config.get('incremental.enabled', False):
+            incremental = IncrementalBuild(self.config, output_path, snapshot.sha1)
         
-        # Build layout name to index map for layout-by-name selection
-        layout_map = {layout.name: idx for idx, layout in enumerate(all_layouts)}
+        try:
+            self._build_slides(prs, parsed_slides, all_layouts, layout_map, report, incremental)
+        finally:
+            if incremental:
+                incremental.close()
         
-        logging.info(f"Template has {len(prs.slide_masters)} slide master(s)")
-        logging.info(f"Template has {len(all_layouts)} total layout(s) across all masters:")
-        for i, layout in enumerate(all_layouts):
-            logging.debug(f"  Layout {i}: {layout.name}")
-        logging.info(f"Template has {len(prs.slides)} existing slides")
+        # Save presentation
+        output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Remove existing content slides (keep master/layouts)
-        logging.info("Removing existing slides...")
-        while len(prs.slides) > 0:
-            rId = prs.slides._sldIdLst[0].rId
-            prs.part.drop_rel(rId)
-            del prs.slides._sldIdLst[0]
+        logging.info(f"\nSaving presentation to {output_path}...")
+        self._emit(report, 'save', total=len(parsed_slides))
+        with report.phase('save'):
+            save_presentation(prs, output_path, self.config)
+        save_image_indexes()
+        if incremental:
+            incremental.write_manifest()
+        if result_cache:
+            result_cache.add_file(key, output_path)
+        logging.info("✓ Presentation saved successfully!")
+        logging.info(f"  Total slides created: {len(prs.slides)}")
+        return len(parsed_slides)
+    
+    def _generate_streaming(self, report: GenerationReport, template_override: Optional[Path]) -> int:
+        """Run one generation that parses, builds and writes a slide at a time.
+        
+        The deck is written to a partial file next to the output and moved
+        into place once complete. Incremental regeneration does not apply.
+        
+        Returns:
+            Number of slides in the deck
+        """
+        self.config.validate_paths()
+        
+        content_path = self.config.content_path
+        self._emit(report, 'parse')
+        with report.phase('parse'):
+            frontmatter, slides = iter_markdown_file(content_path, self.config)
+        
+        template_path = self._template_path(frontmatter, template_override)
+        output_path = self.config.output_path
+        report.output_path = output_path
+        if self.config.get('incremental.enabled', False):
+            logging.warning("Incremental regeneration does not apply to streaming generation, "
+                            "building every slide")
         
-        logging.info(f"Creating {len(parsed_slides)} new slides...")
+        # Fingerprint in a separate lazy pass, so the lookup holds one slide at a time too
+        result_cache, key, cached = None, None, None
+        if get_result_cache(self.config):
+            _, fingerprint_slides = iter_markdown_file(content_path, self.config)
+            fingerprint_slides = _CountingIter(fingerprint_slides)
+            result_cache, key, cached = self._lookup_result(report, frontmatter, fingerprint_slides,
+                                                            template_digest(template_path))
+        if cached is not None:
+            self._copy_cached(report, cached, output_path)
+            return fingerprint_slides.count
+        
+        logging.info(f"Loading template: {template_path}")
+        self._emit(report, 'template_load')
+        with report.phase('template_load'):
+            snapshot = get_snapshot(template_path)
+            prs, all_layouts, layout_map = snapshot.clone()
+        self._log_template(all_layouts, snapshot)
+        
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        partial_path = output_path.with_name(f".{output_path.name}.partial")
+        writer = StreamingPackageWriter(prs, partial_path, self.config)
+        try:
+            slide_count = self._build_slides(prs, _timed_iter(report, 'parse', slides), all_layouts,
+                                             layout_map, report, None, writer)
+            
+            logging.info(f"\nFinishing presentation {output_path}...")
+            self._emit(report, 'save', total=slide_count)
+            with report.phase('save'):
+                writer.close()
+            os.replace(partial_path, output_path)
+        except BaseException:
+            writer.discard()
+            partial_path.unlink(missing_ok=True)
+            raise
+        save_image_indexes()
+        if result_cache:
+            result_cache.add_file(key, output_path)
+        logging.info("✓ Presentation saved successfully!")
+        logging.info(f"  Total slides created: {slide_count}")
+        return slide_count
+    
+    def _copy_cached(self, report: GenerationReport, cached: Path, output_path: Path) -> None:
+        """Copy a deck from the result cache to the output path."""
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with report.phase('save'):
+            shutil.copyfile(cached, output_path)
+        save_image_indexes()
+        logging.info(f"✓ Inputs unchanged, copied {output_path} from the result cache")
+    
+    def _build_slides(self, prs, parsed_slides: Iterable[Dict[str, Any]], all_layouts: List,
+                      layout_map: Dict[str, int], report: GenerationReport,
+                      incremental: Optional[IncrementalBuild],
+                      writer: Optional[StreamingPackageWriter] = None) -> int:
+        """Append one slide per parsed slide dictionary to prs.
+        
+        Args:
+            prs: Presentation to add slides to
+            parsed_slides: Parsed slide dictionaries (an iterator when streaming)
+            all_layouts: All layouts of prs
+            layout_map: Layout name to index
+            report: Report that receives per-slide timings
+            incremental: Previous-build tracker, or None to build every slide
+            writer: Streaming writer each slide is flushed to once built (optional)
+        
+        Returns:
+            Number of slides built or reused
+        """
+        total = len(parsed_slides) if isinstance(parsed_slides, list) else 0
+        logging.info(f"Creating {total or 'streamed'} new slides...")
         
         # Create slides
+        slide_count = 0
         for idx, slide_data in enumerate(parsed_slides):
+            slide_count = idx + 1
+            slide_start = time.perf_counter()
             logging.info(f"\nCreating slide {idx + 1}...")
             logging.info(f"  Title: {slide_data['title']}")
             logging.info(f"  Is title slide: {slide_data['is_title']}")
             
+            # Reuse the previously built slide if its fingerprint is unchanged
+            if incremental:
+                fingerprint = incremental.fingerprint(slide_data)
+                slide = incremental.try_splice(prs, fingerprint, all_layouts)
+                if slide is not None:
+                    logging.info("  Unchanged, reused from previous build")
+                    incremental.record(fingerprint, slide, rebuilt=False)
+                    report.add_slide(idx, slide_data['title'], 'reused', slide_data.get('layout'),
+                                     time.perf_counter() - slide_start)
+                    self._emit(report, 'build', slide=idx + 1, total=total,
+                               title=slide_data['title'])
+                    continue
+            
             # Check for custom layout directive
             layout_name = slide_data.get('layout')
             if layout_name:
@@ -82,17 +435,22 @@ class PresentationGenerator:
             # Determine which builder to use
             if layout_name in ('image-side', 'content-bg', 'title-bg', 'dual-image-text-bottom'):
                 # Use new layout-aware builder
-                build_layout_slide(prs, slide_data, self.config, all_layouts, layout_map)
+                builder = 'layout'
+                slide = build_layout_slide(prs, slide_data, self.config, all_layouts, layout_map)
             elif slide_data['is_title']:
-                build_title_slide(prs, slide_data, self.config, all_layouts)
+                builder = 'title'
+                slide = build_title_slide(prs, slide_data, self.config, all_layouts)
             else:
-                build_content_slide(prs, slide_data, self.config, all_layouts)
-        
-        # Save presentation
-        output_path = self.config.output_path
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        logging.info(f"\nSaving presentation to {output_path}...")
-        prs.save(str(output_path))
-        logging.info("✓ Presentation saved successfully!")
-        logging.info(f"  Total slides created: {len(prs.slides)}")
+                builder = 'content'
+                slide = build_content_slide(prs, slide_data, self.config, all_layouts)
+            
+            if incremental:
+                incremental.record(fingerprint, slide, rebuilt=True)
+            report.add_slide(idx, slide_data['title'], builder, layout_name,
+                             time.perf_counter() - slide_start)
+            self._emit(report, 'build', slide=idx + 1, total=total,
+                       title=slide_data['title'])
+            if writer:
+                with report.phase('save'):
+                    writer.flush_slide(slide)
+        return slide_count
@@ -0,0 +1,182 @@
+"""Content-addressed preprocessing cache for embedded images.
+
+Source images are often far larger than the box they are placed in. Before
+embedding, images are resampled to the configured DPI for their placement
+size and optionally re-encoded, and the result is stored on disk under a key
+built from the source hash and the target settings.
+"""
+
+import hashlib
+import logging
+import math
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+from .config import Config
+from .image_index import get_image_index
+from .timing import timed
+
+# Only resample when the source is meaningfully larger than needed
+DOWNSAMPLE_THRESHOLD = 1.1
+
+# Extensions written for each output format
+FORMAT_EXTENSIONS = {'PNG': '.png', 'JPEG': '.jpg'}
+
+
+def get_image_processing_settings(config: Config) -> Dict[str, Any]:
+    """Read image preprocessing settings from config.
+
+    Args:
+        config: Configuration object
+
+    Returns:
+        Dictionary with enabled, target_dpi, format, jpeg_quality and cache_dir keys;
+        cached on the config and shared, so treat it as read-only
+    """
+    return config.derived(_read_image_processing_settings)
+
+
+def _read_image_processing_settings(config: Config) -> Dict[str, Any]:
+    """Build the settings returned by get_image_processing_settings."""
+    cache_dir = Path(config.get('image_processing.cache_dir', '.cache/images'))
+    if not cache_dir.is_absolute():
+        cache_dir = config.project_root / cache_dir
+    return {
+        'enabled': config.get('image_processing.enabled', False),
+        'target_dpi': config.get('image_processing.target_dpi', 200),
+        'format': str(config.get('image_processing.format', 'keep')).lower(),
+        'jpeg_quality': config.get('image_processing.jpeg_quality', 85),
+        'cache_dir': cache_dir,
+    }
+
+
+def _choose_format(info: Dict[str, Any], requested: str) -> str:
+    """Pick the output format for an image given its index entry and the configured format."""
+    source_format = 'JPEG' if info['format'] in ('JPEG', 'MPO') else 'PNG'
+    if requested == 'jpeg':
+        # JPEG has no alpha channel; transparent images stay PNG
+        return 'PNG' if info['has_alpha'] else 'JPEG'
+    if requested == 'png':
+        return 'PNG'
+    return source_format
+
+
+def prepare_image(img_path: Path, width: Optional[float], height: Optional[float],
+                  config: Optional[Config]) -> Path:
+    """Return the file to embed for an image placed at the given size.
+
+    Images larger than the target DPI requires for the placement box are
+    resampled; the result is cached on disk and reused by later runs. The
+    original path is returned when preprocessing is disabled, the image
+    cannot be processed, or the processed file would not be smaller.
+
+    Args:
+        img_path: Path to the source image
+        width: Rendered width in inches (None to derive from height)
+        height: Rendered height in inches (None to derive from width)
+        config: Configuration object (None disables preprocessing)
+
+    Returns:
+        Path to the image file to embed
+    """
+    if config is None:
+        return img_path
+    settings = get_image_processing_settings(config)
+    if not settings['enabled'] or (width is None and height is None):
+        return img_path
+
+    with timed('image_prepare'):
+        try:
+            info = get_image_index(config).lookup(img_path)
+            src_w, src_h = info['width'], info['height']
+            out_format = _choose_format(info, settings['format'])
+
+            # Target pixel box for the rendered size, keeping the aspect ratio
+            dpi = settings['target_dpi']
+            if width is None:
+                width = height * src_w / src_h
+            if height is None:
+                height = width * src_h / src_w
+            scale = min(width * dpi / src_w, height * dpi / src_h, 1.0)
+            needs_resize = scale * DOWNSAMPLE_THRESHOLD < 1.0
+            target_w = max(1, math.ceil(src_w * scale)) if needs_resize else src_w
+            target_h = max(1, math.ceil(src_h * scale)) if needs_resize else src_h
+
+            if not needs_resize and settings['format'] == 'keep':
+                return img_path
+
+            key_text = f"{info['sha1']}-{target_w}x{target_h}-{out_format}-{settings['jpeg_quality']}"
+            cache_key = hashlib.sha1(key_text.encode('utf-8')).hexdigest()
+            cache_dir = settings['cache_dir']
+            cached = cache_dir / f"{cache_key}{FORMAT_EXTENSIONS[out_format]}"
+
+            if not cached.exists():
+                _write_processed_image(img_path, cached, (target_w, target_h) if needs_resize else None,
+                                       out_format, settings['jpeg_quality'])
+                logging.debug(f"Preprocessed {img_path.name}: {src_w}x{src_h} -> "
+                              f"{target_w}x{target_h} {out_format}")
+
+            if cached.stat().st_size >= info['size']:
+                return img_path
+            return cached
+
+        except Exception as e:
+            logging.warning(f"Could not preprocess image {img_path}, embedding original: {e}")
+            return img_path
+
+
+def _write_processed_image(img_path: Path, cached: Path, size: Optional[Tuple[int, int]],
+                           out_format: str, jpeg_quality: int) -> None:
+    """Resample and re-encode an image into the cache.
+
+    Args:
+        img_path: Path to the source image
+        cached: Destination path inside the cache directory
+        size: Target (width, height) in pixels, or None to keep the size
+        out_format: 'PNG' or 'JPEG'
+        jpeg_quality: JPEG quality when out_format is 'JPEG'
+    """
+    from PIL import Image
+
+    with Image.open(img_path) as img:
+        processed = img
+        has_alpha = img.mode in ('RGBA', 'LA', 'PA') or (img.mode == 'P' and 'transparency' in img.info)
+        if processed.mode == 'P' or (out_format == 'JPEG' and processed.mode != 'RGB'):
+            processed = processed.convert('RGBA' if has_alpha else 'RGB')
+        if size is not None:
+            processed = processed.resize(size, Image.LANCZOS)
+
+        save_kwargs = {'optimize': True}
+        if out_format == 'JPEG':
+            save_kwargs['quality'] = jpeg_quality
+
+        # Write to a temp file first so concurrent workers never see partial output
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cached.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                processed.save(f, format=out_format, **save_kwargs)
+            os.replace(tmp_name, cached)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+
+def clear_image_cache(config: Config) -> int:
+    """Delete every file in the image preprocessing cache.
+
+    Args:
+        config: Configuration object
+
+    Returns:
+        Number of files removed
+    """
+    cache_dir = get_image_processing_settings(config)['cache_dir']
+    removed = 0
+    if cache_dir.exists():
+        for path in cache_dir.iterdir():
+            if path.is_file():
+                path.unlink()
+                removed += 1
+    return removed
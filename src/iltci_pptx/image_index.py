@@ -0,0 +1,148 @@
+"""Shared image metadata index for layout maths and embed deduplication.
+
+Each image is read once to record its pixel size, format, mode, byte size
+and SHA1. Entries are validated against the file's mtime and size, and can
+be persisted between runs so that unchanged images are never re-read for
+metadata.
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional
+from .config import Config
+
+# Bump when the entry layout changes so stale index files are ignored
+INDEX_VERSION = 1
+
+
+class ImageIndex:
+    """Metadata index of image files keyed by resolved path."""
+
+    def __init__(self, index_path: Optional[Path] = None):
+        """Initialize the index, loading persisted entries if present.
+
+        Args:
+            index_path: JSON file to persist entries to (None keeps them in memory only)
+        """
+        self.index_path = index_path
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        if index_path is not None and index_path.exists():
+            self._load()
+
+    def _load(self) -> None:
+        """Load persisted entries, ignoring unreadable or outdated files."""
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable image index {self.index_path}: {e}")
+            return
+        if data.get('version') == INDEX_VERSION:
+            self._entries = data.get('entries', {})
+            logging.debug(f"Loaded {len(self._entries)} image index entries from {self.index_path}")
+
+    def lookup(self, img_path: Path) -> Dict[str, Any]:
+        """Return metadata for an image, reading the file only if it changed.
+
+        Args:
+            img_path: Path to the image file
+
+        Returns:
+            Dictionary with width, height, format, mode, size, mtime_ns and sha1 keys
+        """
+        key = str(Path(img_path).resolve())
+        stat = os.stat(key)
+
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            return entry
+
+        from PIL import Image
+
+        with open(key, 'rb') as f:
+            blob = f.read()
+        with Image.open(io.BytesIO(blob)) as img:
+            width, height = img.size
+            image_format = img.format
+            mode = img.mode
+            has_alpha = mode in ('RGBA', 'LA', 'PA') or (mode == 'P' and 'transparency' in img.info)
+
+        entry = {
+            'width': width,
+            'height': height,
+            'format': image_format,
+            'mode': mode,
+            'has_alpha': has_alpha,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha1': hashlib.sha1(blob).hexdigest(),
+        }
+        with self._lock:
+            self._entries[key] = entry
+            self._dirty = True
+        return entry
+
+    def save(self) -> None:
+        """Write entries to index_path if anything changed since the last save."""
+        if self.index_path is None or not self._dirty:
+            return
+        with self._lock:
+            data = {'version': INDEX_VERSION, 'entries': dict(self._entries)}
+            self._dirty = False
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            logging.warning(f"Could not save image index {self.index_path}: {e}")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Indexes keyed by persisted path ('' for the in-memory index)
+_indexes: Dict[str, ImageIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_image_index(config: Optional[Config] = None) -> ImageIndex:
+    """Return the shared image index for a configuration.
+
+    Args:
+        config: Configuration object; None or image_index.persist = false
+            gives the process-wide in-memory index
+
+    Returns:
+        Shared ImageIndex instance
+    """
+    index_path = None
+    if config is not None and config.get('image_index.persist', False):
+        index_path = Path(config.get('image_index.path', '.cache/image-index.json'))
+        if not index_path.is_absolute():
+            index_path = config.project_root / index_path
+
+    key = str(index_path) if index_path else ''
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = ImageIndex(index_path)
+            _indexes[key] = index
+    return index
+
+
+def save_image_indexes() -> None:
+    """Persist every shared index that has unsaved entries."""
+    with _indexes_lock:
+        indexes = list(_indexes.values())
+    for index in indexes:
+        index.save()
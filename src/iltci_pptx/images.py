@@ -2,13 +2,21 @@
 
 import re
 import logging
+import weakref
 from pathlib import Path
-from pptx.util import Inches, Emu, Pt
+from pptx.util import Inches, Emu, Pt, Length
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.parts.image import Image as PptxImage, ImagePart
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE
+from pptx.util import lazyproperty
 from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
 from pptx.enum.text import PP_ALIGN
 from .config import Config
+from .image_cache import prepare_image
+from .image_index import get_image_index
+from .slide_alloc import get_allocator
+from .timing import timed
 
 if TYPE_CHECKING:
     from pptx.slide import Slide
@@ -58,6 +66,171 @@ def parse_style_classes(class_attr: str) -> Dict[str, Any]:
     return style
 
 
+# EMU per inch, for native image sizes computed the way python-pptx does
+EMU_PER_INCH = 914400
+
+
+class EmbeddedImagePart(ImagePart):
+    """Image part added by the builders, whose bytes can be dropped once written out.
+    
+    Streaming generation writes each image into the output when the first
+    slide using it is flushed, then calls release_blob(). The native size and
+    SHA1 are kept, so later pictures of the same image still size and
+    deduplicate without the bytes.
+    """
+    
+    @lazyproperty
+    def _native_size(self):
+        return super()._native_size
+    
+    def release_blob(self) -> None:
+        """Drop the image bytes, keeping what later pictures of the image need."""
+        self._native_size
+        self.sha1
+        self._blob = None
+
+
+class FileImagePart(EmbeddedImagePart):
+    """Image part backed by an image file instead of bytes in memory.
+    
+    Only the path, size and SHA1 (from the image index) are kept. The file
+    is read when the package is written, copied into the .pptx in chunks by
+    package_writer, so memory does not grow with the total image bytes.
+    """
+    
+    def __init__(self, partname, content_type: str, package, source_path: Path,
+                 source_size: int, sha1: str, native_size: Tuple[Length, Length],
+                 filename: Optional[str] = None):
+        super().__init__(partname, content_type, package, None, filename)
+        self.source_path = source_path
+        self.source_size = source_size
+        # Fill the lazy properties that would otherwise read the bytes
+        self.__dict__['sha1'] = sha1
+        self.__dict__['_native_size'] = native_size
+    
+    @classmethod
+    def from_file(cls, package, img_path: Path, entry: Dict[str, Any],
+                  filename: Optional[str] = None) -> 'FileImagePart':
+        """Create the part for an image file, reading only its header.
+        
+        Args:
+            package: python-pptx package the image belongs to
+            img_path: Path to the image file
+            entry: Image index entry of the file (size, sha1)
+            filename: Name for the picture description (defaults to the file's name)
+            
+        Returns:
+            New image part
+        """
+        from PIL import Image as PILImage
+        
+        with PILImage.open(img_path) as pil_image:
+            pil_props = (pil_image.format, pil_image.size, pil_image.info.get('dpi'))
+        # python-pptx's Image derives extension, content type and dpi from these
+        image = PptxImage(b'', filename or img_path.name)
+        image.__dict__['_pil_props'] = pil_props
+        
+        (horz_dpi, vert_dpi), (width_px, height_px) = image.dpi, image.size
+        native_size = (Emu(int(EMU_PER_INCH * width_px / horz_dpi)),
+                       Emu(int(EMU_PER_INCH * height_px / vert_dpi)))
+        partname = get_allocator(package).next_image_partname(image.ext)
+        return cls(partname, image.content_type, package,
+                   Path(img_path), entry['size'], entry['sha1'], native_size, image.filename)
+    
+    @property
+    def blob(self) -> bytes:
+        """The image file contents (read on every access)."""
+        return self.source_path.read_bytes()
+    
+    @property
+    def image(self) -> PptxImage:
+        return PptxImage.from_file(str(self.source_path))
+
+
+# Image parts already embedded in each package, keyed by SHA1 of the image bytes
+_package_image_parts: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+
+
+def _package_image_part_map(package) -> Dict[str, ImagePart]:
+    """Return the SHA1 -> image part map for a package, seeded with its existing images."""
+    parts = _package_image_parts.get(package)
+    if parts is None:
+        # Seed with image parts that came with the template
+        parts = {part.sha1: part for part in package._image_parts if hasattr(part, 'sha1')}
+        _package_image_parts[package] = parts
+    return parts
+
+
+def _get_or_add_image_part(slide: 'Slide', img_path: Path, config: Optional[Config],
+                           filename: Optional[str] = None) -> ImagePart:
+    """Return the package's image part for an image file, adding it if new.
+    
+    Deduplication uses the SHA1 from the shared image index, so an image that
+    is already embedded is never re-read or re-hashed. New images become
+    file-backed parts, read only when the package is written. filename names
+    the image when img_path is a preprocessed copy in the image cache.
+    """
+    package = slide.part.package
+    parts = _package_image_part_map(package)
+    entry = get_image_index(config).lookup(img_path)
+    image_part = parts.get(entry['sha1'])
+    if image_part is None:
+        image_part = FileImagePart.from_file(package, img_path, entry, filename)
+        parts[entry['sha1']] = image_part
+    return image_part
+
+
+def get_or_add_image_part_for_blob(package, blob: bytes, filename: Optional[str] = None) -> ImagePart:
+    """Return the package's image part for in-memory image bytes, adding it if new.
+    
+    Args:
+        package: python-pptx package the image belongs to
+        blob: Image file bytes
+        filename: Original file name, used for the picture description
+        
+    Returns:
+        Image part holding the bytes
+    """
+    parts = _package_image_part_map(package)
+    image = PptxImage.from_blob(blob, filename)
+    image_part = parts.get(image.sha1)
+    if image_part is None:
+        image_part = EmbeddedImagePart(get_allocator(package).next_image_partname(image.ext),
+                                       image.content_type, package, image.blob, image.filename)
+        parts[image.sha1] = image_part
+    return image_part
+
+
+def embed_picture(slide: 'Slide', img_path: Path, left: Length, top: Length,
+                  width: Optional[Length] = None, height: Optional[Length] = None,
+                  config: Optional[Config] = None, filename: Optional[str] = None) -> 'Picture':
+    """Add a picture shape to a slide, equivalent to slide.shapes.add_picture.
+    
+    Args:
+        slide: PowerPoint slide object
+        img_path: Path to the image file to embed
+        left, top: Position as lengths
+        width, height: Size as lengths (a missing one preserves the aspect ratio)
+        config: Configuration object selecting the image index (optional)
+        filename: Name of the source image for the picture description, when
+            img_path is its preprocessed copy (defaults to img_path's name)
+        
+    Returns:
+        Picture shape
+    """
+    with timed('image_embed'):
+        image_part = _get_or_add_image_part(slide, img_path, config, filename)
+        rId = slide.part.relate_to(image_part, RT.IMAGE)
+        shapes = slide.shapes
+        pic = shapes._add_pic_from_image_part(image_part, rId, left, top, width, height)
+        if filename:
+            # A deduplicated part carries the name it was first embedded under,
+            # which for slides reused by incremental builds is its partname
+            pic.nvPicPr.cNvPr.set('descr', filename)
+        shapes._recalculate_extents()
+        return shapes._shape_factory(pic)
+
+
 def apply_image_style(picture: 'Picture', style: Dict[str, Any]) -> None:
     """Apply border and rounded corner styling to a PowerPoint Picture shape.
     
@@ -145,7 +318,7 @@ def _apply_rounded_corners(picture: 'Picture', radius: int) -> None:
 
 
 # Layout specifications for image-aware layouts
-# These match the specs in assets/layout-specs.yaml
+# scripts/add_layouts.py bakes these into real slide layouts of the template
 LAYOUT_SPECS = {
     "image-side": {
         "description": "Text on left (60%), image on right (40%)",
@@ -157,12 +330,16 @@ LAYOUT_SPECS = {
         "background": {"left": 0, "top": 0, "width": 13.33, "height": 7.5},
         "overlay": {"left": 0.5, "top": 0.5, "width": 8.0, "height": 6.5,
                    "fill_color": (255, 255, 255), "transparency": 0.25},
+        "title": {"left": 0.75, "top": 0.75, "width": 7.5, "height": 0.8},
+        "body": {"left": 0.75, "top": 1.75, "width": 7.5, "height": 5.0},
     },
     "title-bg": {
         "description": "Full background image with title overlay at bottom",
         "background": {"left": 0, "top": 0, "width": 13.33, "height": 7.5},
         "overlay": {"left": 0, "top": 5.0, "width": 13.33, "height": 2.5,
                    "fill_color": (0, 0, 0), "transparency": 0.5},
+        "title": {"left": 0.5, "top": 5.25, "width": 12.33, "height": 1.5},
+        "subtitle": {"left": 0.5, "top": 6.75, "width": 12.33, "height": 0.5},
     },
     "dual-image-text-bottom": {
         "description": "Two side-by-side images (top ~70%), text below (bottom ~30%)",
@@ -175,7 +352,8 @@ LAYOUT_SPECS = {
 
 
 def add_background_image(slide: 'Slide', img_path: Path, 
-                         width: float = 13.33, height: float = 7.5) -> None:
+                         width: float = 13.33, height: float = 7.5,
+                         config: Optional[Config] = None) -> None:
     """Add a full-bleed background image to slide.
     
     The image is added at position (0,0) and should be moved to back.
@@ -185,6 +363,7 @@ def add_background_image(slide: 'Slide', img_path: Path,
         img_path: Path to the image file
         width: Slide width in inches (default: 13.33 for widescreen)
         height: Slide height in inches (default: 7.5)
+        config: Configuration object for image preprocessing (optional)
     """
     if not img_path.exists():
         logging.warning(f"Background image not found: {img_path}")
@@ -192,12 +371,15 @@ def add_background_image(slide: 'Slide', img_path: Path,
     
     try:
         # Add picture at full slide size
-        picture = slide.shapes.add_picture(
-            str(img_path),
+        embed_path = prepare_image(img_path, width, height, config)
+        picture = embed_picture(
+            slide, embed_path,
             Inches(0),
             Inches(0),
             width=Inches(width),
-            height=Inches(height)
+            height=Inches(height),
+            config=config,
+            filename=img_path.name
         )
         
         # Move to back by adjusting z-order
@@ -210,6 +392,43 @@ def add_background_image(slide: 'Slide', img_path: Path,
         logging.error(f"Error adding background image {img_path}: {e}")
 
 
+def set_background_image(slide: 'Slide', img_path: Path,
+                         width: float = 13.33, height: float = 7.5,
+                         config: Optional[Config] = None) -> None:
+    """Fill the slide background with an image, stretched to the slide.
+    
+    Unlike add_background_image no shape is added: the image becomes the
+    slide's own background, so shapes of its layout (such as the overlay of
+    a pre-baked layout) are drawn on top of it.
+    
+    Args:
+        slide: PowerPoint slide object
+        img_path: Path to the image file
+        width: Slide width in inches (default: 13.33 for widescreen)
+        height: Slide height in inches (default: 7.5)
+        config: Configuration object for image preprocessing (optional)
+    """
+    if not img_path.exists():
+        logging.warning(f"Background image not found: {img_path}")
+        return
+    
+    try:
+        from pptx.oxml.ns import qn
+        embed_path = prepare_image(img_path, width, height, config)
+        with timed('image_embed'):
+            image_part = _get_or_add_image_part(slide, embed_path, config, img_path.name)
+            rId = slide.part.relate_to(image_part, RT.IMAGE)
+            bgPr = slide._element.cSld.get_or_add_bgPr()
+            blipFill = bgPr.get_or_change_to_blipFill()
+            blipFill.get_or_add_blip().rEmbed = rId
+            blipFill.append(blipFill.makeelement(qn('a:stretch'), {}))
+            blipFill[-1].append(blipFill.makeelement(qn('a:fillRect'), {}))
+        
+        logging.info(f"Set background image: {img_path}")
+    except Exception as e:
+        logging.error(f"Error setting background image {img_path}: {e}")
+
+
 def add_overlay_rectangle(slide: 'Slide', left: float, top: float, 
                           width: float, height: float,
                           fill_color: tuple = (255, 255, 255),
@@ -266,7 +485,8 @@ def add_overlay_rectangle(slide: 'Slide', left: float, top: float,
 def add_image_to_area(slide: 'Slide', img_path: Path,
                       left: float, top: float, width: float, height: float,
                       fit_mode: str = 'contain',
-                      class_attr: Optional[str] = None) -> Optional['Picture']:
+                      class_attr: Optional[str] = None,
+                      config: Optional[Config] = None) -> Optional['Picture']:
     """Add an image to a specific area, scaling to fit.
     
     Args:
@@ -275,6 +495,7 @@ def add_image_to_area(slide: 'Slide', img_path: Path,
         left, top, width, height: Target area in inches
         fit_mode: 'contain' (fit within, preserve aspect) or 'cover' (fill, may crop)
         class_attr: CSS class attribute for style overrides (e.g., 'no-border rounded-lg')
+        config: Configuration object for image preprocessing (optional)
         
     Returns:
         Picture shape or None if failed
@@ -287,11 +508,9 @@ def add_image_to_area(slide: 'Slide', img_path: Path,
     image_style = parse_style_classes(class_attr or '')
     
     try:
-        from PIL import Image
-        
-        # Get original image dimensions
-        with Image.open(img_path) as img:
-            orig_width, orig_height = img.size
+        # Get original image dimensions from the shared metadata index
+        info = get_image_index(config).lookup(img_path)
+        orig_width, orig_height = info['width'], info['height']
         
         # Calculate aspect ratios
         orig_ratio = orig_width / orig_height
@@ -326,12 +545,15 @@ def add_image_to_area(slide: 'Slide', img_path: Path,
                 final_left = left
                 final_top = top + (height - final_height) / 2
         
-        picture = slide.shapes.add_picture(
-            str(img_path),
+        embed_path = prepare_image(img_path, final_width, final_height, config)
+        picture = embed_picture(
+            slide, embed_path,
             Inches(final_left),
             Inches(final_top),
             width=Inches(final_width),
-            height=Inches(final_height)
+            height=Inches(final_height),
+            config=config,
+            filename=img_path.name
         )
         
         # Apply image styling (border and rounded corners)
@@ -340,20 +562,6 @@ def add_image_to_area(slide: 'Slide', img_path: Path,
         logging.info(f"Added image {img_path} to area ({left}, {top}) {width}x{height} [mode={fit_mode}]")
         return picture
         
-    except ImportError:
-        # PIL not available, use simple placement
-        logging.warning("PIL not available, using simple image placement")
-        picture = slide.shapes.add_picture(
-            str(img_path),
-            Inches(left),
-            Inches(top),
-            width=Inches(width)
-        )
-        
-        # Apply image styling (border and rounded corners)
-        apply_image_style(picture, image_style)
-        return picture
-        
     except Exception as e:
         logging.error(f"Error adding image to area: {e}")
         return None
@@ -396,7 +604,8 @@ def add_images_for_layout(slide: 'Slide', images: List[Dict[str, Any]],
         add_background_image(
             slide, img_path,
             width=bg_spec.get('width', 13.33),
-            height=bg_spec.get('height', 7.5)
+            height=bg_spec.get('height', 7.5),
+            config=config
         )
         
         # Add overlay
@@ -428,7 +637,8 @@ def add_images_for_layout(slide: 'Slide', images: List[Dict[str, Any]],
             height=pic_spec.get('height', 5.5),
             caption=first_caption,
             fit_mode=fit_mode,
-            class_attr=first_class
+            class_attr=first_class,
+            config=config
         )
         
         # Handle additional images (fallback placement below main)
@@ -453,7 +663,8 @@ def add_images_for_layout(slide: 'Slide', images: List[Dict[str, Any]],
             height=pic_left_spec.get('height', 4.0),
             caption=first_caption,
             fit_mode=fit_mode,
-            class_attr=first_class
+            class_attr=first_class,
+            config=config
         )
         
         # Add second image if present
@@ -473,7 +684,8 @@ def add_images_for_layout(slide: 'Slide', images: List[Dict[str, Any]],
                     height=pic_right_spec.get('height', 4.0),
                     caption=second_caption,
                     fit_mode=fit_mode,
-                    class_attr=second_class
+                    class_attr=second_class,
+                    config=config
                 )
 
 
@@ -567,11 +779,14 @@ def add_images_to_slide(slide: 'Slide', images: List[Dict[str, Any]],
         
         try:
             # Add the image to the slide
-            picture = slide.shapes.add_picture(
-                str(img_path),
+            embed_path = prepare_image(img_path, None, current_img_height.inches, config)
+            picture = embed_picture(
+                slide, embed_path,
                 left,
                 top_pos,
-                height=current_img_height
+                height=current_img_height,
+                config=config,
+                filename=img_path.name
             )
             
             # Apply image styling (border and rounded corners)
@@ -653,7 +868,8 @@ def add_image_with_caption(slide: 'Slide', img_path: Path,
                            caption: Optional[str] = None,
                            fit_mode: str = 'contain',
                            caption_style: Optional[Dict[str, Any]] = None,
-                           class_attr: Optional[str] = None) -> Tuple[Optional['Picture'], float]:
+                           class_attr: Optional[str] = None,
+                           config: Optional[Config] = None) -> Tuple[Optional['Picture'], float]:
     """Add an image to a specific area with optional caption below.
     
     Args:
@@ -664,6 +880,7 @@ def add_image_with_caption(slide: 'Slide', img_path: Path,
         fit_mode: 'contain' (fit within, preserve aspect) or 'cover' (fill, may crop)
         caption_style: Optional style overrides for caption
         class_attr: CSS class attribute for style overrides (e.g., 'no-border rounded-lg')
+        config: Configuration object for image preprocessing (optional)
         
     Returns:
         Tuple of (picture shape or None, actual bottom position of image in inches)
@@ -676,11 +893,9 @@ def add_image_with_caption(slide: 'Slide', img_path: Path,
     image_style = parse_style_classes(class_attr or '')
     
     try:
-        from PIL import Image
-        
-        # Get original image dimensions
-        with Image.open(img_path) as img:
-            orig_width, orig_height = img.size
+        # Get original image dimensions from the shared metadata index
+        info = get_image_index(config).lookup(img_path)
+        orig_width, orig_height = info['width'], info['height']
         
         # Calculate aspect ratios
         orig_ratio = orig_width / orig_height
@@ -713,12 +928,15 @@ def add_image_with_caption(slide: 'Slide', img_path: Path,
                 final_left = left
                 final_top = top + (height - final_height) / 2
         
-        picture = slide.shapes.add_picture(
-            str(img_path),
+        embed_path = prepare_image(img_path, final_width, final_height, config)
+        picture = embed_picture(
+            slide, embed_path,
             Inches(final_left),
             Inches(final_top),
             width=Inches(final_width),
-            height=Inches(final_height)
+            height=Inches(final_height),
+            config=config,
+            filename=img_path.name
         )
         
         # Apply image styling (border and rounded corners)
@@ -737,27 +955,6 @@ def add_image_with_caption(slide: 'Slide', img_path: Path,
         
         return picture, actual_bottom
         
-    except ImportError:
-        # PIL not available, use simple placement
-        logging.warning("PIL not available, using simple image placement")
-        picture = slide.shapes.add_picture(
-            str(img_path),
-            Inches(left),
-            Inches(top),
-            width=Inches(width)
-        )
-        
-        # Apply image styling (border and rounded corners)
-        apply_image_style(picture, image_style)
-        
-        actual_bottom = top + height
-        
-        if caption:
-            caption_top = actual_bottom + 0.05
-            add_image_caption(slide, caption, left, caption_top, width, caption_style)
-        
-        return picture, actual_bottom
-        
     except Exception as e:
         logging.error(f"Error adding image to area: {e}")
         return None, top + height
@@ -0,0 +1,262 @@
+"""Incremental regeneration: only rebuild slides whose markdown chunk changed.
+
+Each slide is fingerprinted from its parsed data (text, directives) and the
+hashes of the images it references. A manifest written next to the build
+records which fingerprint ended up in which slide part of the output. On the
+next run, slides with a known fingerprint are spliced in from the previous
+output instead of being rebuilt.
+"""
+
+import hashlib
+import json
+import logging
+import posixpath
+import zipfile
+from lxml import etree
+from pathlib import Path
+from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from pptx.oxml import parse_xml
+from pptx.parts.slide import SlidePart
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
+from .config import Config
+from .image_index import get_image_index
+from .images import get_or_add_image_part_for_blob
+from .markdown_parser import get_content_tokens
+from .slide_alloc import get_allocator
+
+if TYPE_CHECKING:
+    from pptx.presentation import Presentation
+    from pptx.slide import Slide
+
+# Bump when builder output changes in a way old manifests cannot detect
+MANIFEST_VERSION = 1
+
+# Config sections that never affect the rendered slides
+_NON_RENDERING_SECTIONS = ('paths', 'settings', 'ui', 'incremental', 'artifacts', 'result_cache',
+                           'package', 'template_slim')
+
+_DOC_RELS_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+
+
+class SpliceError(Exception):
+    """Raised when a slide from the previous output cannot be reused."""
+
+
+def referenced_image_paths(slide_data: Dict[str, Any]) -> List[Path]:
+    """Return the image paths a slide references, resolved the way builders do.
+
+    Args:
+        slide_data: Parsed slide dictionary
+
+    Returns:
+        List of image paths (may include missing files)
+    """
+    paths = []
+    if slide_data.get('bg_image'):
+        paths.append(Path('.') / slide_data['bg_image'])
+    for img in get_content_tokens(slide_data)[1]:
+        if img.get('src'):
+            paths.append(Path('.') / img['src'])
+    return paths
+
+
+def build_key(config: Config, template_sha1: str) -> str:
+    """Fingerprint everything that affects every slide: rendering config and template.
+
+    Args:
+        config: Configuration object
+        template_sha1: SHA1 of the template bytes
+
+    Returns:
+        Hex digest
+    """
+    rendering = {k: v for k, v in config._config.items() if k not in _NON_RENDERING_SECTIONS}
+    payload = json.dumps({'version': MANIFEST_VERSION, 'config': rendering, 'template': template_sha1},
+                         sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def slide_fingerprint(slide_data: Dict[str, Any], config: Config) -> str:
+    """Fingerprint a slide from its parsed data and referenced images.
+
+    Args:
+        slide_data: Parsed slide dictionary (text plus directives)
+        config: Configuration object (selects the image index)
+
+    Returns:
+        Hex digest
+    """
+    h = hashlib.sha1(json.dumps(slide_data, sort_keys=True, default=str).encode('utf-8'))
+    index = get_image_index(config)
+    for img_path in referenced_image_paths(slide_data):
+        try:
+            digest = index.lookup(img_path)['sha1']
+        except (OSError, ValueError):
+            digest = 'missing'
+        h.update(f"\n{img_path}={digest}".encode('utf-8'))
+    return h.hexdigest()
+
+
+class IncrementalBuild:
+    """Tracks reusable slides from the previous build of one output file."""
+
+    def __init__(self, config: Config, output_path: Path, template_sha1: str):
+        """Load the previous manifest if it still matches the output on disk.
+
+        Args:
+            config: Configuration object
+            output_path: Output .pptx path for this build
+            template_sha1: SHA1 of the template bytes
+        """
+        self.config = config
+        self.output_path = output_path
+        self.build_key = build_key(config, template_sha1)
+        self.manifest_path = self._manifest_path(config, output_path)
+        self.reused = 0
+        self.rebuilt = 0
+        self._prior: Dict[str, str] = {}
+        self._entries: List[Dict[str, str]] = []
+        self._zip: Optional[zipfile.ZipFile] = None
+        self._load_manifest()
+
+    @staticmethod
+    def _manifest_path(config: Config, output_path: Path) -> Path:
+        """Manifest location for an output file, under incremental.manifest_dir."""
+        manifest_dir = Path(config.get('incremental.manifest_dir', '.cache/incremental'))
+        if not manifest_dir.is_absolute():
+            manifest_dir = config.project_root / manifest_dir
+        key = hashlib.sha1(str(output_path.resolve()).encode('utf-8')).hexdigest()[:16]
+        return manifest_dir / f"{output_path.stem}-{key}.json"
+
+    def _load_manifest(self) -> None:
+        """Read the previous manifest, ignoring it if anything it describes changed."""
+        if not self.manifest_path.exists() or not self.output_path.exists():
+            logging.info("Incremental: no previous build, rebuilding all slides")
+            return
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Incremental: ignoring unreadable manifest {self.manifest_path}: {e}")
+            return
+
+        stat = self.output_path.stat()
+        if manifest.get('version') != MANIFEST_VERSION or manifest.get('build_key') != self.build_key:
+            logging.info("Incremental: config or template changed, rebuilding all slides")
+            return
+        if manifest.get('output') != {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}:
+            logging.info("Incremental: output changed since last build, rebuilding all slides")
+            return
+
+        for entry in manifest.get('slides', []):
+            self._prior.setdefault(entry['fingerprint'], entry['partname'])
+
+    def fingerprint(self, slide_data: Dict[str, Any]) -> str:
+        """Fingerprint a slide (see slide_fingerprint)."""
+        return slide_fingerprint(slide_data, self.config)
+
+    def try_splice(self, prs: 'Presentation', fingerprint: str, all_layouts: list) -> Optional['Slide']:
+        """Append the previously built slide with this fingerprint, if there is one.
+
+        Args:
+            prs: Presentation being built
+            fingerprint: Slide fingerprint
+            all_layouts: All layouts of prs
+
+        Returns:
+            The spliced slide, or None if the slide must be rebuilt
+        """
+        partname = self._prior.get(fingerprint)
+        if partname is None:
+            return None
+        try:
+            slide = self._splice(prs, partname, all_layouts)
+        except (SpliceError, KeyError, OSError, zipfile.BadZipFile, etree.XMLSyntaxError) as e:
+            logging.warning(f"Incremental: could not reuse {partname}, rebuilding: {e}")
+            return None
+        self.reused += 1
+        return slide
+
+    def _open_zip(self) -> zipfile.ZipFile:
+        if self._zip is None:
+            self._zip = zipfile.ZipFile(self.output_path)
+        return self._zip
+
+    def _splice(self, prs: 'Presentation', partname: str, all_layouts: list) -> 'Slide':
+        """Copy one slide part and its relationships from the previous output."""
+        zf = self._open_zip()
+        member = partname.lstrip('/')
+        base_dir = posixpath.dirname(partname)
+        rels_member = posixpath.join(posixpath.dirname(member), '_rels', posixpath.basename(member) + '.rels')
+
+        element = parse_xml(zf.read(member))
+        rels = etree.fromstring(zf.read(rels_member)) if rels_member in zf.namelist() else None
+
+        presentation_part = prs.part
+        allocator = get_allocator(presentation_part.package)
+        slide_part = SlidePart(allocator.next_slide_partname(), CT.PML_SLIDE,
+                               presentation_part.package, element)
+        layout_parts = {str(layout.part.partname): layout.part for layout in all_layouts}
+
+        self._copy_relationships(zf, rels, slide_part, base_dir, layout_parts)
+        allocator.append_slide(slide_part)
+        return slide_part.slide
+
+    def _copy_relationships(self, zf: zipfile.ZipFile, rels, slide_part: SlidePart,
+                            base_dir: str, layout_parts: Dict[str, Any]) -> None:
+        """Recreate a spliced slide's relationships and rewrite its rId references."""
+        package = slide_part.package
+        rid_map = {}
+        for rel in (rels if rels is not None else []):
+            old_rId = rel.get('Id')
+            reltype = rel.get('Type')
+            target = rel.get('Target')
+            if rel.get('TargetMode') == 'External':
+                rid_map[old_rId] = slide_part.relate_to(target, reltype, is_external=True)
+                continue
+
+            target_partname = posixpath.normpath(posixpath.join(base_dir, target))
+            if reltype == RT.SLIDE_LAYOUT:
+                layout_part = layout_parts.get(target_partname)
+                if layout_part is None:
+                    raise SpliceError(f"layout {target_partname} not in template")
+                rid_map[old_rId] = slide_part.relate_to(layout_part, reltype)
+            elif reltype == RT.IMAGE:
+                blob = zf.read(target_partname.lstrip('/'))
+                image_part = get_or_add_image_part_for_blob(package, blob, posixpath.basename(target_partname))
+                rid_map[old_rId] = slide_part.relate_to(image_part, reltype)
+            else:
+                raise SpliceError(f"unsupported relationship type {reltype}")
+
+        # Point r:embed / r:id / r:link references at the new rIds in one pass
+        for node in slide_part._element.iter():
+            for attr, value in node.attrib.items():
+                if attr.startswith(f"{{{_DOC_RELS_NS}}}") and value in rid_map:
+                    node.set(attr, rid_map[value])
+
+    def record(self, fingerprint: str, slide: 'Slide', rebuilt: bool) -> None:
+        """Remember which part a slide was written to, for the next manifest."""
+        if rebuilt:
+            self.rebuilt += 1
+        self._entries.append({'fingerprint': fingerprint, 'partname': str(slide.part.partname)})
+
+    def close(self) -> None:
+        """Release the previous output; must be called before it is overwritten."""
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+
+    def write_manifest(self) -> None:
+        """Write the manifest describing the output that was just saved."""
+        self.close()
+        stat = self.output_path.stat()
+        manifest = {
+            'version': MANIFEST_VERSION,
+            'build_key': self.build_key,
+            'output': {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns},
+            'slides': self._entries,
+        }
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        logging.info(f"Incremental: reused {self.reused} slide(s), rebuilt {self.rebuilt}")
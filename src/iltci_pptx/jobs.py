@@ -0,0 +1,121 @@
+"""Background generation jobs with progress and cancellation.
+
+Used by the Streamlit app (and usable by any service wrapper) to run an
+in-memory generation on a worker thread while the caller polls for progress.
+"""
+
+import io
+import logging
+import threading
+import time
+from typing import Dict, Any, Optional
+from .config import Config
+from .generator import (PresentationGenerator, GenerationCancelled, MarkdownSource,
+                        TemplateSource)
+from .timing import GenerationReport
+
+# Job states
+PENDING = 'pending'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+
+
+class GenerationJob:
+    """One in-memory generation running on a background thread.
+
+    The worker only writes plain attributes that the polling thread reads,
+    so no locking is needed beyond the cancel event.
+    """
+
+    def __init__(self, config: Config, markdown: MarkdownSource,
+                 template: Optional[TemplateSource] = None):
+        """Prepare a job; call start() to run it.
+
+        Args:
+            config: Configuration object
+            markdown: Markdown text, or a text or binary file-like object
+            template: Template as .pptx bytes or a binary file-like object (optional)
+        """
+        self.config = config
+        self.markdown = markdown
+        self.template = template
+        self.state = PENDING
+        self.progress: Dict[str, Any] = {'phase': PENDING, 'slide': 0, 'total': 0, 'title': '', 'phases': {}}
+        self.result: Optional[bytes] = None
+        self.report: Optional[GenerationReport] = None
+        self.error: Optional[BaseException] = None
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._cancel = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> 'GenerationJob':
+        """Start the generation on a daemon thread.
+
+        Returns:
+            self, for chaining
+        """
+        self.state = RUNNING
+        self.started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name='pptx-generation', daemon=True)
+        self._thread.start()
+        return self
+
+    def cancel(self) -> None:
+        """Ask the job to stop; it stops after the slide or phase in progress.
+
+        A cancel that arrives while the deck is being saved is too late: the
+        job still finishes as done with its result.
+        """
+        self._cancel.set()
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job has stopped (done, failed or cancelled)."""
+        return self.state in (DONE, FAILED, CANCELLED)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the job started (until it finished)."""
+        if self.started_at is None:
+            return 0.0
+        end = self.finished_at if self.finished_at is not None else time.perf_counter()
+        return end - self.started_at
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the job finishes.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits forever)
+
+        Returns:
+            True if the job finished
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return self.finished
+
+    def _on_progress(self, event: Dict[str, Any]) -> None:
+        self.progress = event
+        # 'done' follows the save; the deck is finished, so a late cancel keeps it
+        if self._cancel.is_set() and event['phase'] != 'done':
+            raise GenerationCancelled()
+
+    def _run(self) -> None:
+        generator = PresentationGenerator(self.config, progress=self._on_progress)
+        try:
+            stream = io.BytesIO()
+            self.report = generator.generate_to_stream(self.markdown, stream, template=self.template)
+            self.result = stream.getvalue()
+            self.state = DONE
+        except GenerationCancelled:
+            logging.info("Generation cancelled")
+            self.state = CANCELLED
+        except Exception as e:
+            logging.exception("Error generating presentation")
+            self.error = e
+            self.state = FAILED
+        finally:
+            self.finished_at = time.perf_counter()
@@ -1,11 +1,83 @@
-"""Markdown parsing functionality for slide content."""
+"""Markdown parsing functionality for slide content.
 
+Slides are parsed in a single pass: the file is split into lines once, and
+each line is classified exactly once into a typed Token (heading, bullet,
+numbered item, spacer, directive, HTML block, ...). Slide builders consume
+the tokens stored on each slide instead of re-splitting the text.
+
+Parsed slides are memoized by their source text, so re-parsing a deck in
+the same process (watch mode, the Streamlit app) only tokenizes the slides
+that changed. Parsed slide dictionaries are therefore shared and must be
+treated as read-only.
+
+iter_markdown_file() parses a file lazily instead, holding only the slide
+being read, for streaming generation of very large decks.
+"""
+
+import itertools
 import re
 import logging
+import threading
 import yaml
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Tuple, Optional, Iterable, Iterator, NamedTuple
 from .config import Config
+from .html_media import extract_images_from_html, remove_html_tags
+
+# Spacer marker used to represent intentional blank lines for spacing
+SPACER_MARKER = '<!-- spacer -->'
+
+# Token kinds
+HEADING = 'heading'
+BULLET = 'bullet'
+NUMBERED = 'numbered'
+SPACER = 'spacer'
+TEXT = 'text'
+DIRECTIVE = 'directive'
+HTML = 'html'
+TITLE = 'title'
+SECTION = 'section'
+
+# Parsed slides kept for reuse, keyed by (title marker, slide text)
+SLIDE_CACHE_SIZE = 4096
+_slide_cache: 'OrderedDict[Tuple[str, str], Dict[str, Any]]' = OrderedDict()
+_slide_cache_lock = threading.Lock()
+
+
+class Token(NamedTuple):
+    """A typed piece of slide markdown.
+
+    Attributes:
+        kind: One of the token kinds above
+        text: Text to render (markers removed), directive value, or raw HTML block
+        level: Header level for HEADING tokens
+        number: Start number for NUMBERED tokens
+        line: Source line the token came from (markers kept, HTML removed)
+        role: 'subtitle' or 'content' for slide text, directive name for DIRECTIVE tokens
+    """
+    kind: str
+    text: str = ''
+    level: int = 0
+    number: int = 0
+    line: str = ''
+    role: str = ''
+
+
+# Tokens are immutable, so every content spacer can share one instance
+_CONTENT_SPACER = Token(SPACER, line=SPACER_MARKER)
+
+# Compiled once. Slide directives are HTML comments: <!-- _layout: name -->,
+# <!-- _image_fit: cover|contain --> and <!-- _bg_image: path/to/image.png -->
+_DIRECTIVE_PATTERN = re.compile(r'<!--\s*_(layout|image_fit|bg_image):\s*([^\s]+)\s*-->')
+_NUMBERED_PATTERN = re.compile(r'^(\d+)\.\s+(.*)$')
+_HEADING_PREFIXES = (('##### ', 5), ('#### ', 4), ('### ', 3), ('## ', 2))
+
+# Patterns used by remove_html_tags, to detect HTML that continues on later lines
+_DIV_BLOCK_PATTERN = re.compile(r'<div[^>]*>.*?</div>', re.DOTALL)
+_DIV_OPEN_PATTERN = re.compile(r'<div[^>]*>')
+_TAG_PATTERN = re.compile(r'<[^>]+>')
+_UNCLOSED_TAG_PATTERN = re.compile(r'<[^>]*$')
 
 
 def parse_yaml_frontmatter(content: str, delimiter: str = '---') -> Tuple[Dict[str, Any], str]:
@@ -19,6 +91,23 @@ def parse_yaml_frontmatter(content: str, delimiter: str = '---') -> Tuple[Dict[s
         Tuple of (frontmatter_dict, remaining_content)
     """
     lines = content.split('\n')
+    frontmatter, remaining = _split_frontmatter(lines, delimiter)
+    if remaining is lines:
+        return frontmatter, content
+    return frontmatter, '\n'.join(remaining)
+
+
+def _split_frontmatter(lines: List[str], delimiter: str = '---') -> Tuple[Dict[str, Any], List[str]]:
+    """Line-based version of parse_yaml_frontmatter.
+    
+    Args:
+        lines: Markdown content split into lines
+        delimiter: Frontmatter delimiter
+        
+    Returns:
+        Tuple of (frontmatter_dict, remaining_lines); remaining_lines is
+        `lines` itself when there is no frontmatter
+    """
     start_idx = -1
     end_idx = -1
     
@@ -32,8 +121,7 @@ def parse_yaml_frontmatter(content: str, delimiter: str = '---') -> Tuple[Dict[s
     
     if start_idx >= 0 and end_idx > start_idx:
         # Extract frontmatter YAML
-        frontmatter_lines = lines[start_idx + 1:end_idx]
-        frontmatter_text = '\n'.join(frontmatter_lines)
+        frontmatter_text = '\n'.join(lines[start_idx + 1:end_idx])
         
         try:
             frontmatter = yaml.safe_load(frontmatter_text) or {}
@@ -42,218 +130,448 @@ def parse_yaml_frontmatter(content: str, delimiter: str = '---') -> Tuple[Dict[s
             frontmatter = {}
         
         # Remaining content after frontmatter
-        remaining = '\n'.join(lines[end_idx + 1:])
-        return frontmatter, remaining
+        return frontmatter, lines[end_idx + 1:]
     
-    return {}, content
+    return {}, lines
 
 
-def parse_slide_directives(slide_content: str) -> Tuple[Dict[str, Any], str]:
-    """Extract slide directives from HTML comments.
-    
-    Supported directives:
-    - <!-- _layout: layout-name -->
-    - <!-- _image_fit: cover|contain -->
-    - <!-- _bg_image: path/to/image.png -->
+def _split_frontmatter_lazy(lines: Iterator[str], delimiter: str = '---') -> Tuple[Dict[str, Any], Iterator[str]]:
+    """Iterator version of _split_frontmatter: reads lines only up to the frontmatter end.
     
     Args:
-        slide_content: Content of a single slide
+        lines: Markdown content lines
+        delimiter: Frontmatter delimiter
         
     Returns:
-        Tuple of (directives_dict, content_without_directives)
+        Tuple of (frontmatter_dict, iterator over the remaining lines)
     """
-    directives = {}
-    content = slide_content
-    
-    # Pattern for layout directive: <!-- _layout: name -->
-    layout_match = re.search(r'<!--\s*_layout:\s*([^\s]+)\s*-->', content)
-    if layout_match:
-        directives['layout'] = layout_match.group(1).strip()
-        content = content.replace(layout_match.group(0), '').strip()
-    
-    # Pattern for image fit directive: <!-- _image_fit: mode -->
-    fit_match = re.search(r'<!--\s*_image_fit:\s*([^\s]+)\s*-->', content)
-    if fit_match:
-        directives['image_fit'] = fit_match.group(1).strip()
-        content = content.replace(fit_match.group(0), '').strip()
-    
-    # Pattern for background image directive: <!-- _bg_image: path -->
-    bg_match = re.search(r'<!--\s*_bg_image:\s*([^\s]+)\s*-->', content)
-    if bg_match:
-        directives['bg_image'] = bg_match.group(1).strip()
-        content = content.replace(bg_match.group(0), '').strip()
+    head = []
+    delimiters = 0
+    for line in lines:
+        head.append(line)
+        if line.strip() == delimiter:
+            delimiters += 1
+            if delimiters == 2:
+                frontmatter, rest = _split_frontmatter(head, delimiter)
+                return frontmatter, itertools.chain(rest, lines)
     
-    return directives, content
+    frontmatter, rest = _split_frontmatter(head, delimiter)
+    return frontmatter, iter(rest)
 
 
-def parse_markdown_slides(md_file: Path, config: Config) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
-    """Parse markdown file into individual slides with metadata.
+def _iter_file_lines(md_file: Path) -> Iterator[str]:
+    """Yield a file's lines exactly as text.split('\n') would, without reading it whole."""
+    with open(md_file, 'r', encoding='utf-8') as f:
+        line = ''
+        for line in f:
+            yield line[:-1] if line.endswith('\n') else line
+        if not line or line.endswith('\n'):
+            yield ''
+
+
+def split_slides(lines: Iterable[str], separator: str = '---') -> Iterator[List[str]]:
+    """Group lines into slides, yielding each slide as soon as it is complete.
+    
+    A separator is a line equal to `separator` with a line before and after
+    it, matching how the markdown was historically split on
+    ``'\\n---\\n'``. A separator directly following another one is slide text.
     
     Args:
-        md_file: Path to markdown file
-        config: Configuration object
+        lines: Markdown content (after frontmatter) split into lines
+        separator: Slide separator line
         
-    Returns:
-        Tuple of (frontmatter_meta, list of parsed slide dictionaries)
+    Yields:
+        List of lines for each slide
     """
-    with open(md_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    logging.info(f"Original content length: {len(content)}")
+    chunk = []
+    iterator = iter(lines)
+    current = next(iterator, None)
+    if current is None:
+        return
     
-    # Get configuration settings
-    frontmatter_delim = config.get('markdown.frontmatter_delimiter', '---')
-    slide_separator = config.get('markdown.slide_separator', '---')
-    title_class = config.get('markdown.title_class_marker', '<!-- _class: title -->')
+    is_first = True
+    after_separator = False
+    for following in iterator:
+        if current == separator and not is_first and not after_separator:
+            yield chunk
+            chunk = []
+            after_separator = True
+        else:
+            chunk.append(current)
+            after_separator = False
+        is_first = False
+        current = following
+    chunk.append(current)
+    yield chunk
+
+
+def tokenize_slide(lines: List[str], title_marker: str) -> Iterator[Token]:
+    """Classify the lines of one slide.
     
-    # Parse YAML frontmatter and get remaining content
-    frontmatter, content = parse_yaml_frontmatter(content, frontmatter_delim)
+    Yields DIRECTIVE tokens (the title class marker as role 'class'), TITLE
+    and SECTION tokens, subtitle tokens (title slides) and raw content lines
+    as TEXT or SPACER tokens with role 'content'; content lines are turned
+    into final tokens by tokenize_content.
     
-    logging.info(f"Frontmatter keys: {list(frontmatter.keys())}")
-    logging.info(f"Content after frontmatter removal length: {len(content)}")
-    logging.debug(f"Content preview: {content[:200]}")
+    Blank lines become spacers once text has started; trailing spacers are
+    dropped.
     
-    # Split by slide separators
-    separator_pattern = f'\n{slide_separator}\n'
-    slides = re.split(separator_pattern, content)
+    Args:
+        lines: Lines of the slide
+        title_marker: Marker that makes a slide a title slide
+        
+    Yields:
+        Token objects in source order
+    """
+    is_title = title_marker in '\n'.join(lines)
+    if is_title:
+        yield Token(DIRECTIVE, 'title', role='class')
+    spacer_role = 'subtitle' if is_title else 'content'
     
-    logging.info(f"Number of slides found: {len(slides)}")
+    directives = {}  # directive name -> matched comment, removed wherever it appears
+    title = ''
+    has_content_started = False
+    pending_spacers = 0
     
-    parsed_slides = []
-    for idx, slide in enumerate(slides):
-        slide = slide.strip()
-        if not slide:
-            logging.debug(f"Slide {idx}: Empty, skipping")
-            continue
+    for line in lines:
+        if is_title:
+            line = line.replace(title_marker, '')
+        if '<!--' in line:
+            for match in _DIRECTIVE_PATTERN.finditer(line):
+                name = match.group(1)
+                if name not in directives:
+                    directives[name] = match.group(0)
+                    yield Token(DIRECTIVE, match.group(2).strip(), role=name)
+            for comment in directives.values():
+                line = line.replace(comment, '')
         
-        logging.debug(f"--- Parsing Slide {idx} ---")
-        logging.debug(f"Slide content preview: {slide[:100]}")
+        stripped = line.strip()
         
-        # Check for class directive
-        is_title = title_class in slide
-        slide = slide.replace(title_class, '').strip()
+        # Blank lines (and explicit markers) are held back so trailing ones can be dropped
+        if not stripped or stripped == SPACER_MARKER:
+            if has_content_started or stripped:
+                has_content_started = True
+                pending_spacers += 1
+            continue
         
-        logging.debug(f"Is title slide: {is_title}")
+        # Explicit section name marker (e.g., <!-- section: Name -->)
+        if stripped.startswith('<!-- section:') and stripped.endswith('-->'):
+            yield Token(SECTION, stripped.replace('<!-- section:', '').replace('-->', '').strip())
+            continue
+        if stripped.startswith('# '):
+            title = stripped.replace('#', '').strip()
+            yield Token(TITLE, title)
+            continue
+        if stripped.startswith('## ') and not is_title and not title:
+            # For content slides, ## can also be a title
+            title = stripped.replace('##', '').strip()
+            yield Token(TITLE, title)
+            continue
         
-        # Extract slide directives (layout, image_fit, bg_image)
-        directives, slide = parse_slide_directives(slide)
-        logging.debug(f"Slide directives: {directives}")
+        # H4 and H5 always go to content; on title slides everything else is subtitle
+        has_content_started = True
+        if is_title and not stripped.startswith(('#### ', '##### ')):
+            role = 'subtitle'
+        else:
+            role = 'content'
         
-        # Parse slide content
-        slide_data = _parse_slide_content(slide, is_title)
+        if pending_spacers and role == spacer_role:
+            spacer = Token(SPACER, line=SPACER_MARKER, role=role)
+            for _ in range(pending_spacers):
+                yield spacer
+            pending_spacers = 0
+        
+        if role == 'content':
+            yield Token(TEXT, stripped, 0, 0, stripped, role)
+        else:
+            yield _classify_subtitle_line(stripped)
+
+
+def tokenize_content(lines: Iterable[str]) -> Iterator[Token]:
+    """Turn content lines into typed tokens, removing inline HTML.
+    
+    HTML that spans several lines (a ``<div>`` block, or a tag broken over
+    lines) is collected into a single HTML token holding the raw markup,
+    followed by tokens for whatever text remains once tags are removed.
+    
+    Args:
+        lines: Content lines, with SPACER_MARKER for blank lines
         
-        # Merge directives into slide_data
-        slide_data.update(directives)
+    Yields:
+        HEADING, BULLET, NUMBERED, SPACER, TEXT and HTML tokens
+    """
+    pending = []
+    for line in lines:
+        if pending:
+            pending.append(line)
+            fragment = '\n'.join(pending)
+            if not _is_open_html(fragment):
+                pending = []
+                yield from _tokenize_html(fragment)
+            continue
         
-        logging.debug(f"Parsed slide data: {slide_data}")
-        parsed_slides.append(slide_data)
+        stripped = line.strip()
+        if '<' not in stripped or stripped == SPACER_MARKER:
+            token = _classify_line(stripped)
+            if token:
+                yield token
+        elif _is_open_html(stripped):
+            pending.append(line)
+        else:
+            yield from _tokenize_html(line)
     
-    logging.info(f"Total parsed slides: {len(parsed_slides)}")
-    return frontmatter, parsed_slides
+    if pending:
+        yield from _tokenize_html('\n'.join(pending))
 
 
-# Spacer marker used to represent intentional blank lines for spacing
-SPACER_MARKER = '<!-- spacer -->'
+def _is_open_html(fragment: str) -> bool:
+    """Check whether a fragment ends inside a div block or a tag."""
+    text = fragment.replace(SPACER_MARKER, ' ')
+    if '<div' not in text:
+        # Some tag is left open exactly when the last '<' has no '>' after it
+        return text.rfind('<') > text.rfind('>')
+    text = _DIV_BLOCK_PATTERN.sub('', text)
+    if _DIV_OPEN_PATTERN.search(text):
+        return True
+    return _UNCLOSED_TAG_PATTERN.search(_TAG_PATTERN.sub('', text)) is not None
 
 
-def _parse_slide_content(slide: str, is_title: bool) -> Dict[str, Any]:
-    """Parse individual slide content into structured data.
-    
-    Blank lines are converted to spacer markers to allow control over
-    vertical spacing in the rendered presentation. Consecutive blank
-    lines are preserved.
+def _tokenize_html(fragment: str) -> Iterator[Token]:
+    """Yield an HTML token for a fragment, then tokens for its text."""
+    yield Token(HTML, fragment)
+    for line in remove_html_tags(fragment).split('\n'):
+        token = _classify_line(line.strip())
+        if token:
+            yield token
+
+
+def _classify_line(line: str) -> Optional[Token]:
+    """Classify one stripped content line (None for blank lines)."""
+    if not line:
+        return None
+    if line == SPACER_MARKER:
+        return _CONTENT_SPACER
+    first = line[0]
+    if first == '#':
+        for prefix, level in _HEADING_PREFIXES:
+            if line.startswith(prefix):
+                return Token(HEADING, line[len(prefix):], level, 0, line)
+    elif first == '-':
+        if line.startswith('- '):
+            return Token(BULLET, line[2:], 0, 0, line)
+    elif first.isdigit():
+        match = _NUMBERED_PATTERN.match(line)
+        if match:
+            return Token(NUMBERED, match.group(2), 0, int(match.group(1)), line)
+    return Token(TEXT, line, 0, 0, line)
+
+
+def _classify_subtitle_line(line: str) -> Token:
+    """Classify one stripped, non-blank title slide subtitle line."""
+    if line == SPACER_MARKER:
+        return Token(SPACER, line=line, role='subtitle')
+    # Header level is kept for font size differentiation in the slide builder
+    if line.startswith('## '):
+        return Token(HEADING, line[3:].strip(), level=2, line=line, role='subtitle')
+    if line.startswith('### '):
+        return Token(HEADING, line[4:].strip(), level=3, line=line, role='subtitle')
+    return Token(TEXT, line, line=line, role='subtitle')
+
+
+def _split_html_tokens(tokens: Iterable[Token]) -> Tuple[List[Token], List[Dict[str, Any]]]:
+    """Separate HTML tokens from text tokens, extracting the images they reference."""
+    text_tokens = []
+    html_blocks = []
+    for token in tokens:
+        if token.kind == HTML:
+            html_blocks.append(token.text)
+        else:
+            text_tokens.append(token)
+    images = extract_images_from_html('\n'.join(html_blocks)) if html_blocks else []
+    return text_tokens, images
+
+
+def _build_slide_data(lines: List[str], title_marker: str) -> Dict[str, Any]:
+    """Collect the tokens of one slide into a slide dictionary.
     
     Args:
-        slide: Slide content string
-        is_title: Whether this is a title slide
+        lines: Lines of the slide
+        title_marker: Marker that makes a slide a title slide
         
     Returns:
         Dictionary with slide data
     """
-    lines = slide.split('\n')
+    is_title = False
+    section_name = ''
     title = ''
+    directives = {}
     subtitle_lines = []
+    subtitle_tokens = []
     content_lines = []
-    section_name = ''
-    has_content_started = False  # Track if we've seen non-header content
     
-    for line in lines:
-        line_stripped = line.strip()
-        
-        # Handle blank lines - convert to spacer markers after content has started
-        if not line_stripped:
-            if has_content_started and not is_title:
-                content_lines.append(SPACER_MARKER)
-                logging.debug("  -> Added spacer marker for blank line")
-            elif has_content_started and is_title:
-                subtitle_lines.append(SPACER_MARKER)
-                logging.debug("  -> Added spacer marker for blank line (title slide)")
-            continue
-        
-        line = line_stripped
-        
-        logging.debug(f"  Processing line: {line[:50]}")
-        
-        # Check for explicit section name marker (e.g., <!-- section: Name -->)
-        if line.startswith('<!-- section:') and line.endswith('-->'):
-            section_name = line.replace('<!-- section:', '').replace('-->', '').strip()
-            logging.debug(f"  -> Section name: {section_name}")
-        elif line.startswith('# ') and not line.startswith('## '):
-            title = line.replace('#', '').strip()
-            logging.debug(f"  -> Title: {title}")
-        elif line.startswith('## '):
-            if is_title:
-                # Preserve ## marker for font size differentiation in slide builder
-                subtitle_lines.append(line)
-                has_content_started = True
-                logging.debug(f"  -> Subtitle (##): {line}")
-            else:
-                # For content slides, ## can also be a title
-                if not title:
-                    title = line.replace('##', '').strip()
-                    logging.debug(f"  -> Title (from ##): {title}")
-                else:
-                    # If title already exists, treat ## as content
-                    content_lines.append(line)
-                    has_content_started = True
-                    logging.debug(f"  -> Content (##): {line}")
-        elif line.startswith('### '):
-            if is_title:
-                # Preserve ### marker for font size differentiation in slide builder
-                subtitle_lines.append(line)
-                has_content_started = True
-                logging.debug(f"  -> Subtitle (###): {line}")
+    for token in tokenize_slide(lines, title_marker):
+        if token.kind == DIRECTIVE:
+            if token.role == 'class':
+                is_title = True
             else:
-                content_lines.append(line)
-                has_content_started = True
-                logging.debug(f"  -> Content (###): {line}")
-        elif line.startswith('#### ') or line.startswith('##### '):
-            # H4 and H5 always go to content
-            content_lines.append(line)
-            has_content_started = True
-            logging.debug(f"  -> Content (####/####): {line}")
+                directives[token.role] = token.text
+        elif token.kind == TITLE:
+            title = token.text
+        elif token.kind == SECTION:
+            section_name = token.text
+        elif token.role == 'subtitle':
+            subtitle_lines.append(token.line)
+            subtitle_tokens.append(token)
         else:
-            # For title slides, plain text goes to subtitle area (e.g., author, date)
-            # For content slides, plain text goes to content area
-            if is_title:
-                subtitle_lines.append(line)
-                has_content_started = True
-                logging.debug(f"  -> Subtitle (plain text): {line[:50]}")
-            else:
-                content_lines.append(line)
-                has_content_started = True
-                logging.debug(f"  -> Content: {line[:50]}")
+            content_lines.append(token.line)
     
-    # Strip trailing spacer markers (they don't add value at the end)
-    while content_lines and content_lines[-1] == SPACER_MARKER:
-        content_lines.pop()
-    while subtitle_lines and subtitle_lines[-1] == SPACER_MARKER:
-        subtitle_lines.pop()
+    content_tokens, images = _split_html_tokens(tokenize_content(content_lines))
     
-    return {
+    slide_data = {
         'is_title': is_title,
         'section_name': section_name,
         'title': title,
         'subtitle': '\n'.join(subtitle_lines),
-        'content': '\n'.join(content_lines)
+        'content': '\n'.join(content_lines),
+        'subtitle_tokens': subtitle_tokens,
+        'content_tokens': content_tokens,
+        'images': images,
     }
+    slide_data.update(directives)
+    return slide_data
+
+
+def iter_markdown_slides(lines: Iterable[str], config: Config,
+                         memoize: bool = True) -> Iterator[Dict[str, Any]]:
+    """Parse markdown lines (after frontmatter) into slide dictionaries, lazily.
+    
+    Args:
+        lines: Markdown content split into lines
+        config: Configuration object
+        memoize: Reuse and remember parses in the slide cache
+        
+    Yields:
+        Parsed slide dictionaries
+    """
+    slide_separator = config.get('markdown.slide_separator', '---')
+    title_class = config.get('markdown.title_class_marker', '<!-- _class: title -->')
+    
+    for idx, chunk in enumerate(split_slides(lines, slide_separator)):
+        if not any(line.strip() for line in chunk):
+            logging.debug(f"Slide {idx}: Empty, skipping")
+            continue
+        if memoize:
+            yield _cached_slide_data(chunk, title_class)
+        else:
+            yield _build_slide_data(chunk, title_class)
+
+
+def _cached_slide_data(lines: List[str], title_marker: str) -> Dict[str, Any]:
+    """Return the parsed slide for these lines, reusing an earlier parse of the same text."""
+    key = (title_marker, '\n'.join(lines))
+    with _slide_cache_lock:
+        slide_data = _slide_cache.get(key)
+        if slide_data is not None:
+            _slide_cache.move_to_end(key)
+            return slide_data
+    
+    slide_data = _build_slide_data(lines, title_marker)
+    with _slide_cache_lock:
+        _slide_cache[key] = slide_data
+        while len(_slide_cache) > SLIDE_CACHE_SIZE:
+            _slide_cache.popitem(last=False)
+    return slide_data
+
+
+def clear_slide_cache() -> None:
+    """Forget every memoized slide parse."""
+    with _slide_cache_lock:
+        _slide_cache.clear()
+
+
+def parse_markdown_slides(md_file: Path, config: Config) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Parse markdown file into individual slides with metadata.
+    
+    Args:
+        md_file: Path to markdown file
+        config: Configuration object
+        
+    Returns:
+        Tuple of (frontmatter_meta, list of parsed slide dictionaries)
+    """
+    with open(md_file, 'r', encoding='utf-8') as f:
+        return parse_markdown_text(f.read(), config)
+
+
+def iter_markdown_file(md_file: Path, config: Config) -> Tuple[Dict[str, Any], Iterator[Dict[str, Any]]]:
+    """Parse a markdown file lazily: the frontmatter up front, slides as they are read.
+    
+    Only the lines of the slide being parsed are held in memory, and slides
+    are not memoized, so memory does not grow with the size of the deck.
+    
+    Args:
+        md_file: Path to markdown file
+        config: Configuration object
+        
+    Returns:
+        Tuple of (frontmatter_meta, iterator of parsed slide dictionaries)
+    """
+    frontmatter_delim = config.get('markdown.frontmatter_delimiter', '---')
+    frontmatter, lines = _split_frontmatter_lazy(_iter_file_lines(md_file), frontmatter_delim)
+    logging.info(f"Frontmatter keys: {list(frontmatter.keys())}")
+    return frontmatter, iter_markdown_slides(lines, config, memoize=False)
+
+
+def parse_markdown_text(text: str, config: Config) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Parse markdown text into individual slides with metadata.
+    
+    Args:
+        text: Markdown content, including any frontmatter
+        config: Configuration object
+        
+    Returns:
+        Tuple of (frontmatter_meta, list of parsed slide dictionaries)
+    """
+    lines = text.split('\n')
+    
+    frontmatter_delim = config.get('markdown.frontmatter_delimiter', '---')
+    frontmatter, lines = _split_frontmatter(lines, frontmatter_delim)
+    logging.info(f"Frontmatter keys: {list(frontmatter.keys())}")
+    
+    parsed_slides = list(iter_markdown_slides(lines, config))
+    
+    logging.info(f"Total parsed slides: {len(parsed_slides)}")
+    return frontmatter, parsed_slides
+
+
+def get_content_tokens(slide_data: Dict[str, Any]) -> Tuple[List[Token], List[Dict[str, Any]]]:
+    """Return a slide's content tokens and the images its HTML references.
+    
+    Slides from parse_markdown_slides carry their tokens; hand-built slide
+    dictionaries with only a 'content' string are tokenized here.
+    
+    Args:
+        slide_data: Slide dictionary
+        
+    Returns:
+        Tuple of (content tokens without HTML tokens, image attribute dicts)
+    """
+    if 'content_tokens' in slide_data:
+        return slide_data['content_tokens'], slide_data.get('images', [])
+    return _split_html_tokens(tokenize_content(slide_data.get('content', '').split('\n')))
+
+
+def get_subtitle_tokens(slide_data: Dict[str, Any]) -> List[Token]:
+    """Return a title slide's subtitle tokens (see get_content_tokens).
+    
+    Args:
+        slide_data: Slide dictionary
+        
+    Returns:
+        SPACER, HEADING (levels 2 and 3) and TEXT tokens
+    """
+    if 'subtitle_tokens' in slide_data:
+        return slide_data['subtitle_tokens']
+    
+    return [_classify_subtitle_line(line.strip())
+            for line in slide_data.get('subtitle', '').split('\n') if line.strip()]
@@ -0,0 +1,414 @@
+"""Writing generated presentations as .pptx (OPC ZIP) packages.
+
+save_presentation() replaces Presentation.save() for generated decks. It
+writes the same parts as python-pptx but chooses the compression per part:
+media that is already compressed (PNG, JPEG, GIF, audio and video) is stored
+as is (package.store_media), since deflating it again costs CPU for almost no
+size gain, and XML is deflated at package.compress_level.
+
+File-backed image parts (images.FileImagePart) are copied from their source
+files in chunks, so no image is ever held in memory whole while saving.
+
+Parts are serialized and compressed on a thread pool (package.compress_threads),
+which runs in parallel because zlib releases the GIL, and written to the ZIP
+in the same order and with the same bytes as a sequential save.
+
+With package.deterministic the bytes depend only on the deck's content, so
+identical inputs always hash identically:
+
+- every ZIP entry gets the same timestamp (SOURCE_DATE_EPOCH when set,
+  otherwise 1980-01-01, the earliest time a ZIP entry can record) and the
+  same host system and permission bits
+- parts are written in partname order, each followed by its .rels part,
+  instead of the order of the relationship graph walk
+- the docProps modified time is set to the same timestamp
+
+StreamingPackageWriter writes each slide (and the images it introduces) as
+soon as it is built and drops its XML, writing the rest of the package when
+the deck is complete (package.streaming). Its part order is build order, not
+partname order, so it differs from save_presentation() output even though
+the parts are identical.
+
+Slide, shape and relationship ids are already assigned sequentially by the
+builders, so they are stable without further work. Byte equality holds for
+the same zlib build; a different zlib may compress the same parts
+differently.
+"""
+
+import os
+import shutil
+import time
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from pptx.opc.serialized import PackageWriter
+from pptx.oxml import parse_xml
+from typing import Dict, Any, BinaryIO, Callable, Iterator, List, Optional, Set, Tuple, Union
+from .config import Config
+
+# Earliest timestamp a ZIP entry can hold (MS-DOS date format)
+ZIP_EPOCH = datetime(1980, 1, 1, tzinfo=timezone.utc)
+
+# Permission bits zipfile.writestr() gives entries added by name
+_ENTRY_ATTRIBUTES = 0o600 << 16
+
+# "Created on" system of every entry in deterministic mode (3 = Unix)
+_ENTRY_CREATE_SYSTEM = 3
+
+# Extensions of parts whose formats are already compressed
+STORED_EXTENSIONS = frozenset({
+    'png', 'jpg', 'jpeg', 'jpe', 'jfif', 'gif',
+    'mp3', 'm4a', 'wma', 'mp4', 'm4v', 'mov', 'wmv',
+})
+
+# zlib's default, which python-pptx uses for every part
+DEFAULT_COMPRESS_LEVEL = 6
+
+# Upper bound for package.compress_threads: 0 (one thread per available CPU)
+MAX_COMPRESS_THREADS = 8
+
+# Parts in flight per compression thread, bounding the extra memory held
+_PARTS_PER_THREAD = 8
+
+# Chunk size for copying file-backed parts into the archive
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+# What a slide part keeps of its XML once the slide is written out
+_RELEASED_SLIDE_XML = (
+    '<p:sld xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+    'xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main">'
+    '<p:cSld><p:spTree/></p:cSld></p:sld>'
+)
+
+
+def deterministic_timestamp() -> datetime:
+    """Timestamp used for ZIP entries and docProps in deterministic mode.
+
+    Honours the SOURCE_DATE_EPOCH convention of reproducible builds, clamped
+    to the range a ZIP entry can represent.
+
+    Returns:
+        Timezone-aware UTC datetime
+    """
+    epoch = os.environ.get('SOURCE_DATE_EPOCH')
+    if not epoch:
+        return ZIP_EPOCH
+    try:
+        timestamp = datetime.fromtimestamp(int(epoch), tz=timezone.utc)
+    except (ValueError, OverflowError, OSError):
+        raise ValueError(f"SOURCE_DATE_EPOCH must be an integer Unix timestamp, got {epoch!r}")
+    return max(timestamp, ZIP_EPOCH)
+
+
+def compress_threads(config: Config) -> int:
+    """Number of threads compressing parts while saving.
+
+    Args:
+        config: Configuration object (package.compress_threads; 0 = one per
+            available CPU, up to MAX_COMPRESS_THREADS)
+
+    Returns:
+        Thread count (1 compresses on the calling thread)
+    """
+    threads = config.get('package.compress_threads', 0)
+    if not isinstance(threads, int) or threads < 0:
+        raise ValueError(f"package.compress_threads must be a non-negative integer, got {threads!r}")
+    if threads == 0:
+        try:
+            cpus = len(os.sched_getaffinity(0))
+        except AttributeError:
+            cpus = os.cpu_count() or 1
+        threads = min(cpus, MAX_COMPRESS_THREADS)
+    return threads
+
+
+def package_settings(config: Config) -> Dict[str, Any]:
+    """Settings that affect the package bytes but not the slides.
+
+    Part of the result cache fingerprint, since the incremental build key
+    leaves the package section out.
+
+    Args:
+        config: Configuration object (package section)
+
+    Returns:
+        JSON-serializable dictionary
+    """
+    deterministic = bool(config.get('package.deterministic', False))
+    level = config.get('package.compress_level', DEFAULT_COMPRESS_LEVEL)
+    if not isinstance(level, int) or not 0 <= level <= 9:
+        raise ValueError(f"package.compress_level must be an integer from 0 to 9, got {level!r}")
+    return {
+        'deterministic': deterministic,
+        'timestamp': deterministic_timestamp().isoformat() if deterministic else None,
+        'store_media': bool(config.get('package.store_media', True)),
+        'compress_level': level,
+        'streaming': bool(config.get('package.streaming', False)),
+    }
+
+
+class _ZipWriter:
+    """Physical package writer with per-part compression and optional fixed entry metadata."""
+
+    def __init__(self, pkg_file: Union[str, BinaryIO], date_time: Optional[Tuple[int, ...]],
+                 compress_level: int, store_media: bool):
+        self._zipf = zipfile.ZipFile(pkg_file, 'w', compression=zipfile.ZIP_DEFLATED,
+                                     compresslevel=compress_level, strict_timestamps=False)
+        self._date_time = date_time
+        self._compress_level = compress_level
+        self._store_media = store_media
+
+    def __enter__(self) -> '_ZipWriter':
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Write the central directory and close the archive."""
+        self._zipf.close()
+
+    def _zipinfo(self, pack_uri) -> zipfile.ZipInfo:
+        """Entry for a member, with the metadata ZipFile.writestr() would give it."""
+        date_time = self._date_time or time.localtime(time.time())[:6]
+        info = zipfile.ZipInfo(pack_uri.membername, date_time=date_time)
+        info.compress_type = zipfile.ZIP_DEFLATED
+        if self._store_media and pack_uri.ext.lower() in STORED_EXTENSIONS:
+            info.compress_type = zipfile.ZIP_STORED
+        info.external_attr = _ENTRY_ATTRIBUTES
+        if self._date_time is not None:
+            info.create_system = _ENTRY_CREATE_SYSTEM
+        return info
+
+    def write(self, pack_uri, blob: bytes) -> None:
+        """Write one part (or .rels item) under its member name."""
+        self._zipf.writestr(self._zipinfo(pack_uri), blob, compresslevel=self._compress_level)
+
+    def write_file(self, pack_uri, path: Path, size: int) -> None:
+        """Copy a file into the archive in chunks, with the bytes write() would produce.
+
+        Args:
+            pack_uri: Member to write
+            path: Source file
+            size: Expected file size, fixing the entry format up front
+        """
+        info = self._zipinfo(pack_uri)
+        info.file_size = size
+        # What writestr(compresslevel=...) sets; ZipFile.open() takes the level from here
+        info._compresslevel = self._compress_level
+        with open(path, 'rb') as src:
+            if os.fstat(src.fileno()).st_size != size:
+                raise RuntimeError(f"{path} changed while the presentation was being generated")
+            with self._zipf.open(info, 'w') as dest:
+                shutil.copyfileobj(src, dest, _COPY_CHUNK_SIZE)
+
+    def write_part(self, part) -> None:
+        """Write a part and its .rels item, copying file-backed parts from disk."""
+        source_path = getattr(part, 'source_path', None)
+        if source_path is not None:
+            self.write_file(part.partname, source_path, part.source_size)
+        else:
+            self.write(part.partname, part.blob)
+        if part._rels:
+            self.write(part.partname.rels_uri, part.rels.xml)
+
+    def compress(self, pack_uri, blob: bytes) -> Tuple[zipfile.ZipInfo, bytes]:
+        """Compress a member for write_compressed(); safe to call from any thread.
+
+        Produces the same bytes ZipFile would: raw deflate at the configured
+        level and the CRC32 of the uncompressed data.
+        """
+        info = self._zipinfo(pack_uri)
+        info.file_size = len(blob)
+        info.CRC = zlib.crc32(blob)
+        if info.compress_type == zipfile.ZIP_DEFLATED:
+            compressor = zlib.compressobj(self._compress_level, zlib.DEFLATED, -15)
+            data = compressor.compress(blob) + compressor.flush()
+        else:
+            data = blob
+        info.compress_size = len(data)
+        return info, data
+
+    def write_compressed(self, info: zipfile.ZipInfo, data: bytes) -> None:
+        """Append a member returned by compress().
+
+        zipfile cannot add precompressed data, so this writes the local header
+        and data itself and registers the entry for the central directory that
+        ZipFile.close() writes. Sizes and CRC are known up front, so no data
+        descriptor is needed even on unseekable streams.
+        """
+        zipf = self._zipf
+        zip64 = info.file_size * 1.05 > zipfile.ZIP64_LIMIT
+        with zipf._lock:
+            info.flag_bits = 0
+            info.header_offset = zipf.fp.tell()
+            zipf._writecheck(info)
+            zipf._didModify = True
+            zipf.fp.write(info.FileHeader(zip64))
+            zipf.fp.write(data)
+            zipf.start_dir = zipf.fp.tell()
+            zipf.filelist.append(info)
+            zipf.NameToInfo[info.filename] = info
+
+
+class _PackageWriter(PackageWriter):
+    """python-pptx's package writer on top of _ZipWriter, compressing parts on a thread pool."""
+
+    def __init__(self, pkg_file: Union[str, BinaryIO], pkg_rels, parts,
+                 date_time: Optional[Tuple[int, ...]], compress_level: int, store_media: bool,
+                 threads: int):
+        super().__init__(pkg_file, pkg_rels, parts)
+        self._date_time = date_time
+        self._compress_level = compress_level
+        self._store_media = store_media
+        self._threads = threads
+
+    def _write(self) -> None:
+        with _ZipWriter(self._pkg_file, self._date_time, self._compress_level,
+                        self._store_media) as phys_writer:
+            self._write_content_types_stream(phys_writer)
+            self._write_pkg_rels(phys_writer)
+            self._write_parts(phys_writer)
+
+    def _members(self) -> List[Tuple[Any, Optional[Callable[[], bytes]], Any]]:
+        """(pack URI, serializer, file-backed part or None) of every member, in write order."""
+        members = []
+        for part in self._parts:
+            if getattr(part, 'source_path', None) is not None:
+                members.append((part.partname, None, part))
+            else:
+                members.append((part.partname, lambda part=part: part.blob, None))
+            if part._rels:
+                members.append((part.partname.rels_uri, lambda part=part: part.rels.xml, None))
+        return members
+
+    def _write_parts(self, phys_writer: _ZipWriter) -> None:
+        if self._threads <= 1:
+            for part in self._parts:
+                phys_writer.write_part(part)
+            return
+
+        def prepare(member) -> Callable[[], None]:
+            """Serialize and compress on a pool thread; return the write for the main thread."""
+            pack_uri, serialize, file_part = member
+            if file_part is not None:
+                # Copied in chunks on the main thread rather than read whole here
+                return lambda: phys_writer.write_file(pack_uri, file_part.source_path,
+                                                      file_part.source_size)
+            info, data = phys_writer.compress(pack_uri, serialize())
+            return lambda: phys_writer.write_compressed(info, data)
+
+        with ThreadPoolExecutor(max_workers=self._threads,
+                                thread_name_prefix='pptx-compress') as pool:
+            for write in _ordered_map(pool, prepare, self._members(),
+                                      self._threads * _PARTS_PER_THREAD):
+                write()
+
+
+def _ordered_map(pool: ThreadPoolExecutor, fn: Callable, items: List, window: int) -> Iterator:
+    """Like pool.map, but with at most `window` results pending at a time."""
+    pending = []
+    for item in items:
+        pending.append(pool.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.pop(0).result()
+    for future in pending:
+        yield future.result()
+
+
+def _zip_date_time(settings: Dict[str, Any], prs) -> Optional[Tuple[int, ...]]:
+    """Fixed ZIP entry time for deterministic mode (None otherwise), pinning docProps to it."""
+    if not settings['deterministic']:
+        return None
+    timestamp = deterministic_timestamp()
+    # Strip the timezone: core properties are written as UTC
+    prs.core_properties.modified = timestamp.replace(tzinfo=None)
+    return timestamp.timetuple()[:6]
+
+
+class StreamingPackageWriter:
+    """Writes slides into a .pptx as they are built, then the rest of the package on close().
+    
+    Once flushed, a slide part keeps only its relationships (and a stub
+    element) and an EmbeddedImagePart drops its bytes, so memory holds the
+    package skeleton plus the slide being built, whatever the deck size.
+    """
+
+    def __init__(self, prs, target: Union[str, Path, BinaryIO], config: Config):
+        """Open the output package.
+
+        Args:
+            prs: Presentation the slides are added to
+            target: Output path or writable binary stream
+            config: Configuration object (package section)
+        """
+        if isinstance(target, Path):
+            target = str(target)
+        settings = package_settings(config)
+        self._prs = prs
+        self._zip = _ZipWriter(target, _zip_date_time(settings, prs), settings['compress_level'],
+                               settings['store_media'])
+        self._written: Set[str] = set()
+
+    def _write_part(self, part) -> None:
+        self._zip.write_part(part)
+        self._written.add(part.partname)
+
+    def flush_slide(self, slide) -> None:
+        """Write a finished slide and the new images it uses, then drop their content.
+
+        Args:
+            slide: Slide that will not be modified again
+        """
+        slide_part = slide.part
+        for rel in slide_part.rels.values():
+            if rel.is_external:
+                continue
+            target = rel.target_part
+            if target.partname in self._written or not hasattr(target, 'release_blob'):
+                continue
+            self._write_part(target)
+            target.release_blob()
+        self._write_part(slide_part)
+        slide_part._element = parse_xml(_RELEASED_SLIDE_XML)
+        slide_part.__dict__.pop('slide', None)
+
+    def discard(self) -> None:
+        """Close the output after a failed build; the package is left incomplete."""
+        self._zip.close()
+
+    def close(self) -> None:
+        """Write every part not flushed yet, the content types and package relationships."""
+        package = self._prs.part.package
+        try:
+            parts = tuple(package.iter_parts())
+            for part in parts:
+                if part.partname not in self._written:
+                    self._write_part(part)
+            writer = PackageWriter(None, package._rels, parts)
+            writer._write_content_types_stream(self._zip)
+            writer._write_pkg_rels(self._zip)
+        finally:
+            self._zip.close()
+
+
+def save_presentation(prs, target: Union[str, Path, BinaryIO], config: Config) -> None:
+    """Save a presentation with per-part compression, reproducibly when package.deterministic is set.
+
+    Args:
+        prs: Presentation to save
+        target: Output path or writable binary stream
+        config: Configuration object (package section)
+    """
+    if isinstance(target, Path):
+        target = str(target)
+    settings = package_settings(config)
+    package = prs.part.package
+    parts = tuple(package.iter_parts())
+    date_time = _zip_date_time(settings, prs)
+    if settings['deterministic']:
+        parts = tuple(sorted(parts, key=lambda part: part.partname))
+    _PackageWriter(target, package._rels, parts, date_time, settings['compress_level'],
+                   settings['store_media'], compress_threads(config))._write()
@@ -0,0 +1,136 @@
+"""Whole-deck result cache: skip generation entirely when nothing changed.
+
+A deck is fingerprinted from everything that affects its bytes: the parsed
+slides and frontmatter, the rendering configuration, the template, every
+referenced image (see incremental.slide_fingerprint) and the generator code
+itself. On a hit the previously generated .pptx is copied or returned
+without building a single slide. Entries live in an ArtifactStore keyed by
+the fingerprint, bounded by result_cache.max_mb with least recently used
+eviction.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+from .artifact_store import ArtifactStore
+from .config import Config
+from .incremental import build_key, slide_fingerprint
+from .package_writer import package_settings
+
+# Bump when cached decks must not be reused even though inputs are unchanged
+RESULT_CACHE_VERSION = 1
+
+_code_fingerprint: Optional[str] = None
+
+
+def code_fingerprint() -> str:
+    """Hash of this package's source and the python-pptx version, computed once per process."""
+    global _code_fingerprint
+    if _code_fingerprint is None:
+        import pptx
+        h = hashlib.sha1(f"{RESULT_CACHE_VERSION}\n{pptx.__version__}".encode('utf-8'))
+        for source in sorted(Path(__file__).parent.glob('*.py')):
+            h.update(source.name.encode('utf-8'))
+            h.update(source.read_bytes())
+        _code_fingerprint = h.hexdigest()
+    return _code_fingerprint
+
+
+def deck_fingerprint(config: Config, frontmatter: Dict[str, Any],
+                     slides: List[Dict[str, Any]], template_sha1: str) -> str:
+    """Fingerprint every input of a deck.
+
+    Args:
+        config: Configuration object
+        frontmatter: Parsed frontmatter
+        slides: Parsed slide dictionaries
+        template_sha1: SHA1 of the template bytes
+
+    Returns:
+        Hex digest
+    """
+    h = hashlib.sha1(code_fingerprint().encode('utf-8'))
+    h.update(build_key(config, template_sha1).encode('utf-8'))
+    h.update(json.dumps(package_settings(config), sort_keys=True).encode('utf-8'))
+    h.update(json.dumps(frontmatter, sort_keys=True, default=str).encode('utf-8'))
+    for slide_data in slides:
+        h.update(slide_fingerprint(slide_data, config).encode('utf-8'))
+    return h.hexdigest()
+
+
+class ResultCache:
+    """Generated decks keyed by deck fingerprint, with hit and miss counters."""
+
+    def __init__(self, store: ArtifactStore):
+        """Initialize the cache.
+
+        Args:
+            store: Store holding the cached decks
+        """
+        self.store = store
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, key: str) -> Optional[Path]:
+        """Return the cached deck for a fingerprint, counting the hit or miss.
+
+        Args:
+            key: Deck fingerprint
+
+        Returns:
+            Path to the cached .pptx, or None on a miss
+        """
+        path = self.store.path(key)
+        if path is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        logging.info(f"Result cache {'hit' if path else 'miss'} for {key[:12]} "
+                     f"({self.hits} hit(s), {self.misses} miss(es) in this process)")
+        return path
+
+    def add(self, key: str, data: bytes) -> None:
+        """Cache generated deck bytes under a fingerprint."""
+        self.store.put(data, handle=key)
+
+    def add_file(self, key: str, path: Path) -> None:
+        """Cache a generated deck file under a fingerprint."""
+        self.store.put_file(path, handle=key)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit and miss counts plus the stored entry count and size."""
+        return {'hits': self.hits, 'misses': self.misses, **self.store.stats()}
+
+
+# Caches keyed by resolved directory
+_caches: Dict[str, ResultCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_result_cache(config: Config) -> Optional[ResultCache]:
+    """Return the shared result cache, or None when result_cache.enabled is false.
+
+    Args:
+        config: Configuration object (result_cache.enabled, result_cache.dir, result_cache.max_mb)
+
+    Returns:
+        Shared ResultCache instance, or None
+    """
+    if not config.get('result_cache.enabled', False):
+        return None
+    root = Path(config.get('result_cache.dir', '.cache/results'))
+    if not root.is_absolute():
+        root = config.project_root / root
+    max_bytes = int(config.get('result_cache.max_mb', 256) * 1024 * 1024)
+
+    key = str(root.resolve())
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = _caches[key] = ResultCache(ArtifactStore(root, max_bytes))
+        else:
+            cache.store.max_bytes = max_bytes
+    return cache
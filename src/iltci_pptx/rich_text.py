@@ -2,7 +2,7 @@
 
 import re
 from pptx.oxml.xmlchemy import OxmlElement
-from typing import TYPE_CHECKING
+from typing import List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from pptx.text.text import _Paragraph
@@ -49,24 +49,25 @@ def add_numbering(paragraph: '_Paragraph', start_at: int = 1, numbering_type: st
     pPr.insert(0, buAutoNum)
 
 
-def add_formatted_text(paragraph: '_Paragraph', text: str) -> None:
-    """Add text to a paragraph with markdown formatting support.
-    
-    Supports **bold**, *italic*, ***bold+italic***, and [text](url) markdown syntax.
+# Markdown formatting including links: [text](url) links, ***text*** (bold+italic),
+# **text** (bold), or *text* (italic)
+FORMAT_PATTERN = re.compile(r'(\[.*?\]\(.*?\)|\*\*\*.*?\*\*\*|\*\*.*?\*\*|\*.*?\*)')
+LINK_PATTERN = re.compile(r'\[(.*?)\]\((.*?)\)')
+
+
+def formatted_spans(text: str) -> List[Tuple[str, bool, bool, Optional[str]]]:
+    """Split text with markdown formatting into runs of uniform formatting.
     
     Args:
-        paragraph: PowerPoint paragraph object
         text: Text with markdown formatting
+        
+    Returns:
+        List of (text, bold, italic, url) tuples; url is None except for links
     """
-    # Clear any existing text
-    paragraph.text = ""
-    
-    # Pattern to match markdown formatting including links
-    # Matches [text](url) links, ***text*** (bold+italic), **text** (bold), or *text* (italic)
-    pattern = r'(\[.*?\]\(.*?\)|\*\*\*.*?\*\*\*|\*\*.*?\*\*|\*.*?\*)'
+    spans = []
     
     # Split text by markdown patterns
-    parts = re.split(pattern, text)
+    parts = FORMAT_PATTERN.split(text)
     
     for part in parts:
         if not part:
@@ -76,33 +77,46 @@ def add_formatted_text(paragraph: '_Paragraph', text: str) -> None:
         if part.startswith('[') and part.endswith(')') and '](' in part:
             # Markdown link [text](url)
             # Extract the link text and URL
-            link_match = re.match(r'\[(.*?)\]\((.*?)\)', part)
+            link_match = LINK_PATTERN.match(part)
             if link_match:
-                link_text = link_match.group(1)
-                link_url = link_match.group(2)
-                run = paragraph.add_run()
-                run.text = link_text
-                # Add hyperlink
-                run.hyperlink.address = link_url
-                # Add underline for visibility (PowerPoint will handle color)
-                run.font.underline = True
+                spans.append((link_match.group(1), False, False, link_match.group(2)))
         elif part.startswith('***') and part.endswith('***'):
             # Bold and italic
-            run = paragraph.add_run()
-            run.text = part[3:-3]
-            run.font.bold = True
-            run.font.italic = True
+            spans.append((part[3:-3], True, True, None))
         elif part.startswith('**') and part.endswith('**'):
             # Bold
-            run = paragraph.add_run()
-            run.text = part[2:-2]
-            run.font.bold = True
+            spans.append((part[2:-2], True, False, None))
         elif part.startswith('*') and part.endswith('*'):
             # Italic
-            run = paragraph.add_run()
-            run.text = part[1:-1]
-            run.font.italic = True
+            spans.append((part[1:-1], False, True, None))
         else:
             # Regular text
-            run = paragraph.add_run()
-            run.text = part
+            spans.append((part, False, False, None))
+    
+    return spans
+
+
+def add_formatted_text(paragraph: '_Paragraph', text: str) -> None:
+    """Add text to a paragraph with markdown formatting support.
+    
+    Supports **bold**, *italic*, ***bold+italic***, and [text](url) markdown syntax.
+    
+    Args:
+        paragraph: PowerPoint paragraph object
+        text: Text with markdown formatting
+    """
+    # Clear any existing text
+    paragraph.text = ""
+    
+    for span_text, bold, italic, url in formatted_spans(text):
+        run = paragraph.add_run()
+        run.text = span_text
+        if url is not None:
+            # Add hyperlink
+            run.hyperlink.address = url
+            # Add underline for visibility (PowerPoint will handle color)
+            run.font.underline = True
+        if bold:
+            run.font.bold = True
+        if italic:
+            run.font.italic = True
@@ -0,0 +1,160 @@
+"""Constant-time allocation of slide and image names in a growing presentation.
+
+python-pptx finds the next free name by scanning what is already there:
+every add_slide() renames all slide parts, looks through every
+relationship of the presentation part and takes the maximum of all slide
+ids, and every new image part walks the whole package for the next
+/ppt/media/imageN number. Building a deck therefore gets quadratically
+slower with its slide count.
+
+An Allocator keeps those numbers in counters per package, seeded once from
+what the presentation already contains, so appending a slide or an image
+part is O(1). The names handed out are the ones python-pptx would choose,
+so output is unchanged. Per-slide relationships (pictures, hyperlinks)
+still go through python-pptx; they only scan the few relationships of
+their own slide.
+"""
+
+import weakref
+from pptx.enum.shapes import PP_PLACEHOLDER
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.packuri import PackURI
+from pptx.parts.slide import SlidePart
+from typing import List, Optional, Set, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pptx.presentation import Presentation
+    from pptx.slide import Slide, SlideLayout
+
+# Slide ids valid in a p:sldId element
+MIN_SLIDE_ID = 256
+MAX_SLIDE_ID = 2147483647
+
+
+class Allocator:
+    """Next slide partname, slide id and image partname of one presentation."""
+
+    def __init__(self, presentation_part):
+        self.presentation_part = presentation_part
+        self._sld_id_lst = presentation_part._element.get_or_add_sldIdLst()
+        self._last_sld_id = None
+        self._slide_count = 0
+        self._next_slide_id = MIN_SLIDE_ID
+        self._image_idxs: Optional[Set[int]] = None
+        self._next_image_idx = 1
+        self._sync_slides()
+
+    def _sync_slides(self) -> None:
+        """Seed the slide counters from the slide id list (one full scan)."""
+        sld_ids = list(self._sld_id_lst.sldId_lst)
+        self._slide_count = len(sld_ids)
+        self._next_slide_id = max([MIN_SLIDE_ID - 1] + [sld_id.id for sld_id in sld_ids]) + 1
+        self._last_sld_id = sld_ids[-1] if sld_ids else None
+
+    def _check_slides(self) -> None:
+        """Rescan if slides were added or removed behind the allocator's back."""
+        try:
+            last = self._sld_id_lst[-1]
+        except IndexError:
+            last = None
+        if last is not self._last_sld_id:
+            self._sync_slides()
+
+    def next_slide_partname(self) -> PackURI:
+        """Partname for the next slide, like python-pptx's /ppt/slides/slideN.xml."""
+        self._check_slides()
+        return PackURI(f"/ppt/slides/slide{self._slide_count + 1}.xml")
+
+    def append_slide(self, slide_part: SlidePart) -> str:
+        """Relate a new slide part to the presentation and append it to the slide list.
+
+        Args:
+            slide_part: Slide part not yet related to the presentation
+
+        Returns:
+            rId of the new relationship
+        """
+        self._check_slides()
+        # A new part cannot be related already, so skip python-pptx's search for a match
+        rId = self.presentation_part.rels._add_relationship(RT.SLIDE, slide_part)
+        slide_id = self._next_slide_id
+        if slide_id > MAX_SLIDE_ID:
+            # Ids are exhausted; let python-pptx search for a gap
+            slide_id = self._sld_id_lst._next_id
+        self._last_sld_id = self._sld_id_lst._add_sldId(id=slide_id, rId=rId)
+        self._slide_count += 1
+        self._next_slide_id = max(self._next_slide_id, slide_id + 1)
+        return rId
+
+    def next_image_partname(self, ext: str) -> PackURI:
+        """Reserve the first free /ppt/media/imageN partname, as python-pptx numbers them.
+
+        Args:
+            ext: File extension without the dot
+
+        Returns:
+            Partname for a new image part
+        """
+        if self._image_idxs is None:
+            self._image_idxs = {
+                part.partname.idx for part in self.presentation_part.package.iter_parts()
+                if part.partname.startswith('/ppt/media/image') and part.partname.idx is not None
+            }
+        while self._next_image_idx in self._image_idxs:
+            self._next_image_idx += 1
+        idx = self._next_image_idx
+        self._image_idxs.add(idx)
+        return PackURI(f"/ppt/media/image{idx}.{ext}")
+
+
+# Allocators keyed by package, so they go away with the presentation
+_allocators: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+
+
+def get_allocator(package) -> Allocator:
+    """Return the allocator of a python-pptx package, creating it on first use."""
+    allocator = _allocators.get(package)
+    if allocator is None:
+        allocator = _allocators[package] = Allocator(package.presentation_part)
+    return allocator
+
+
+# Placeholders each layout clones onto new slides, with and without pictures, keyed by layout part
+_layout_placeholders: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+
+
+def _cloneable_placeholders(slide_layout: 'SlideLayout') -> Tuple[List, List]:
+    """Return the layout's cloneable placeholders, all and without pictures, read once per layout."""
+    cached = _layout_placeholders.get(slide_layout.part)
+    if cached is None:
+        placeholders = list(slide_layout.iter_cloneable_placeholders())
+        cached = _layout_placeholders[slide_layout.part] = (
+            placeholders,
+            [ph for ph in placeholders if ph.placeholder_format.type != PP_PLACEHOLDER.PICTURE],
+        )
+    return cached
+
+
+def add_slide(prs: 'Presentation', slide_layout: 'SlideLayout',
+              clone_pictures: bool = True) -> 'Slide':
+    """Append a slide, equivalent to prs.slides.add_slide but O(1) in the slide count.
+
+    Args:
+        prs: PowerPoint presentation object
+        slide_layout: Layout the new slide inherits from
+        clone_pictures: Also clone picture placeholders. Builders that place
+            pictures themselves pass False, so no empty placeholder is left
+            on the slide.
+
+    Returns:
+        The new slide, with the layout's placeholders cloned
+    """
+    allocator = get_allocator(prs.part.package)
+    slide_part = SlidePart.new(allocator.next_slide_partname(), prs.part.package, slide_layout.part)
+    allocator.append_slide(slide_part)
+    slide = slide_part.slide
+    # Same as slide.shapes.clone_layout_placeholders, without re-reading the layout
+    all_placeholders, without_pictures = _cloneable_placeholders(slide_layout)
+    for placeholder in (all_placeholders if clone_pictures else without_pictures):
+        slide.shapes.clone_placeholder(placeholder)
+    return slide
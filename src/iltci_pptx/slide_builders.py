@@ -2,15 +2,20 @@
 
 import re
 import logging
+from lxml import etree
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
-from typing import Dict, Any, TYPE_CHECKING
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
 from .config import Config
 from .rich_text import add_formatted_text, add_bullet, remove_bullet, add_numbering
-from .html_media import has_html_content, extract_images_from_html, remove_html_tags
-from .images import add_images_to_slide, add_images_for_layout, add_background_image, add_overlay_rectangle, LAYOUT_SPECS
-from .markdown_parser import SPACER_MARKER
+from .images import (add_images_to_slide, add_images_for_layout, add_background_image,
+                     add_overlay_rectangle, set_background_image, LAYOUT_SPECS)
+from .slide_alloc import add_slide
+from .text_emitter import content_templates, emit_content_paragraphs
+from .timing import timed
+from .template_layouts import BODY_IDX, is_prebaked_layout
+from .markdown_parser import Token, HEADING, BULLET, NUMBERED, SPACER, get_content_tokens, get_subtitle_tokens
 from pathlib import Path
 
 if TYPE_CHECKING:
@@ -35,7 +40,7 @@ def build_title_slide(prs: 'Presentation', slide_data: Dict[str, Any], config: C
     if len(all_layouts) == 0:
         raise IndexError("No slide layouts available in template")
     
-    slide = prs.slides.add_slide(all_layouts[layout_idx])
+    slide = add_slide(prs, all_layouts[layout_idx])
     logging.info(f"Using layout {layout_idx} ({all_layouts[layout_idx].name}), {len(slide.shapes)} shapes")
     
     # Debug: print all shapes
@@ -54,93 +59,82 @@ def build_title_slide(prs: 'Presentation', slide_data: Dict[str, Any], config: C
     return slide
 
 
+def _title_slide_style(config: Config) -> Dict[str, Any]:
+    """Text box positions, font sizes and bold flags for title slides, read from config once.
+    
+    Args:
+        config: Configuration object
+        
+    Returns:
+        Dictionary of (left, top, width, height) boxes, Pt sizes and bold flags
+    """
+    def box(name: str, left: float, top: float, width: float, height: float) -> tuple:
+        prefix = f'title_slide_positions.{name}'
+        return (Inches(config.get(f'{prefix}.left', left)), Inches(config.get(f'{prefix}.top', top)),
+                Inches(config.get(f'{prefix}.width', width)), Inches(config.get(f'{prefix}.height', height)))
+    
+    return {
+        'section_name_box': box('section_name', 0.5, 0.5, 9.0, 1.0),
+        'title_box': box('title', 0.5, 1.8, 9.0, 1.5),
+        'subtitle_box': box('subtitle', 0.5, 3.5, 9.0, 1.0),
+        'section_name_size': Pt(config.get('fonts.title_slide.section_name', 40)),
+        'title_size': Pt(config.get('fonts.title_slide.title', 50)),
+        'subtitle_h2_size': Pt(config.get('fonts.title_slide.subtitle_h2', 32)),
+        'subtitle_h3_size': Pt(config.get('fonts.title_slide.subtitle_h3', 24)),
+        'subtitle_text_size': Pt(config.get('fonts.title_slide.subtitle_text', 20)),
+        'spacer': Pt(config.get('fonts.title_slide.spacer', 8)),
+        'section_bold': config.get('formatting.section_bold', True),
+        'title_bold': config.get('formatting.title_bold', True),
+        'subtitle_bold': config.get('formatting.subtitle_bold', True),
+    }
+
+
 def _add_title_slide_textboxes(slide: 'Slide', slide_data: Dict[str, Any], config: Config) -> None:
     """Manually add text boxes for title slide when no shapes available."""
     logging.info("No shapes found in title slide, manually adding text boxes...")
     
-    # Get positioning from config
-    section_pos = {
-        'left': config.get('title_slide_positions.section_name.left', 0.5),
-        'top': config.get('title_slide_positions.section_name.top', 0.5),
-        'width': config.get('title_slide_positions.section_name.width', 9.0),
-        'height': config.get('title_slide_positions.section_name.height', 1.0)
-    }
-    title_pos = {
-        'left': config.get('title_slide_positions.title.left', 0.5),
-        'top': config.get('title_slide_positions.title.top', 1.8),
-        'width': config.get('title_slide_positions.title.width', 9.0),
-        'height': config.get('title_slide_positions.title.height', 1.5)
-    }
-    subtitle_pos = {
-        'left': config.get('title_slide_positions.subtitle.left', 0.5),
-        'top': config.get('title_slide_positions.subtitle.top', 3.5),
-        'width': config.get('title_slide_positions.subtitle.width', 9.0),
-        'height': config.get('title_slide_positions.subtitle.height', 1.0)
-    }
-    
-    # Get font sizes from config
-    section_font_size = config.get('fonts.title_slide.section_name', 40)
-    title_font_size = config.get('fonts.title_slide.title', 50)
-    subtitle_h2_font_size = config.get('fonts.title_slide.subtitle_h2', 32)
-    subtitle_h3_font_size = config.get('fonts.title_slide.subtitle_h3', 24)
-    subtitle_text_font_size = config.get('fonts.title_slide.subtitle_text', 20)
+    style = config.derived(_title_slide_style)
     
     # Add section name at the top
     if slide_data['section_name']:
-        section_box = slide.shapes.add_textbox(
-            Inches(section_pos['left']), Inches(section_pos['top']),
-            Inches(section_pos['width']), Inches(section_pos['height'])
-        )
+        section_box = slide.shapes.add_textbox(*style['section_name_box'])
         section_frame = section_box.text_frame
         section_frame.text = slide_data['section_name']
         section_frame.word_wrap = True
         # Format section name
         for paragraph in section_frame.paragraphs:
             for run in paragraph.runs:
-                run.font.size = Pt(section_font_size)
-                if config.get('formatting.section_bold', True):
+                run.font.size = style['section_name_size']
+                if style['section_bold']:
                     run.font.bold = True
         logging.info("Added section name text box")
     
     # Add main title
     if slide_data['title']:
-        title_box = slide.shapes.add_textbox(
-            Inches(title_pos['left']), Inches(title_pos['top']),
-            Inches(title_pos['width']), Inches(title_pos['height'])
-        )
+        title_box = slide.shapes.add_textbox(*style['title_box'])
         title_frame = title_box.text_frame
         title_frame.text = slide_data['title']
         title_frame.word_wrap = True
         # Format title
         for paragraph in title_frame.paragraphs:
             for run in paragraph.runs:
-                run.font.size = Pt(title_font_size)
-                if config.get('formatting.title_bold', True):
+                run.font.size = style['title_size']
+                if style['title_bold']:
                     run.font.bold = True
         logging.info("Added title text box")
     
     # Add subtitle
     if slide_data['subtitle']:
-        subtitle_box = slide.shapes.add_textbox(
-            Inches(subtitle_pos['left']), Inches(subtitle_pos['top']),
-            Inches(subtitle_pos['width']), Inches(subtitle_pos['height'])
-        )
+        subtitle_box = slide.shapes.add_textbox(*style['subtitle_box'])
         subtitle_frame = subtitle_box.text_frame
         subtitle_frame.word_wrap = True
+        spacer_size = style['spacer']
         
-        # Get spacer size for title slides
-        spacer_size = config.get('fonts.title_slide.spacer', 8)
-        
-        # Parse subtitle lines and apply different font sizes based on header level
-        subtitle_lines = slide_data['subtitle'].split('\n')
+        # Apply different font sizes based on header level
         first_line = True
-        for line in subtitle_lines:
-            line_stripped = line.strip()
-            if not line_stripped:
-                continue
-            
+        for token in get_subtitle_tokens(slide_data):
             # Handle spacer markers (blank lines in markdown)
-            if line_stripped == SPACER_MARKER:
+            if token.kind == SPACER:
                 if first_line:
                     p = subtitle_frame.paragraphs[0]
                     p.text = ' '  # Use space to ensure paragraph has height
@@ -150,23 +144,20 @@ def _add_title_slide_textboxes(slide: 'Slide', slide_data: Dict[str, Any], confi
                     p.text = ' '  # Use space to ensure paragraph has height
                 # Set font size small to minimize visual impact of the space character
                 for run in p.runs:
-                    run.font.size = Pt(spacer_size)
-                p.space_before = Pt(spacer_size)
+                    run.font.size = spacer_size
+                p.space_before = spacer_size
                 p.space_after = Pt(0)
-                logging.debug(f"  Added spacer paragraph in title slide subtitle ({spacer_size}pt)")
                 continue
             
-            # Determine font size based on header marker
-            if line_stripped.startswith('## '):
-                text = line_stripped[3:].strip()
-                font_size = subtitle_h2_font_size
-            elif line_stripped.startswith('### '):
-                text = line_stripped[4:].strip()
-                font_size = subtitle_h3_font_size
+            # Determine font size based on header level
+            text = token.text
+            if token.kind == HEADING and token.level == 2:
+                font_size = style['subtitle_h2_size']
+            elif token.kind == HEADING:
+                font_size = style['subtitle_h3_size']
             else:
                 # Plain text (author, date, etc.) - use subtitle_text size
-                text = line_stripped
-                font_size = subtitle_text_font_size
+                font_size = style['subtitle_text_size']
             
             if first_line:
                 # Use existing first paragraph
@@ -180,8 +171,8 @@ def _add_title_slide_textboxes(slide: 'Slide', slide_data: Dict[str, Any], confi
             
             # Format the paragraph
             for run in p.runs:
-                run.font.size = Pt(font_size)
-                if config.get('formatting.subtitle_bold', True):
+                run.font.size = font_size
+                if style['subtitle_bold']:
                     run.font.bold = True
         
         logging.info("Added subtitle text box with hierarchical formatting")
@@ -251,7 +242,7 @@ def build_content_slide(prs: 'Presentation', slide_data: Dict[str, Any], config:
         logging.warning(f"Only {len(all_layouts)} layout(s) available. Using layout 0 for content slide")
         layout_idx = 0
     
-    slide = prs.slides.add_slide(all_layouts[layout_idx])
+    slide = add_slide(prs, all_layouts[layout_idx])
     logging.info(f"Using layout {layout_idx} ({all_layouts[layout_idx].name}), {len(slide.shapes)} shapes")
     
     # Debug: print all shapes
@@ -272,57 +263,90 @@ def build_content_slide(prs: 'Presentation', slide_data: Dict[str, Any], config:
                 break
     
     if content_shape and hasattr(content_shape, 'text_frame'):
-        _populate_content_text_frame(content_shape.text_frame, slide_data['content'], slide, config)
+        tokens, images = get_content_tokens(slide_data)
+        _populate_content_text_frame(content_shape.text_frame, tokens, slide, config, images)
     
     return slide
 
 
-def _populate_content_text_frame(text_frame, content: str, slide: 'Slide', config: Config) -> None:
+def _content_text_style(config: Config) -> Dict[str, Any]:
+    """Font sizes, bold flags and numbering for content text, read from config once.
+    
+    Args:
+        config: Configuration object
+        
+    Returns:
+        Dictionary with headers ({level: (size, bold)}), body, bullet,
+        numbered and spacer sizes, and numbering_type
+    """
+    return {
+        'headers': {
+            2: (Pt(config.get('fonts.content_slide.h2_header', 32)), config.get('formatting.h2_bold', True)),
+            3: (Pt(config.get('fonts.content_slide.h3_header', 24)), config.get('formatting.h3_bold', False)),
+            4: (Pt(config.get('fonts.content_slide.h4_header', 20)), config.get('formatting.h4_bold', False)),
+            5: (Pt(config.get('fonts.content_slide.h5_header', 18)), config.get('formatting.h5_bold', False)),
+        },
+        'body': Pt(config.get('fonts.content_slide.body_text', 24)),
+        'bullet': Pt(config.get('fonts.content_slide.bullet', 24)),
+        'numbered': Pt(config.get('fonts.content_slide.numbered', 24)),
+        'numbering_type': config.get('bullets.numbering_type', 'arabicPeriod'),
+        'spacer': Pt(config.get('fonts.content_slide.spacer', 12)),  # Smaller font for spacer lines
+    }
+
+
+def _content_text_templates(config: Config) -> Dict[str, Any]:
+    """XML templates for the direct text emitter, computed once per configuration."""
+    return content_templates(config.derived(_content_text_style))
+
+
+def _populate_content_text_frame(text_frame, tokens: List[Token], slide: 'Slide', config: Config,
+                                 images: Optional[list] = None) -> None:
     """Populate a text frame with parsed content.
     
     Args:
         text_frame: PowerPoint text frame object
-        content: Content string to parse and add
+        tokens: Content tokens from the markdown parser
         slide: Slide object (for adding images)
         config: Configuration object
+        images: Image info dictionaries to add to the slide, if any
     """
     text_frame.clear()
     logging.info("Adding content to text frame...")
     
-    # Check if content has HTML with images
-    images = []
-    if has_html_content(content):
-        logging.info("Detected HTML content, extracting images...")
-        images = extract_images_from_html(content)
-        logging.info(f"Found {len(images)} images")
-        # Remove HTML from content
-        content = remove_html_tags(content)
-    
-    # Get font sizes from config
-    h2_size = config.get('fonts.content_slide.h2_header', 32)
-    h3_size = config.get('fonts.content_slide.h3_header', 24)
-    h4_size = config.get('fonts.content_slide.h4_header', 20)
-    h5_size = config.get('fonts.content_slide.h5_header', 18)
-    body_size = config.get('fonts.content_slide.body_text', 24)
-    bullet_size = config.get('fonts.content_slide.bullet', 24)
-    numbered_size = config.get('fonts.content_slide.numbered', 24)
-    numbering_type = config.get('bullets.numbering_type', 'arabicPeriod')
-    spacer_size = config.get('fonts.content_slide.spacer', 12)  # Smaller font for spacer lines
-    
-    # Get bold settings from config
-    h2_bold = config.get('formatting.h2_bold', True)
-    h3_bold = config.get('formatting.h3_bold', False)
-    h4_bold = config.get('formatting.h4_bold', False)
-    h5_bold = config.get('formatting.h5_bold', False)
-    
-    # Parse content (bullets, numbered lists, etc.)
-    for line in content.split('\n'):
-        line_stripped = line.strip()
-        if not line_stripped:
-            continue
-        
+    with timed('text'):
+        if config.get('formatting.text_emitter', 'lxml') == 'pptx':
+            _add_content_paragraphs(text_frame, tokens, config)
+        else:
+            try:
+                emit_content_paragraphs(text_frame, tokens, config.derived(_content_text_templates))
+            except (etree.XMLSyntaxError, ValueError):
+                # Text that is not valid XML; python-pptx reports it
+                _add_content_paragraphs(text_frame, tokens, config)
+    
+    # Add images if any were found
+    if images:
+        logging.info(f"Adding {len(images)} images to slide...")
+        add_images_to_slide(slide, images, config, base_path=Path('.'))
+
+
+def _add_content_paragraphs(text_frame, tokens: List[Token], config: Config) -> None:
+    """Append one paragraph per content token through python-pptx's objects.
+    
+    This is the reference for text_emitter, which produces the same XML
+    directly (formatting.text_emitter: pptx selects this path).
+    
+    Args:
+        text_frame: PowerPoint text frame object
+        tokens: Content tokens from the markdown parser
+        config: Configuration object
+    """
+    style = config.derived(_content_text_style)
+    header_styles = style['headers']
+    spacer_size = style['spacer']
+    
+    for token in tokens:
         # Handle spacer markers (blank lines in markdown)
-        if line_stripped == SPACER_MARKER:
+        if token.kind == SPACER:
             p = text_frame.add_paragraph()
             # Use a space character instead of empty string to ensure the paragraph renders
             # with height. Empty paragraphs can collapse to zero height in PowerPoint.
@@ -330,118 +354,53 @@ def _populate_content_text_frame(text_frame, content: str, slide: 'Slide', confi
             remove_bullet(p)
             # Set font size small to minimize visual impact of the space character
             for run in p.runs:
-                run.font.size = Pt(spacer_size)
+                run.font.size = spacer_size
             # Add spacing before to create vertical gap
-            p.space_before = Pt(spacer_size)
+            p.space_before = spacer_size
             p.space_after = Pt(0)
-            logging.debug(f"  Added spacer paragraph for vertical spacing ({spacer_size}pt)")
             continue
         
+        p = text_frame.add_paragraph()
+        add_formatted_text(p, token.text)
+        
         # Handle headers (h2-h5) with different sizes
-        if line_stripped.startswith('##### '):
-            # H5 header
-            p = text_frame.add_paragraph()
-            add_formatted_text(p, line_stripped[6:])
+        if token.kind == HEADING:
+            font_size, bold = header_styles[token.level]
             p.level = 0
             remove_bullet(p)
             for run in p.runs:
-                run.font.size = Pt(h5_size)
-                if h5_bold:
+                run.font.size = font_size
+                if bold:
                     run.font.bold = True
-            logging.debug(f"  Added h5 header: {line_stripped[6:]}")
-        elif line_stripped.startswith('#### '):
-            # H4 header
-            p = text_frame.add_paragraph()
-            add_formatted_text(p, line_stripped[5:])
-            p.level = 0
-            remove_bullet(p)
-            for run in p.runs:
-                run.font.size = Pt(h4_size)
-                if h4_bold:
-                    run.font.bold = True
-            logging.debug(f"  Added h4 header: {line_stripped[5:]}")
-        elif line_stripped.startswith('### '):
-            # H3 header
-            p = text_frame.add_paragraph()
-            add_formatted_text(p, line_stripped[4:])
-            p.level = 0
-            remove_bullet(p)
-            for run in p.runs:
-                run.font.size = Pt(h3_size)
-                if h3_bold:
-                    run.font.bold = True
-            logging.debug(f"  Added h3 header: {line_stripped[4:]}")
-        elif line_stripped.startswith('## '):
-            # H2 header
-            p = text_frame.add_paragraph()
-            add_formatted_text(p, line_stripped[3:])
-            p.level = 0
-            remove_bullet(p)
-            for run in p.runs:
-                run.font.size = Pt(h2_size)
-                if h2_bold:
-                    run.font.bold = True
-            logging.debug(f"  Added h2 header: {line_stripped[3:]}")
         # Handle bullet points
-        elif line_stripped.startswith('- '):
-            p = text_frame.add_paragraph()
-            add_formatted_text(p, line_stripped[2:])
+        elif token.kind == BULLET:
             p.level = 0
             # Explicitly add bullet formatting
             add_bullet(p, level=0)
-            # Set font size for bullet text
-            for run in p.runs:
-                run.font.size = Pt(bullet_size)
-            logging.debug(f"  Added bullet: {line_stripped[2:]}")
-        elif line_stripped.startswith('  - '):
-            p = text_frame.add_paragraph()
-            add_formatted_text(p, line_stripped[4:])
-            p.level = 1
-            # Explicitly add bullet formatting for sub-bullets
-            add_bullet(p, level=1)
-            # Set font size for sub-bullet text
             for run in p.runs:
-                run.font.size = Pt(bullet_size)
-            logging.debug(f"  Added sub-bullet: {line_stripped[4:]}")
+                run.font.size = style['bullet']
         # Handle numbered lists (e.g., "1. ", "2. ")
-        elif re.match(r'^\d+\.\s+', line_stripped):
-            p = text_frame.add_paragraph()
-            # Extract the number and text
-            match = re.match(r'^(\d+)\.\s+(.*)$', line_stripped)
-            if match:
-                num = int(match.group(1))
-                text = match.group(2)
-            else:
-                num = 1
-                text = re.sub(r'^\d+\.\s+', '', line_stripped)
-            add_formatted_text(p, text)
+        elif token.kind == NUMBERED:
             p.level = 0
             # Add automatic numbering
-            add_numbering(p, start_at=num, numbering_type=numbering_type)
-            # Set font size for numbered text
+            add_numbering(p, start_at=token.number, numbering_type=style['numbering_type'])
             for run in p.runs:
-                run.font.size = Pt(numbered_size)
-            logging.debug(f"  Added numbered item {num}: {text}")
+                run.font.size = style['numbered']
         else:
-            p = text_frame.add_paragraph()
-            add_formatted_text(p, line_stripped)
             # Turn off bullets for regular text
             remove_bullet(p)
-            # Set font size for regular text
             for run in p.runs:
-                run.font.size = Pt(body_size)
-            logging.debug(f"  Added text: {line_stripped}")
-    
-    # Add images if any were found
-    if images:
-        logging.info(f"Adding {len(images)} images to slide...")
-        add_images_to_slide(slide, images, config, base_path=Path('.'))
+                run.font.size = style['body']
 
 
 def build_layout_slide(prs: 'Presentation', slide_data: Dict[str, Any], 
                        config: Config, all_layouts: list, layout_map: dict) -> 'Slide':
     """Build a slide using a custom layout (image-side, content-bg, title-bg).
     
+    When the template has a layout of that name (see template_layouts), the
+    slide uses it and only its placeholders are filled; otherwise the slide
+    is built on 'Title and Content' shape by shape.
+    
     Args:
         prs: PowerPoint presentation object
         slide_data: Dictionary with slide content including 'layout' key
@@ -459,6 +418,26 @@ def build_layout_slide(prs: 'Presentation', slide_data: Dict[str, Any],
         logging.warning(f"Unknown layout '{layout_name}', falling back to content slide")
         return build_content_slide(prs, slide_data, config, all_layouts)
     
+    # Content tokens and the images referenced by the slide's HTML
+    tokens, images = get_content_tokens(slide_data)
+    images = list(images)
+    
+    # Also check for bg_image directive
+    if slide_data.get('bg_image'):
+        images.insert(0, {'src': slide_data['bg_image']})
+    
+    # Get fit mode from directive
+    fit_mode = slide_data.get('image_fit', 'contain')
+    
+    # Templates prepared by scripts/add_layouts.py have a real layout of this name
+    layout_idx = layout_map.get(layout_name)
+    if (layout_idx is not None and layout_idx < len(all_layouts)
+            and is_prebaked_layout(all_layouts[layout_idx])):
+        slide = add_slide(prs, all_layouts[layout_idx], clone_pictures=False)
+        logging.info(f"Building {layout_name} slide from template layout {layout_idx}")
+        _fill_prebaked_layout_slide(slide, layout_name, slide_data, tokens, images, config, fit_mode)
+        return slide
+    
     # Use the 'Title and Content' layout as base (index 1, or find by name)
     base_layout_idx = config.get('layouts.content_slide_index', 1)
     if 'Title and Content' in layout_map:
@@ -467,44 +446,103 @@ def build_layout_slide(prs: 'Presentation', slide_data: Dict[str, Any],
     if base_layout_idx >= len(all_layouts):
         base_layout_idx = 0
     
-    slide = prs.slides.add_slide(all_layouts[base_layout_idx])
+    slide = add_slide(prs, all_layouts[base_layout_idx])
     logging.info(f"Building {layout_name} slide using base layout {base_layout_idx}")
     
-    # Extract images from content
-    content = slide_data.get('content', '')
-    images = []
-    if has_html_content(content):
-        images = extract_images_from_html(content)
-        content = remove_html_tags(content)
-    
-    # Also check for bg_image directive
-    if slide_data.get('bg_image'):
-        images.insert(0, {'src': slide_data['bg_image']})
-    
-    # Get fit mode from directive
-    fit_mode = slide_data.get('image_fit', 'contain')
-    
     if layout_name == 'image-side':
-        _build_image_side_slide(slide, slide_data, content, images, config, fit_mode)
+        _build_image_side_slide(slide, slide_data, tokens, images, config, fit_mode)
     elif layout_name == 'content-bg':
-        _build_content_bg_slide(slide, slide_data, content, images, config, fit_mode)
+        _build_content_bg_slide(slide, slide_data, tokens, images, config, fit_mode)
     elif layout_name == 'title-bg':
-        _build_title_bg_slide(slide, slide_data, content, images, config, fit_mode)
+        _build_title_bg_slide(slide, slide_data, tokens, images, config, fit_mode)
     elif layout_name == 'dual-image-text-bottom':
-        _build_dual_image_slide(slide, slide_data, content, images, config, fit_mode)
+        _build_dual_image_slide(slide, slide_data, tokens, images, config, fit_mode)
     
     return slide
 
 
+def _layout_slide_style(config: Config) -> Dict[str, Any]:
+    """Font sizes of the layout slides' own text, read from config once.
+    
+    Args:
+        config: Configuration object
+        
+    Returns:
+        Dictionary with the content-bg title size
+    """
+    return {
+        'title_size': Pt(config.get('fonts.content_slide.title', 32)),
+    }
+
+
+def _fill_prebaked_layout_slide(slide: 'Slide', layout_name: str, slide_data: Dict[str, Any],
+                                tokens: List[Token], images: list, config: Config,
+                                fit_mode: str) -> None:
+    """Fill the placeholders of a slide whose layout was pre-baked into the template.
+    
+    Overlay, positions and fixed text styles come from the layout (see
+    template_layouts), so only the text, pictures, background image and
+    font sizes from config are added to the slide.
+    
+    Args:
+        slide: PowerPoint slide object
+        layout_name: Name of the layout directive
+        slide_data: Slide data dictionary
+        tokens: Content tokens
+        images: List of image info dictionaries
+        config: Configuration object
+        fit_mode: Image fit mode ('contain' or 'cover')
+    """
+    if slide.shapes.title is not None:
+        title_frame = slide.shapes.title.text_frame
+        title_frame.text = slide_data.get('title', '')
+        if layout_name == 'content-bg':
+            title_size = config.derived(_layout_slide_style)['title_size']
+            for p in title_frame.paragraphs:
+                for run in p.runs:
+                    run.font.size = title_size
+    
+    body = None
+    for shape in slide.placeholders:
+        if shape.placeholder_format.idx == BODY_IDX:
+            body = shape
+            break
+    
+    if body is not None:
+        if layout_name == 'title-bg' and tokens:
+            # Use first line of content as subtitle, without markdown markers
+            body.text_frame.text = re.sub(r'^[-*#]+\s*', '', tokens[0].line)
+        elif layout_name != 'title-bg' and tokens:
+            _populate_content_text_frame(body.text_frame, tokens, slide, config)
+        else:
+            # Nothing to show; drop the empty placeholder
+            body._element.getparent().remove(body._element)
+    
+    if not images:
+        return
+    
+    if layout_name in ('content-bg', 'title-bg'):
+        img_src = images[0].get('src', '')
+        if img_src:
+            bg_spec = LAYOUT_SPECS[layout_name].get('background', {})
+            set_background_image(slide, Path('.') / img_src,
+                                 width=bg_spec.get('width', 13.33),
+                                 height=bg_spec.get('height', 7.5),
+                                 config=config)
+    else:
+        add_images_for_layout(slide, images, layout_name, config,
+                              base_path=Path('.'), fit_mode=fit_mode)
+
+
 def _build_image_side_slide(slide: 'Slide', slide_data: Dict[str, Any],
-                            content: str, images: list, config: Config,
+                            tokens: List[Token], images: list, config: Config,
                             fit_mode: str) -> None:
     """Build an image-side layout slide (text left, image right).
     
     Args:
         slide: PowerPoint slide object
         slide_data: Slide data dictionary
-        content: Cleaned content text (HTML removed)
+        tokens: Content tokens
         images: List of image info dictionaries
         config: Configuration object
         fit_mode: Image fit mode ('contain' or 'cover')
@@ -534,7 +572,7 @@ def _build_image_side_slide(slide: 'Slide', slide_data: Dict[str, Any],
         content_shape.height = Inches(body_spec.get('height', 5.5))
         
         # Populate content
-        _populate_content_text_frame(content_shape.text_frame, content, slide, config)
+        _populate_content_text_frame(content_shape.text_frame, tokens, slide, config)
     else:
         # Create a text box manually
         textbox = slide.shapes.add_textbox(
@@ -543,7 +581,7 @@ def _build_image_side_slide(slide: 'Slide', slide_data: Dict[str, Any],
             Inches(body_spec.get('width', 6.5)),
             Inches(body_spec.get('height', 5.5))
         )
-        _populate_content_text_frame(textbox.text_frame, content, slide, config)
+        _populate_content_text_frame(textbox.text_frame, tokens, slide, config)
     
     # Add images to right side
     if images:
@@ -552,14 +590,14 @@ def _build_image_side_slide(slide: 'Slide', slide_data: Dict[str, Any],
 
 
 def _build_content_bg_slide(slide: 'Slide', slide_data: Dict[str, Any],
-                            content: str, images: list, config: Config,
+                            tokens: List[Token], images: list, config: Config,
                             fit_mode: str) -> None:
     """Build a content-bg layout slide (full background with overlay).
     
     Args:
         slide: PowerPoint slide object
         slide_data: Slide data dictionary
-        content: Cleaned content text (HTML removed)
+        tokens: Content tokens
         images: List of image info dictionaries
         config: Configuration object
         fit_mode: Image fit mode
@@ -575,7 +613,8 @@ def _build_content_bg_slide(slide: 'Slide', slide_data: Dict[str, Any],
             bg_spec = layout_spec.get('background', {})
             add_background_image(slide, img_path, 
                                 width=bg_spec.get('width', 13.33),
-                                height=bg_spec.get('height', 7.5))
+                                height=bg_spec.get('height', 7.5),
+                                config=config)
     
     # Add overlay rectangle
     overlay_spec = layout_spec.get('overlay', {})
@@ -591,35 +630,38 @@ def _build_content_bg_slide(slide: 'Slide', slide_data: Dict[str, Any],
     
     # Clear existing placeholders (they may conflict with our layout)
     # Add title text box on top of overlay
+    title_spec = layout_spec['title']
     title_box = slide.shapes.add_textbox(
-        Inches(0.75), Inches(0.75),
-        Inches(7.5), Inches(0.8)
+        Inches(title_spec['left']), Inches(title_spec['top']),
+        Inches(title_spec['width']), Inches(title_spec['height'])
     )
     title_frame = title_box.text_frame
     title_frame.text = slide_data.get('title', '')
     title_frame.word_wrap = True
+    title_size = config.derived(_layout_slide_style)['title_size']
     for p in title_frame.paragraphs:
         for run in p.runs:
-            run.font.size = Pt(config.get('fonts.content_slide.title', 32))
+            run.font.size = title_size
             run.font.bold = True
     
     # Add body text box on overlay
+    body_spec = layout_spec['body']
     body_box = slide.shapes.add_textbox(
-        Inches(0.75), Inches(1.75),
-        Inches(7.5), Inches(5.0)
+        Inches(body_spec['left']), Inches(body_spec['top']),
+        Inches(body_spec['width']), Inches(body_spec['height'])
     )
-    _populate_content_text_frame(body_box.text_frame, content, slide, config)
+    _populate_content_text_frame(body_box.text_frame, tokens, slide, config)
 
 
 def _build_title_bg_slide(slide: 'Slide', slide_data: Dict[str, Any],
-                          content: str, images: list, config: Config,
+                          tokens: List[Token], images: list, config: Config,
                           fit_mode: str) -> None:
     """Build a title-bg layout slide (full background with title overlay at bottom).
     
     Args:
         slide: PowerPoint slide object
         slide_data: Slide data dictionary
-        content: Cleaned content text (used as subtitle)
+        tokens: Content tokens (the first line is used as subtitle)
         images: List of image info dictionaries
         config: Configuration object
         fit_mode: Image fit mode
@@ -635,7 +677,8 @@ def _build_title_bg_slide(slide: 'Slide', slide_data: Dict[str, Any],
             bg_spec = layout_spec.get('background', {})
             add_background_image(slide, img_path,
                                 width=bg_spec.get('width', 13.33),
-                                height=bg_spec.get('height', 7.5))
+                                height=bg_spec.get('height', 7.5),
+                                config=config)
     
     # Add overlay strip at bottom
     overlay_spec = layout_spec.get('overlay', {})
@@ -650,9 +693,10 @@ def _build_title_bg_slide(slide: 'Slide', slide_data: Dict[str, Any],
     )
     
     # Add large title text box
+    title_spec = layout_spec['title']
     title_box = slide.shapes.add_textbox(
-        Inches(0.5), Inches(5.25),
-        Inches(12.33), Inches(1.5)
+        Inches(title_spec['left']), Inches(title_spec['top']),
+        Inches(title_spec['width']), Inches(title_spec['height'])
     )
     title_frame = title_box.text_frame
     title_frame.text = slide_data.get('title', '')
@@ -665,14 +709,15 @@ def _build_title_bg_slide(slide: 'Slide', slide_data: Dict[str, Any],
             run.font.color.rgb = RGBColor(255, 255, 255)
     
     # Add subtitle if there's content
-    if content.strip():
+    if tokens:
+        subtitle_spec = layout_spec['subtitle']
         subtitle_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(6.75),
-            Inches(12.33), Inches(0.5)
+            Inches(subtitle_spec['left']), Inches(subtitle_spec['top']),
+            Inches(subtitle_spec['width']), Inches(subtitle_spec['height'])
         )
         subtitle_frame = subtitle_box.text_frame
         # Use first line of content as subtitle
-        subtitle_text = content.strip().split('\n')[0]
+        subtitle_text = tokens[0].line
         # Clean up any markdown formatting
         subtitle_text = re.sub(r'^[-*#]+\s*', '', subtitle_text)
         subtitle_frame.text = subtitle_text
@@ -685,14 +730,14 @@ def _build_title_bg_slide(slide: 'Slide', slide_data: Dict[str, Any],
 
 
 def _build_dual_image_slide(slide: 'Slide', slide_data: Dict[str, Any],
-                             content: str, images: list, config: Config,
+                             tokens: List[Token], images: list, config: Config,
                              fit_mode: str) -> None:
     """Build a dual-image layout slide (two images on top, text below).
     
     Args:
         slide: PowerPoint slide object
         slide_data: Slide data dictionary
-        content: Cleaned content text (HTML removed)
+        tokens: Content tokens
         images: List of image info dictionaries
         config: Configuration object
         fit_mode: Image fit mode ('contain' or 'cover')
@@ -721,8 +766,8 @@ def _build_dual_image_slide(slide: 'Slide', slide_data: Dict[str, Any],
     body_frame.word_wrap = True
     
     # Populate with content if present
-    if content.strip():
-        _populate_content_text_frame(body_frame, content, slide, config)
+    if tokens:
+        _populate_content_text_frame(body_frame, tokens, slide, config)
     
     # Center-align all paragraphs in the body text box
     for paragraph in body_frame.paragraphs:
@@ -0,0 +1,234 @@
+"""Parsed-template cache so repeated runs don't re-open the template package."""
+
+import copy
+import hashlib
+import io
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.package import Package
+from typing import Dict, List, Tuple, TYPE_CHECKING
+from .timing import timed
+
+if TYPE_CHECKING:
+    from pptx.presentation import Presentation as PresentationType
+
+
+def collect_layouts(prs: 'PresentationType') -> List:
+    """Collect all layouts from all slide masters, in master order.
+
+    Args:
+        prs: PowerPoint presentation object
+
+    Returns:
+        List of slide layouts
+    """
+    all_layouts = []
+    for master in prs.slide_masters:
+        all_layouts.extend(master.slide_layouts)
+    return all_layouts
+
+
+# Presentation-part references to slides besides p:sldIdLst: custom shows
+# (by rId) and PowerPoint 2010 sections (by slide id)
+_CUSTOM_SHOWS_PATH = './p:custShowLst'
+_SECTION_LIST_PATH = './p:extLst/p:ext/p14:sectionLst'
+_PRESENTATION_NSMAP = {
+    'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
+    'p14': 'http://schemas.microsoft.com/office/powerpoint/2010/main',
+}
+
+
+def strip_slides(prs: 'PresentationType') -> Tuple[int, int, int]:
+    """Remove all existing slides from a presentation, keeping masters and layouts.
+
+    Works in one pass: the slide list is cleared, every slide relationship of
+    the presentation part is dropped together (including slides the list did
+    not mention), and custom shows and sections that listed the removed slides
+    are removed with them. Parts only the slides used (their notes, media,
+    charts) are then unreachable and are left out when the package is saved.
+
+    Args:
+        prs: PowerPoint presentation object
+
+    Returns:
+        Tuple of (slides removed, parts pruned, bytes of pruned parts)
+    """
+    presentation_part = prs.part
+    package = presentation_part.package
+    reachable_before = set(package.iter_parts())
+
+    presentation = presentation_part._element
+    sld_id_lst = presentation.get_or_add_sldIdLst()
+    removed = len(sld_id_lst.sldId_lst)
+    del sld_id_lst[:]
+
+    rels = presentation_part.rels
+    for rId in [rId for rId, rel in rels.items() if rel.reltype == RT.SLIDE]:
+        rels.pop(rId)
+
+    for custom_shows in presentation.findall(_CUSTOM_SHOWS_PATH, _PRESENTATION_NSMAP):
+        presentation.remove(custom_shows)
+    for section_list in presentation.findall(_SECTION_LIST_PATH, _PRESENTATION_NSMAP):
+        # Remove the p:ext holding the sections, and p:extLst if nothing else is left
+        ext = section_list.getparent()
+        ext_lst = ext.getparent()
+        ext_lst.remove(ext)
+        if len(ext_lst) == 0:
+            presentation.remove(ext_lst)
+
+    pruned = reachable_before - set(package.iter_parts())
+    dead_bytes = sum(len(part.blob) for part in pruned)
+    return removed, len(pruned), dead_bytes
+
+
+class TemplateSnapshot:
+    """A parsed, slide-free copy of a template plus its layout index.
+
+    The snapshot holds a bare OPC package that no python-pptx proxy object
+    has been created for. Proxies cache child XML elements, and a deep copy
+    would detach those from their copied parent tree, so proxies are only
+    ever built on the copy returned by `clone()`.
+    """
+
+    def __init__(self, package: Package, sha1: str, original_slide_count: int,
+                 master_count: int, layout_names: List[str], pruned_parts: int = 0,
+                 dead_bytes: int = 0):
+        """Initialize the snapshot.
+
+        Args:
+            package: Parsed package of the template with its slides stripped
+            sha1: SHA1 hex digest of the template bytes
+            original_slide_count: Number of slides the template shipped with
+            master_count: Number of slide masters in the template
+            layout_names: Layout names across all masters, in order
+            pruned_parts: Number of parts only the template's slides used
+            dead_bytes: Uncompressed size of those parts, left out of every output
+        """
+        self._package = package
+        self.sha1 = sha1
+        self.original_slide_count = original_slide_count
+        self.master_count = master_count
+        self.layout_names = layout_names
+        self.pruned_parts = pruned_parts
+        self.dead_bytes = dead_bytes
+
+    def clone(self) -> Tuple['PresentationType', List, Dict[str, int]]:
+        """Return an independent presentation copy with its layout index.
+
+        Returns:
+            Tuple of (presentation, all_layouts, layout_map)
+        """
+        prs = copy.deepcopy(self._package).main_document_part.presentation
+        all_layouts = collect_layouts(prs)
+        layout_map = {name: idx for idx, name in enumerate(self.layout_names)}
+        return prs, all_layouts, layout_map
+
+
+# Most snapshots kept in memory; uploaded templates (see the Streamlit app) would
+# otherwise accumulate for the life of the process
+MAX_CACHED_TEMPLATES = 8
+
+# Snapshots keyed by content hash (least recently used first), and
+# path -> (mtime_ns, size, sha1) stat entries
+_snapshots: 'OrderedDict[str, TemplateSnapshot]' = OrderedDict()
+_path_index: Dict[str, Tuple[int, int, str]] = {}
+_lock = threading.Lock()
+
+
+def _build_snapshot(blob: bytes, sha1: str) -> TemplateSnapshot:
+    """Parse template bytes and strip their slides into a new snapshot."""
+    prs = Presentation(io.BytesIO(blob))
+    with timed('template_strip'):
+        original_slide_count, pruned_parts, dead_bytes = strip_slides(prs)
+    layout_names = [layout.name for layout in collect_layouts(prs)]
+
+    # Re-open the stripped package without touching any proxies (see TemplateSnapshot)
+    stream = io.BytesIO()
+    prs.save(stream)
+    package = Package.open(io.BytesIO(stream.getvalue()))
+    return TemplateSnapshot(package, sha1, original_slide_count,
+                            len(prs.slide_masters), layout_names, pruned_parts, dead_bytes)
+
+
+def get_snapshot_for_bytes(blob: bytes) -> TemplateSnapshot:
+    """Get the cached snapshot for template bytes, parsing them on a miss.
+
+    Args:
+        blob: Raw .pptx template bytes
+
+    Returns:
+        Cached template snapshot
+    """
+    sha1 = hashlib.sha1(blob).hexdigest()
+    with _lock:
+        snapshot = _snapshots.get(sha1)
+        if snapshot is not None:
+            _snapshots.move_to_end(sha1)
+    if snapshot is not None:
+        logging.debug(f"Template cache hit for digest {sha1[:12]}")
+        return snapshot
+
+    logging.debug(f"Template cache miss for digest {sha1[:12]}, parsing template")
+    snapshot = _build_snapshot(blob, sha1)
+    with _lock:
+        snapshot = _snapshots.setdefault(sha1, snapshot)
+        while len(_snapshots) > MAX_CACHED_TEMPLATES:
+            _snapshots.popitem(last=False)
+    return snapshot
+
+
+def get_snapshot(template_path: Path) -> TemplateSnapshot:
+    """Get the cached snapshot for a template file.
+
+    The file is only re-read when its mtime or size changed; the content hash
+    then decides whether a new parse is needed.
+
+    Args:
+        template_path: Path to the .pptx template
+
+    Returns:
+        Cached template snapshot
+    """
+    key = str(Path(template_path).resolve())
+    stat = Path(key).stat()
+
+    with _lock:
+        entry = _path_index.get(key)
+        if entry and entry[:2] == (stat.st_mtime_ns, stat.st_size) and entry[2] in _snapshots:
+            _snapshots.move_to_end(entry[2])
+            return _snapshots[entry[2]]
+
+    blob = Path(key).read_bytes()
+    snapshot = get_snapshot_for_bytes(blob)
+    with _lock:
+        _path_index[key] = (stat.st_mtime_ns, stat.st_size, snapshot.sha1)
+    return snapshot
+
+
+def template_digest(template_path: Path) -> str:
+    """Return the SHA1 of a template file without parsing it.
+
+    The hash is remembered by path and reused while mtime and size match.
+
+    Args:
+        template_path: Path to the .pptx template
+
+    Returns:
+        SHA1 hex digest of the file bytes
+    """
+    key = str(Path(template_path).resolve())
+    stat = Path(key).stat()
+    with _lock:
+        entry = _path_index.get(key)
+        if entry and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+            return entry[2]
+
+    sha1 = hashlib.sha1(Path(key).read_bytes()).hexdigest()
+    with _lock:
+        _path_index[key] = (stat.st_mtime_ns, stat.st_size, sha1)
+    return sha1
+
@@ -0,0 +1,267 @@
+"""Real slide layouts for the layout directives, written into the template once.
+
+Without them, every image-side, content-bg, title-bg and
+dual-image-text-bottom slide starts from 'Title and Content' and gets its
+overlay, text boxes, positions and fonts added shape by shape, so each of
+those slides repeats the same XML. add_prebaked_layouts() instead writes
+one slide layout per LAYOUT_SPECS entry into the template: the overlay is a
+shape of the layout, title, body and picture areas are placeholders that
+carry their position and fixed text style. A slide using such a layout only
+holds its text, pictures and background image. Styles read from the
+configuration (fonts.content_slide.*) are not baked in; the builders set
+them on each slide, so config changes apply without rebuilding the template.
+
+scripts/add_layouts.py runs this as a build step on templates/template.pptx.
+The builders in slide_builders fall back to constructing the slides shape
+by shape for templates without these layouts, or whose layouts lack the
+title or body placeholder (see is_prebaked_layout).
+"""
+
+import logging
+import weakref
+from pptx.enum.shapes import PP_PLACEHOLDER
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml import parse_xml
+from pptx.parts.slide import SlideLayoutPart
+from pptx.util import Inches
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
+from .config import Config
+from .images import LAYOUT_SPECS
+from .template_cache import collect_layouts
+
+if TYPE_CHECKING:
+    from pptx.presentation import Presentation
+    from pptx.slide import SlideLayout
+
+# Placeholder idx of the body (or subtitle) area; custom placeholders use 10 and up
+BODY_IDX = 10
+# Placeholder idx of the picture areas, left to right
+PICTURE_IDXS = (11, 12)
+
+# Smallest id of a slide master or layout in p:sldMasterIdLst / p:sldLayoutIdLst
+MIN_LAYOUT_ID = 2147483648
+
+_NSDECLS = (
+    'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+    'xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+)
+
+
+def _xfrm(area: Optional[Dict[str, Any]]) -> str:
+    """a:xfrm for an area in inches; empty to inherit the master's position."""
+    if not area:
+        return ''
+    return (f'<a:xfrm><a:off x="{int(Inches(area["left"]))}" y="{int(Inches(area["top"]))}"/>'
+            f'<a:ext cx="{int(Inches(area["width"]))}" cy="{int(Inches(area["height"]))}"/></a:xfrm>')
+
+
+def _level_style(align: Optional[str] = None, size: Optional[int] = None,
+                 bold: bool = False, color: Optional[str] = None) -> str:
+    """a:lstStyle for a text-box-like placeholder: no indent or bullet, optional font.
+
+    Args:
+        align: Paragraph alignment ('l', 'ctr', 'r'), or None to inherit
+        size: Font size in points, or None to inherit
+        bold: Bold text
+        color: Text color as RRGGBB, or None to inherit
+
+    Returns:
+        lstStyle XML
+    """
+    ppr_attrs = ' marL="0" indent="0"' + (f' algn="{align}"' if align else '')
+    rpr_attrs = (f' sz="{size * 100}"' if size else '') + (' b="1"' if bold else '')
+    fill = f'<a:solidFill><a:srgbClr val="{color}"/></a:solidFill>' if color else ''
+    return (f'<a:lstStyle><a:lvl1pPr{ppr_attrs}><a:buNone/>'
+            f'<a:defRPr{rpr_attrs}>{fill}</a:defRPr></a:lvl1pPr></a:lstStyle>')
+
+
+def _placeholder(shape_id: int, name: str, ph: str, area: Optional[Dict[str, Any]] = None,
+                 lst_style: str = '', prompt: str = '', autofit: str = '<a:normAutofit/>') -> str:
+    """p:sp placeholder with a top-anchored, wrapping text frame.
+
+    Args:
+        shape_id: Shape id, unique within the layout
+        name: Shape name
+        ph: Attributes of the p:ph element
+        area: Position in inches, or None to inherit the master's
+        lst_style: a:lstStyle XML, if any
+        prompt: Prompt text shown in PowerPoint's layout view
+        autofit: Autofit element of the body properties
+
+    Returns:
+        Shape XML
+    """
+    anchor = '' if 'type="title"' in ph and not area else ' anchor="t"'
+    paragraph = (f'<a:p><a:r><a:rPr lang="en-US"/><a:t>{prompt}</a:t></a:r></a:p>' if prompt
+                 else '<a:p><a:endParaRPr lang="en-US"/></a:p>')
+    return (f'<p:sp><p:nvSpPr><p:cNvPr id="{shape_id}" name="{name}"/>'
+            f'<p:cNvSpPr><a:spLocks noGrp="1"/></p:cNvSpPr><p:nvPr><p:ph {ph}/></p:nvPr></p:nvSpPr>'
+            f'<p:spPr>{_xfrm(area)}</p:spPr>'
+            f'<p:txBody><a:bodyPr wrap="square"{anchor}>{autofit}</a:bodyPr>'
+            f'{lst_style}{paragraph}</p:txBody></p:sp>')
+
+
+def _overlay(shape_id: int, overlay: Dict[str, Any]) -> str:
+    """p:sp rectangle with a semi-transparent solid fill and no outline."""
+    red, green, blue = overlay['fill_color']
+    alpha = int((1 - overlay['transparency']) * 100000)
+    return (f'<p:sp><p:nvSpPr><p:cNvPr id="{shape_id}" name="Overlay"/><p:cNvSpPr/>'
+            f'<p:nvPr userDrawn="1"/></p:nvSpPr>'
+            f'<p:spPr>{_xfrm(overlay)}<a:prstGeom prst="rect"><a:avLst/></a:prstGeom>'
+            f'<a:solidFill><a:srgbClr val="{red:02X}{green:02X}{blue:02X}"><a:alpha val="{alpha}"/>'
+            f'</a:srgbClr></a:solidFill><a:ln><a:noFill/></a:ln></p:spPr></p:sp>')
+
+
+def _layout_shapes(layout_name: str) -> List[str]:
+    """Shapes of one pre-baked layout, back to front.
+
+    The text styles reproduce the fixed styles the fallback builders set on
+    each slide; sizes from the configuration are left to the slides.
+    """
+    spec = LAYOUT_SPECS[layout_name]
+    title = 'type="title"'
+    body = f'type="body" idx="{BODY_IDX}"'
+    pictures = [f'type="pic" idx="{idx}"' for idx in PICTURE_IDXS]
+
+    if layout_name == 'image-side':
+        return [
+            _placeholder(2, 'Title', title, prompt='Click to edit title'),
+            _placeholder(3, 'Body', body, spec['body'], prompt='Click to edit text'),
+            _placeholder(4, 'Picture', pictures[0], spec['picture']),
+        ]
+    if layout_name == 'content-bg':
+        return [
+            _overlay(2, spec['overlay']),
+            _placeholder(3, 'Title', title, spec['title'],
+                         _level_style(bold=True), 'Click to edit title'),
+            _placeholder(4, 'Body', body, spec['body'], _level_style(), 'Click to edit text'),
+        ]
+    if layout_name == 'title-bg':
+        return [
+            _overlay(2, spec['overlay']),
+            _placeholder(3, 'Title', title, spec['title'],
+                         _level_style('ctr', 44, True, 'FFFFFF'), 'Click to edit title'),
+            _placeholder(4, 'Subtitle', body, spec['subtitle'],
+                         _level_style('ctr', 24, False, 'FFFFFF'), 'Click to edit subtitle'),
+        ]
+    if layout_name == 'dual-image-text-bottom':
+        return [
+            _placeholder(2, 'Title', title, prompt='Click to edit title'),
+            _placeholder(3, 'Picture Left', pictures[0], spec['picture_left']),
+            _placeholder(4, 'Picture Right', pictures[1], spec['picture_right']),
+            # Grows with its text like the fallback's text box
+            _placeholder(5, 'Body', body, spec['body'], _level_style('ctr'), 'Click to edit text',
+                         '<a:spAutoFit/>'),
+        ]
+    raise ValueError(f"No pre-baked layout for '{layout_name}'")
+
+
+def layout_xml(layout_name: str) -> str:
+    """p:sldLayout XML of a pre-baked layout.
+
+    Layouts with a background image hide the master's shapes (logo, header
+    bar), which the full-bleed image would otherwise cover.
+
+    Args:
+        layout_name: Key of LAYOUT_SPECS
+
+    Returns:
+        Layout part XML
+    """
+    show_master = ' showMasterSp="0"' if 'background' in LAYOUT_SPECS[layout_name] else ''
+    shapes = ''.join(_layout_shapes(layout_name))
+    return (f'<p:sldLayout {_NSDECLS}{show_master} preserve="1" userDrawn="1">'
+            f'<p:cSld name="{layout_name}"><p:spTree>'
+            '<p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr>'
+            '<p:grpSpPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="0" cy="0"/>'
+            '<a:chOff x="0" y="0"/><a:chExt cx="0" cy="0"/></a:xfrm></p:grpSpPr>'
+            f'{shapes}</p:spTree></p:cSld>'
+            '<p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr></p:sldLayout>')
+
+
+def add_prebaked_layouts(prs: 'Presentation', config: Config) -> List[str]:
+    """Write the pre-baked layouts into a presentation, replacing any of the same name.
+
+    They are appended to the slide master of the content layout
+    (layouts.content_slide_index), so the indices of the other layouts stay
+    valid.
+
+    Args:
+        prs: PowerPoint presentation object (the template)
+        config: Configuration object (layouts.content_slide_index)
+
+    Returns:
+        Names of the layouts written
+
+    Raises:
+        ValueError: If a layout to replace is used by slides of the template
+    """
+    for layout in collect_layouts(prs):
+        if layout.name in LAYOUT_SPECS:
+            if layout.used_by_slides:
+                raise ValueError(f"Layout '{layout.name}' is used by slides of the template; "
+                                 "remove those slides first")
+            layout.slide_master.slide_layouts.remove(layout)
+            logging.info(f"Replacing existing layout '{layout.name}'")
+
+    all_layouts = collect_layouts(prs)
+    content_idx = config.get('layouts.content_slide_index', 1)
+    master = (all_layouts[content_idx].slide_master if content_idx < len(all_layouts)
+              else prs.slide_masters[0])
+
+    # Master and layout ids share one number space
+    ids = [int(i) for i in prs.part._element.xpath('./p:sldMasterIdLst/p:sldMasterId/@id')]
+    for slide_master in prs.slide_masters:
+        ids.extend(int(i) for i in slide_master._element.xpath('./p:sldLayoutIdLst/p:sldLayoutId/@id'))
+    next_id = max([MIN_LAYOUT_ID - 1] + ids) + 1
+
+    package = prs.part.package
+    sld_layout_id_lst = master._element.get_or_add_sldLayoutIdLst()
+    names = []
+    for layout_name in LAYOUT_SPECS:
+        partname = package.next_partname('/ppt/slideLayouts/slideLayout%d.xml')
+        layout_part = SlideLayoutPart(partname, CT.PML_SLIDE_LAYOUT, package,
+                                      parse_xml(layout_xml(layout_name)))
+        layout_part.relate_to(master.part, RT.SLIDE_MASTER)
+        rId = master.part.relate_to(layout_part, RT.SLIDE_LAYOUT)
+        sld_layout_id_lst._add_sldLayoutId(rId=rId).set('id', str(next_id))
+        next_id += 1
+        names.append(layout_name)
+        logging.info(f"Added layout '{layout_name}' as {partname}")
+    return names
+
+
+# Result of is_prebaked_layout per template layout, keyed by layout part
+_prebaked_layouts: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+
+
+def is_prebaked_layout(slide_layout: 'SlideLayout') -> bool:
+    """Whether a template layout has the placeholders a pre-baked slide is filled into.
+
+    A layout named like a layout directive but without a title placeholder
+    or a body placeholder with idx BODY_IDX (for example one drawn by hand)
+    would silently lose the slide's text, so it is reported once and the
+    builders construct its slides shape by shape instead.
+
+    Args:
+        slide_layout: Template layout named like a layout directive
+
+    Returns:
+        True if the title and body placeholders are present
+    """
+    usable = _prebaked_layouts.get(slide_layout.part)
+    if usable is None:
+        formats = [ph.placeholder_format for ph in slide_layout.placeholders]
+        missing = []
+        if not any(f.type in (PP_PLACEHOLDER.TITLE, PP_PLACEHOLDER.CENTER_TITLE) for f in formats):
+            missing.append('title placeholder')
+        if not any(f.idx == BODY_IDX for f in formats):
+            missing.append(f'body placeholder (idx {BODY_IDX})')
+        usable = not missing
+        if not usable:
+            logging.warning(f"Template layout '{slide_layout.name}' has no {' or '.join(missing)}; "
+                            "building its slides shape by shape (re-run scripts/add_layouts.py)")
+        _prebaked_layouts[slide_layout.part] = usable
+    return usable
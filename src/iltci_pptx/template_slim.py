@@ -0,0 +1,321 @@
+"""Slimmed copies of slide templates.
+
+Every generated deck carries its template's masters, layouts, themes and
+media, and every run parses them. slim_template() writes a copy that keeps
+only what the builders use: the sample slides (and the media and notes only
+they used) are removed, layouts the configuration does not select and
+masters left without layouts are dropped, the docProps thumbnail is
+removed, and master and layout images larger than their placement needs at
+template_slim.target_dpi are downsampled or re-encoded. The report
+attributes the size of the template to its parts before and after.
+"""
+
+import io
+import logging
+import posixpath
+import zipfile
+from pathlib import Path
+from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.packuri import PackURI
+from pptx.util import Emu
+from typing import Dict, Any, List, Optional, Tuple, TYPE_CHECKING
+from .config import Config
+from .image_cache import DOWNSAMPLE_THRESHOLD, FORMAT_EXTENSIONS
+from .images import LAYOUT_SPECS
+from .package_writer import save_presentation
+from .template_cache import collect_layouts, strip_slides
+
+if TYPE_CHECKING:
+    from pptx.presentation import Presentation as PresentationType
+
+# Layout looked up by name for layout directives (see build_layout_slide)
+_BASE_LAYOUT_NAME = 'Title and Content'
+
+# Layout indices read from the configuration by the builders
+_LAYOUT_INDEX_KEYS = (('layouts.title_slide_index', 0), ('layouts.content_slide_index', 1))
+
+# Image formats that can be resampled and re-encoded, by content type
+_RASTER_FORMATS = {'image/png': 'PNG', 'image/jpeg': 'JPEG'}
+_CONTENT_TYPES = {'PNG': 'image/png', 'JPEG': 'image/jpeg'}
+
+
+def get_slim_settings(config: Config) -> Dict[str, Any]:
+    """Read template slimming settings from config.
+
+    Args:
+        config: Configuration object
+
+    Returns:
+        Dictionary with target_dpi, format, jpeg_quality and keep_layouts keys
+    """
+    return {
+        'target_dpi': config.get('template_slim.target_dpi', 200),
+        'format': str(config.get('template_slim.format', 'keep')).lower(),
+        'jpeg_quality': config.get('template_slim.jpeg_quality', 85),
+        'keep_layouts': list(config.get('template_slim.keep_layouts', None) or []),
+    }
+
+
+def part_sizes(path: Path) -> Dict[str, Tuple[int, int]]:
+    """Uncompressed and compressed size of every part of a .pptx file.
+
+    Args:
+        path: Path to the .pptx file
+
+    Returns:
+        Dictionary of partname -> (uncompressed bytes, compressed bytes)
+    """
+    with zipfile.ZipFile(path) as zf:
+        return {f"/{info.filename}": (info.file_size, info.compress_size) for info in zf.infolist()}
+
+
+def layouts_to_keep(config: Config, all_layouts: List, keep_names: List[str]) -> List[int]:
+    """Indices of the layouts the builders can select.
+
+    Args:
+        config: Configuration object (layouts.title_slide_index, layouts.content_slide_index)
+        all_layouts: Layouts across all masters, in order
+        keep_names: Extra layout names to keep
+
+    Returns:
+        Sorted layout indices (never empty)
+    """
+    keep = {config.get(key, default) for key, default in _LAYOUT_INDEX_KEYS}
+    names = {_BASE_LAYOUT_NAME, *LAYOUT_SPECS, *keep_names}
+    keep.update(idx for idx, layout in enumerate(all_layouts) if layout.name in names)
+    keep = sorted(idx for idx in keep if 0 <= idx < len(all_layouts))
+    return keep or [0]
+
+
+def _drop_layouts(prs: 'PresentationType', keep: List[int]) -> Tuple[List[str], int]:
+    """Remove unkept layouts and the masters left without layouts.
+
+    Returns:
+        Tuple of (removed layout names, removed master count)
+    """
+    kept = {id(layout.part) for idx, layout in enumerate(collect_layouts(prs)) if idx in keep}
+    removed_layouts = []
+    for master in prs.slide_masters:
+        for layout in list(master.slide_layouts):
+            if id(layout.part) not in kept:
+                removed_layouts.append(layout.name)
+                master.slide_layouts.remove(layout)
+
+    removed_masters = 0
+    master_id_lst = prs.part._element.sldMasterIdLst
+    for master_id in list(master_id_lst.sldMasterId_lst):
+        master_part = prs.part.related_part(master_id.rId)
+        if len(master_part.slide_master.slide_layouts) == 0:
+            master_id_lst.remove(master_id)
+            prs.part.drop_rel(master_id.rId)
+            removed_masters += 1
+    return removed_layouts, removed_masters
+
+
+def _drop_thumbnail(prs: 'PresentationType') -> bool:
+    """Remove the docProps thumbnail relationship of the package, if any."""
+    package = prs.part.package
+    rIds = [rId for rId, rel in package._rels.items() if rel.reltype == RT.THUMBNAIL]
+    for rId in rIds:
+        package.drop_rel(rId)
+    return bool(rIds)
+
+
+def _placed_size(part, rId: str, slide_size: Tuple[int, int]) -> Tuple[int, int]:
+    """Largest size (EMU) at which a part shows the image related by rId.
+
+    Pictures and shape fills use their shape's extents; backgrounds and
+    anything without extents cover the whole slide.
+    """
+    width = height = 0
+    for blip in part._element.xpath(f'.//a:blip[@r:embed="{rId}"]'):
+        exts = blip.xpath('ancestor::p:pic[1]/p:spPr/a:xfrm/a:ext | ancestor::p:sp[1]/p:spPr/a:xfrm/a:ext')
+        cx, cy = (int(exts[0].get('cx')), int(exts[0].get('cy'))) if exts else slide_size
+        width, height = max(width, cx), max(height, cy)
+    return (width, height) if width and height else slide_size
+
+
+def _image_usages(prs: 'PresentationType') -> Dict[Any, List[Tuple[Any, str]]]:
+    """Image parts of the package with the (part, rId) pairs that show them."""
+    usages: Dict[Any, List[Tuple[Any, str]]] = {}
+    for part in prs.part.package.iter_parts():
+        for rId, rel in part.rels.items():
+            if not rel.is_external and rel.reltype == RT.IMAGE:
+                usages.setdefault(rel.target_part, []).append((part, rId))
+    return usages
+
+
+def _slim_image(image_part, placed: Tuple[int, int], settings: Dict[str, Any],
+                partnames: set) -> Optional[Dict[str, Any]]:
+    """Downsample or re-encode one image part in place when that makes it smaller.
+
+    Args:
+        image_part: Image part to slim
+        placed: Largest placement size in EMU
+        settings: Settings from get_slim_settings
+        partnames: Partnames in the package (updated when the extension changes)
+
+    Returns:
+        Description of the change, or None if the image was left alone
+    """
+    from PIL import Image
+
+    source_format = _RASTER_FORMATS.get(image_part.content_type)
+    if source_format is None:
+        return None
+    blob = image_part.blob
+    with Image.open(io.BytesIO(blob)) as img:
+        img.load()
+        src_w, src_h = img.size
+        has_alpha = img.mode in ('RGBA', 'LA', 'PA') or (img.mode == 'P' and 'transparency' in img.info)
+        out_format = source_format
+        if settings['format'] == 'png' or (settings['format'] == 'jpeg' and has_alpha):
+            out_format = 'PNG'
+        elif settings['format'] == 'jpeg':
+            out_format = 'JPEG'
+
+        # Cover the placement box at the target DPI on both axes
+        dpi = settings['target_dpi']
+        scale = min(max(Emu(placed[0]).inches * dpi / src_w, Emu(placed[1]).inches * dpi / src_h), 1.0)
+        size = (max(1, round(src_w * scale)), max(1, round(src_h * scale)))
+        if scale * DOWNSAMPLE_THRESHOLD >= 1.0:
+            size = (src_w, src_h)
+
+        processed = img
+        if processed.mode == 'P' or (out_format == 'JPEG' and processed.mode != 'RGB'):
+            processed = processed.convert('RGBA' if has_alpha else 'RGB')
+        if size != (src_w, src_h):
+            processed = processed.resize(size, Image.LANCZOS)
+        save_kwargs = {'optimize': True}
+        if out_format == 'JPEG':
+            save_kwargs['quality'] = settings['jpeg_quality']
+        out = io.BytesIO()
+        processed.save(out, format=out_format, **save_kwargs)
+
+    data = out.getvalue()
+    if len(data) >= len(blob):
+        return None
+
+    before = str(image_part.partname)
+    if out_format != source_format:
+        stem = posixpath.splitext(before)[0]
+        partname = f"{stem}{FORMAT_EXTENSIONS[out_format]}"
+        if partname in partnames:
+            partname = str(image_part.package.next_image_partname(FORMAT_EXTENSIONS[out_format][1:]))
+        partnames.discard(before)
+        partnames.add(partname)
+        image_part.partname = PackURI(partname)
+        image_part._content_type = _CONTENT_TYPES[out_format]
+    image_part._blob = data
+    return {
+        'partname': before,
+        'new_partname': str(image_part.partname),
+        'pixels': ((src_w, src_h), size),
+        'bytes': (len(blob), len(data)),
+    }
+
+
+def slim_template(template_path: Path, output_path: Path, config: Config) -> Dict[str, Any]:
+    """Write a slimmed copy of a template.
+
+    Args:
+        template_path: Template to slim
+        output_path: Where to write the slimmed copy
+        config: Configuration object (layouts.*, template_slim.*, package.*)
+
+    Returns:
+        Report with the part sizes before and after, what was removed and
+        the layout indices to configure for the slimmed copy
+    """
+    settings = get_slim_settings(config)
+    prs = Presentation(str(template_path))
+    all_layouts = collect_layouts(prs)
+    keep = layouts_to_keep(config, all_layouts, settings['keep_layouts'])
+    kept_parts = [all_layouts[idx].part for idx in keep]
+
+    removed_slides, _, _ = strip_slides(prs)
+    removed_layouts, removed_masters = _drop_layouts(prs, keep)
+    thumbnail = _drop_thumbnail(prs)
+
+    slide_size = (prs.slide_width, prs.slide_height)
+    partnames = {str(part.partname) for part in prs.part.package.iter_parts()}
+    images = []
+    for image_part, usages in _image_usages(prs).items():
+        sizes = [_placed_size(part, rId, slide_size) for part, rId in usages]
+        placed = (max(w for w, _ in sizes), max(h for _, h in sizes))
+        try:
+            change = _slim_image(image_part, placed, settings, partnames)
+        except Exception as e:
+            logging.warning(f"Could not slim image {image_part.partname}, keeping it: {e}")
+            continue
+        if change:
+            images.append(change)
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    save_presentation(prs, output_path, config)
+
+    # Kept layouts move up when earlier ones are dropped
+    new_index = {id(layout.part): idx for idx, layout in enumerate(collect_layouts(prs))}
+    layout_indices = {}
+    for key, default in _LAYOUT_INDEX_KEYS:
+        old = config.get(key, default)
+        if old in keep:
+            layout_indices[key] = (old, new_index[id(kept_parts[keep.index(old)])])
+
+    return {
+        'template': str(template_path),
+        'output': str(output_path),
+        'before': part_sizes(template_path),
+        'after': part_sizes(output_path),
+        'removed_slides': removed_slides,
+        'removed_layouts': removed_layouts,
+        'removed_masters': removed_masters,
+        'thumbnail_removed': thumbnail,
+        'images': images,
+        'layout_indices': layout_indices,
+    }
+
+
+def format_slim_report(report: Dict[str, Any]) -> str:
+    """Human-readable slimming report: per-part sizes before and after, then totals.
+
+    Args:
+        report: Report returned by slim_template
+
+    Returns:
+        Multi-line text
+    """
+    before, after = report['before'], report['after']
+    lines = [f"{'part':<48} {'before KB':>10} {'after KB':>10}"]
+    partnames = sorted(set(before) | set(after),
+                       key=lambda name: -max(before.get(name, (0, 0))[0], after.get(name, (0, 0))[0]))
+    for name in partnames:
+        old = f"{before[name][0] / 1024:10.1f}" if name in before else f"{'-':>10}"
+        new = f"{after[name][0] / 1024:10.1f}" if name in after else f"{'removed':>10}"
+        lines.append(f"{name:<48} {old} {new}")
+
+    def totals(sizes: Dict[str, Tuple[int, int]]) -> Tuple[int, int]:
+        return sum(size for size, _ in sizes.values()), sum(size for _, size in sizes.values())
+
+    (old_raw, old_zip), (new_raw, new_zip) = totals(before), totals(after)
+    lines.append(f"{'total (uncompressed)':<48} {old_raw / 1024:10.1f} {new_raw / 1024:10.1f}")
+    lines.append(f"{'total (in the .pptx)':<48} {old_zip / 1024:10.1f} {new_zip / 1024:10.1f}")
+
+    lines.append(f"Removed {report['removed_slides']} sample slide(s), "
+                 f"{len(report['removed_layouts'])} layout(s), {report['removed_masters']} master(s)"
+                 f"{' and the thumbnail' if report['thumbnail_removed'] else ''}")
+    if report['removed_layouts']:
+        lines.append(f"  Layouts removed: {', '.join(report['removed_layouts'])}")
+    for image in report['images']:
+        (src_w, src_h), (out_w, out_h) = image['pixels']
+        old_size, new_size = image['bytes']
+        lines.append(f"  {image['partname']} -> {image['new_partname']}: {src_w}x{src_h} -> {out_w}x{out_h}, "
+                     f"{old_size / 1024:.1f} KB -> {new_size / 1024:.1f} KB")
+    moved = {key: new for key, (old, new) in report['layout_indices'].items() if old != new}
+    if moved:
+        lines.append("Layout indices changed; set these in the template configuration:")
+        for key, new in moved.items():
+            lines.append(f"  {key}: {new}")
+    return '\n'.join(lines)
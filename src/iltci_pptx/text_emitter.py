@@ -0,0 +1,147 @@
+"""Direct XML emission of content text, bypassing python-pptx's proxy objects.
+
+Filling a content text frame through python-pptx creates every paragraph
+with add_paragraph(), every formatted span with add_run(), and sets font
+size, bold and bullets through proxy properties that each look up or insert
+one element at a time. emit_content_paragraphs() produces the same a:p
+elements from the content tokens in one go: paragraph properties and run
+attributes come from templates precomputed once per configuration, the
+paragraphs of a text frame are formatted as one XML string, parsed once and
+appended.
+
+The XML is identical to the python-pptx path (_populate_content_text_frame
+with formatting.text_emitter: pptx), down to attribute order: python-pptx
+appends attributes in the order properties are set, so the templates list
+them in that order (formatting first, then size, then header bold).
+"""
+
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+from pptx.oxml.simpletypes import ST_TextFontSize, ST_TextSpacingPoint
+from pptx.oxml.text import CT_RegularTextRun
+from pptx.util import Emu
+from typing import Dict, Any, List
+from xml.sax.saxutils import escape
+from .markdown_parser import Token, HEADING, BULLET, NUMBERED, SPACER
+from .rich_text import formatted_spans
+
+# Run attributes set by markdown formatting, in the order add_formatted_text sets them
+_SPAN_ATTRS = {
+    (False, False): '',
+    (True, True): ' b="1" i="1"',
+    (True, False): ' b="1"',
+    (False, True): ' i="1"',
+}
+_LINK_ATTRS = ' u="sng"'
+
+_TXBODY_OPEN = f'<a:txBody {nsdecls("a", "r")}>'
+_TXBODY_CLOSE = '</a:txBody>'
+
+
+def content_templates(style: Dict[str, Any]) -> Dict[str, Any]:
+    """Precompute the XML fragments for content text in one style.
+
+    Args:
+        style: Content text style (see slide_builders._content_text_style)
+
+    Returns:
+        Dictionary with paragraph property XML per paragraph kind, run size
+        attributes per kind and header level, the bullet-free spacer
+        paragraph and the numbering type
+    """
+    def size(length) -> str:
+        return f' sz="{ST_TextFontSize.to_xml(Emu(length).centipoints)}"'
+
+    spacer = style['spacer']
+    spacer_pts = ST_TextSpacingPoint.to_xml(spacer)
+    return {
+        'headers': {level: (size(font_size), bold)
+                    for level, (font_size, bold) in style['headers'].items()},
+        'body': size(style['body']),
+        'bullet': size(style['bullet']),
+        'numbered': size(style['numbered']),
+        'bullet_ppr': '<a:pPr><a:buChar char="•"/></a:pPr>',
+        'plain_ppr': '<a:pPr><a:buNone/></a:pPr>',
+        'numbering_type': escape(style['numbering_type'], {'"': '&quot;'}),
+        'spacer_p': (f'<a:p><a:pPr><a:spcBef><a:spcPts val="{spacer_pts}"/></a:spcBef>'
+                     f'<a:spcAft><a:spcPts val="0"/></a:spcAft><a:buNone/></a:pPr>'
+                     f'<a:r><a:rPr{size(spacer)}/><a:t> </a:t></a:r></a:p>'),
+    }
+
+
+def _runs_xml(text: str, size_attrs: str, header_bold: bool, part) -> str:
+    """a:r elements for one paragraph's formatted text.
+
+    Args:
+        text: Text with markdown formatting
+        size_attrs: sz attribute XML for every run
+        header_bold: Set b="1" after the size, as for bold headers
+        part: Part holding the text frame, which hyperlinks are related to
+
+    Returns:
+        Runs XML
+    """
+    runs = []
+    for span_text, bold, italic, url in formatted_spans(text):
+        children = ''
+        if url is not None:
+            attrs = _LINK_ATTRS + size_attrs
+            if url:
+                rId = part.relate_to(url, RT.HYPERLINK, is_external=True)
+                children = f'<a:hlinkClick r:id="{rId}"/>'
+        else:
+            attrs = _SPAN_ATTRS[bold, italic] + size_attrs
+        if header_bold and not bold:
+            attrs += ' b="1"'
+        # Same escaping of control characters as python-pptx's run.text
+        span_text = escape(CT_RegularTextRun._escape_ctrl_chars(span_text))
+        runs.append(f'<a:r><a:rPr{attrs}>{children}</a:rPr><a:t>{span_text}</a:t></a:r>'
+                    if children else f'<a:r><a:rPr{attrs}/><a:t>{span_text}</a:t></a:r>')
+    return ''.join(runs)
+
+
+def emit_content_paragraphs(text_frame, tokens: List[Token], templates: Dict[str, Any]) -> None:
+    """Append one paragraph per content token to a text frame.
+
+    Args:
+        text_frame: PowerPoint text frame object
+        tokens: Content tokens from the markdown parser
+        templates: Result of content_templates() for the content style
+    """
+    part = text_frame.part
+    header_styles = templates['headers']
+    paragraphs = []
+    has_empty_run = False
+
+    for token in tokens:
+        if token.kind == SPACER:
+            paragraphs.append(templates['spacer_p'])
+            continue
+
+        if token.kind == HEADING:
+            size_attrs, bold = header_styles[token.level]
+            ppr = templates['plain_ppr']
+            runs = _runs_xml(token.text, size_attrs, bold, part)
+        elif token.kind == BULLET:
+            ppr = templates['bullet_ppr']
+            runs = _runs_xml(token.text, templates['bullet'], False, part)
+        elif token.kind == NUMBERED:
+            start_at = f' startAt="{token.number}"' if token.number > 1 else ''
+            ppr = f'<a:pPr><a:buAutoNum type="{templates["numbering_type"]}"{start_at}/></a:pPr>'
+            runs = _runs_xml(token.text, templates['numbered'], False, part)
+        else:
+            ppr = templates['plain_ppr']
+            runs = _runs_xml(token.text, templates['body'], False, part)
+        has_empty_run = has_empty_run or '<a:t></a:t>' in runs
+        paragraphs.append(f'<a:p>{ppr}{runs}</a:p>')
+
+    if not paragraphs:
+        return
+    txBody = parse_xml(_TXBODY_OPEN + ''.join(paragraphs) + _TXBODY_CLOSE)
+    if has_empty_run:
+        # python-pptx writes an empty run text as <a:t></a:t>; parsing yields <a:t/>
+        for t in txBody.iter(qn('a:t')):
+            if t.text is None:
+                t.text = ''
+    text_frame._txBody.extend(list(txBody))
@@ -0,0 +1,164 @@
+"""Structured timing of presentation generation.
+
+PresentationGenerator.generate() returns a GenerationReport holding the time
+spent in each phase and on each slide. Code deep in the call tree (template
+stripping, image embedding) records into the report of the generation that
+is running in the current thread or task through timed(), which does nothing
+when no report is active.
+
+Phases:
+    parse            Markdown parsing
+    template_load    Template load or snapshot clone (includes template_strip)
+    template_strip   Removing the template's own slides (only on a cold snapshot)
+    result_cache     Fingerprinting the deck and looking it up in the result cache
+    build            Building or reusing slides (includes image_prepare, image_embed, text)
+    image_prepare    Image preprocessing (resampling, cache lookups)
+    image_embed      Adding picture shapes, including image part creation
+    text             Filling content text frames with paragraphs and runs
+    save             Writing the .pptx package
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, Iterator, List, Optional
+
+# Phases in pipeline order, used to order summaries
+PHASES = ['parse', 'template_load', 'template_strip', 'result_cache', 'build', 'image_prepare', 'image_embed',
+          'text', 'save']
+
+# Report of the generation running in the current context
+_active_report: ContextVar[Optional['GenerationReport']] = ContextVar('active_report', default=None)
+
+
+class GenerationReport:
+    """Phase and per-slide timings of one generate() call."""
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+        self.phase_counts: Dict[str, int] = {}
+        self.slides: List[Dict[str, Any]] = []
+        self.total_seconds = 0.0
+        self.output_path = None
+        self.cached = False
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Add time to a phase.
+
+        Args:
+            phase: Phase name
+            seconds: Elapsed time in seconds
+        """
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+        self.phase_counts[phase] = self.phase_counts.get(phase, 0) + 1
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as one occurrence of a phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add_slide(self, index: int, title: str, builder: str, layout: Optional[str],
+                  seconds: float) -> None:
+        """Record the time spent on one slide (also counted in the build phase).
+
+        Args:
+            index: Zero-based slide index
+            title: Slide title
+            builder: 'title', 'content', 'layout' or 'reused'
+            layout: Layout directive of the slide, if any
+            seconds: Elapsed time in seconds
+        """
+        self.slides.append({
+            'index': index,
+            'title': title,
+            'builder': builder,
+            'layout': layout,
+            'seconds': seconds,
+        })
+        self.add('build', seconds)
+
+    def builder_totals(self) -> Dict[str, Dict[str, Any]]:
+        """Slide count and time per builder, layout slides keyed 'layout:<name>'."""
+        totals: Dict[str, Dict[str, Any]] = {}
+        for slide in self.slides:
+            label = slide['builder']
+            if label == 'layout':
+                label = f"layout:{slide['layout']}"
+            entry = totals.setdefault(label, {'count': 0, 'seconds': 0.0})
+            entry['count'] += 1
+            entry['seconds'] += slide['seconds']
+        return totals
+
+    def slowest_slides(self, count: int = 5) -> List[Dict[str, Any]]:
+        """The slides that took longest to build, slowest first."""
+        return sorted(self.slides, key=lambda slide: slide['seconds'], reverse=True)[:count]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form of the report."""
+        return {
+            'output_path': str(self.output_path) if self.output_path else None,
+            'total_seconds': self.total_seconds,
+            'cached': self.cached,
+            'phases': dict(self.phases),
+            'phase_counts': dict(self.phase_counts),
+            'builders': self.builder_totals(),
+            'slides': list(self.slides),
+        }
+
+    def format_summary(self, slowest: int = 5) -> str:
+        """Human-readable summary: phase totals, builders and the slowest slides.
+
+        Args:
+            slowest: Number of slowest slides to list
+
+        Returns:
+            Multi-line text
+        """
+        if self.cached:
+            lines = [f"Copied from the result cache in {self.total_seconds * 1000:.0f} ms"]
+        else:
+            lines = [f"Generated {len(self.slides)} slide(s) in {self.total_seconds * 1000:.0f} ms"]
+        order = {name: i for i, name in enumerate(PHASES)}
+        for name in sorted(self.phases, key=lambda name: order.get(name, len(PHASES))):
+            lines.append(f"  {name:<16} {self.phases[name] * 1000:9.1f} ms  ({self.phase_counts[name]}x)")
+        builders = self.builder_totals()
+        if builders:
+            lines.append("Per builder:")
+            for label, entry in sorted(builders.items()):
+                lines.append(f"  {label:<32} {entry['count']:5d} slide(s) "
+                             f"{entry['seconds'] * 1000 / entry['count']:8.2f} ms/slide")
+        if self.slides and slowest:
+            lines.append("Slowest slides:")
+            for slide in self.slowest_slides(slowest):
+                label = slide['builder'] if slide['builder'] != 'layout' else f"layout:{slide['layout']}"
+                lines.append(f"  #{slide['index'] + 1:<5} {slide['seconds'] * 1000:8.2f} ms  "
+                             f"{label:<28} {slide['title']}")
+        return '\n'.join(lines)
+
+
+@contextmanager
+def recording(report: GenerationReport) -> Iterator[GenerationReport]:
+    """Make a report the target of timed() for the enclosed block."""
+    token = _active_report.set(report)
+    try:
+        yield report
+    finally:
+        _active_report.reset(token)
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    """Time the enclosed block into the active report, if any."""
+    report = _active_report.get()
+    if report is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        report.add(phase, time.perf_counter() - start)
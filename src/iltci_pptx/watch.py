@@ -0,0 +1,148 @@
+"""Watch mode: regenerate the presentation whenever its inputs change."""
+
+import logging
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+from .config import Config
+from .generator import PresentationGenerator
+from .incremental import referenced_image_paths
+from .markdown_parser import parse_markdown_slides
+
+# (mtime_ns, size) per watched file, None when the file does not exist
+Stamps = Dict[Path, Optional[Tuple[int, int]]]
+
+
+def collect_watch_paths(config: Config) -> Tuple[List[Path], List[Path]]:
+    """List the files a build depends on.
+
+    Args:
+        config: Configuration object
+
+    Returns:
+        Tuple of (config_files, input_files); a change to a config file
+        requires reloading the Config before rebuilding
+    """
+    config_files = [config.config_path]
+    template_config = config._paths.get('template_config')
+    if template_config:
+        config_files.append(config._resolve_path_value(template_config))
+
+    content_path = config.content_path
+    input_files = [content_path, config.template_path]
+    try:
+        frontmatter, slides = parse_markdown_slides(content_path, config)
+    except OSError:
+        return config_files, input_files
+
+    if 'template' in frontmatter:
+        input_files.append(config.project_root / frontmatter['template'])
+    for slide_data in slides:
+        input_files.extend(referenced_image_paths(slide_data))
+    return config_files, input_files
+
+
+def take_stamps(paths: List[Path]) -> Stamps:
+    """Stat every path.
+
+    Args:
+        paths: Files to stat
+
+    Returns:
+        Mapping of resolved path to (mtime_ns, size), or None if missing
+    """
+    stamps = {}
+    for path in paths:
+        path = Path(path).resolve()
+        try:
+            stat = path.stat()
+            stamps[path] = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            stamps[path] = None
+    return stamps
+
+
+def changed_paths(before: Stamps, after: Stamps) -> List[Path]:
+    """Return the paths whose stamp differs between two snapshots."""
+    return [path for path in after if before.get(path) != after[path]]
+
+
+def watch(load_config: Callable[[], Config], interval: float = 0.25,
+          debounce: float = 0.3, max_rebuilds: Optional[int] = None) -> int:
+    """Rebuild the presentation whenever its inputs change, until interrupted.
+
+    Files are polled every `interval` seconds. After a change, the build waits
+    until no further change has been seen for `debounce` seconds, so an
+    editor writing several files in a burst triggers a single rebuild.
+    Config, parsed templates and the image index stay warm in this process
+    between rebuilds.
+
+    Args:
+        load_config: Returns a freshly loaded Config (with CLI overrides applied)
+        interval: Polling interval in seconds
+        debounce: Quiet period in seconds before rebuilding
+        max_rebuilds: Stop after this many rebuilds after the initial build (for scripting)
+
+    Returns:
+        Exit code (0 when stopped by the user)
+    """
+    config = load_config()
+    rebuilds = 0
+
+    def build(reason: str) -> Tuple[List[Path], List[Path], Stamps, Stamps]:
+        """Stamp the inputs, then build; returns the files and stamps to compare against.
+
+        Stamping first means a file saved while the build runs still differs
+        from its stamp and triggers another rebuild. Collecting the inputs
+        parses the markdown, and the build reuses those slides from the
+        parser's slide cache.
+        """
+        config_files, input_files = collect_watch_paths(config)
+        config_stamps, input_stamps = take_stamps(config_files), take_stamps(input_files)
+        start = time.perf_counter()
+        try:
+            PresentationGenerator(config).generate()
+        except Exception as e:
+            logging.exception("Error generating presentation")
+            print(f"[watch] Build failed ({reason}): {e}")
+        else:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            print(f"[watch] Rebuilt {config.output_path.name} in {elapsed_ms:.0f} ms ({reason})")
+        return config_files, input_files, config_stamps, input_stamps
+
+    config_files, input_files, config_stamps, input_stamps = build('initial build')
+    print(f"[watch] Watching {len(config_stamps) + len(input_stamps)} file(s); press Ctrl+C to stop")
+
+    try:
+        while max_rebuilds is None or rebuilds < max_rebuilds:
+            time.sleep(interval)
+            changed = (changed_paths(config_stamps, take_stamps(config_files))
+                       + changed_paths(input_stamps, take_stamps(input_files)))
+            if not changed:
+                continue
+
+            # Debounce: wait for a quiet period before rebuilding
+            settled = take_stamps(config_files + input_files)
+            while True:
+                time.sleep(debounce)
+                latest = take_stamps(config_files + input_files)
+                if latest == settled:
+                    break
+                settled = latest
+
+            config_changed = changed_paths(config_stamps, take_stamps(config_files))
+            if config_changed:
+                try:
+                    config = load_config()
+                except Exception as e:
+                    print(f"[watch] Could not reload configuration: {e}")
+                    config_stamps = take_stamps(config_files)
+                    continue
+
+            names = ', '.join(sorted({p.name for p in changed}))
+            # Inputs may have changed too (new images, a different template)
+            config_files, input_files, config_stamps, input_stamps = build(f"changed: {names}")
+            rebuilds += 1
+    except KeyboardInterrupt:
+        print("\n[watch] Stopped")
+    return 0
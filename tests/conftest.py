@@ -0,0 +1,49 @@
+"""Shared fixtures for the generator tests.
+
+Decks reference images relative to the repository root, so every test runs
+there. The configuration fixture is the app's own, with every on-disk cache
+and the output redirected into the test's temporary directory.
+"""
+
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from iltci_pptx.config import Config
+from benchmarks.synthetic_deck import make_deck
+
+from helpers import REPO_ROOT
+
+
+@pytest.fixture(autouse=True)
+def repo_cwd(monkeypatch):
+    """Run each test from the repository root."""
+    monkeypatch.chdir(REPO_ROOT)
+
+
+@pytest.fixture
+def config(tmp_path) -> Config:
+    """app/config.yaml with caches and output under tmp_path, optional caches off."""
+    config = Config(str(REPO_ROOT / 'app' / 'config.yaml'))
+    config.set('paths.output', str(tmp_path / 'out.pptx'))
+    config.set('image_processing.enabled', False)
+    config.set('image_processing.cache_dir', str(tmp_path / 'cache' / 'images'))
+    config.set('image_index.path', str(tmp_path / 'cache' / 'image-index.json'))
+    config.set('incremental.enabled', False)
+    config.set('incremental.manifest_dir', str(tmp_path / 'cache' / 'incremental'))
+    config.set('result_cache.enabled', False)
+    config.set('result_cache.dir', str(tmp_path / 'cache' / 'results'))
+    config.set('artifacts.dir', str(tmp_path / 'cache' / 'artifacts'))
+    return config
+
+
+@pytest.fixture
+def write_deck(tmp_path) -> Callable[..., Path]:
+    """Write a synthetic deck (see benchmarks/synthetic_deck.py) and return its path."""
+    def write(num_slides: int, name: str = 'deck.md') -> Path:
+        path = tmp_path / name
+        path.write_text(make_deck(num_slides), encoding='utf-8')
+        return path
+    return write
+
@@ -0,0 +1,23 @@
+"""Helpers shared by the generator tests."""
+
+import io
+import zipfile
+from pathlib import Path
+from typing import Dict, Union
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def read_parts(pptx: Union[Path, bytes], prefix: str = 'ppt/slides/') -> Dict[str, bytes]:
+    """Return the parts of a .pptx whose names start with prefix, by name.
+
+    Args:
+        pptx: Path to a .pptx file, or its bytes
+        prefix: Member name prefix (default: slide XML and slide relationships)
+
+    Returns:
+        Dictionary of member name -> bytes
+    """
+    source = pptx if isinstance(pptx, Path) else io.BytesIO(pptx)
+    with zipfile.ZipFile(source) as archive:
+        return {name: archive.read(name) for name in archive.namelist() if name.startswith(prefix)}
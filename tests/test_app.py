@@ -0,0 +1,40 @@
+"""Tests for the Streamlit app's generation settings (app/app.py)."""
+
+import time
+from types import SimpleNamespace
+
+from app import app
+from iltci_pptx import jobs, package_writer
+from iltci_pptx.artifact_store import get_artifact_store
+from iltci_pptx.config import Config
+from iltci_pptx.jobs import GenerationJob
+
+# Settings the config fixture moves under tmp_path
+ISOLATED_KEYS = ['paths.output', 'image_processing.enabled', 'image_processing.cache_dir', 'image_index.path',
+                 'incremental.enabled', 'incremental.manifest_dir', 'result_cache.enabled', 'result_cache.dir',
+                 'artifacts.dir']
+
+
+def _generate(config, base_config, log_level, markdown):
+    """One session's generation, as the app runs it, stored as an artifact."""
+    session = Config.from_dict(app.session_config(base_config, True, log_level), app.app_dir)
+    for key in ISOLATED_KEYS:
+        session.set(key, config.get(key))
+    job = GenerationJob(session, markdown).start()
+    assert job.wait(timeout=60) and job.state == jobs.DONE
+    return get_artifact_store(session).put(job.result)
+
+
+def test_identical_decks_from_two_sessions_share_one_artifact(config, write_deck, monkeypatch):
+    markdown = write_deck(6).read_bytes()
+    base_config = app.load_base_config()
+
+    first = _generate(config, base_config, 'INFO', markdown)
+    # The second session runs an hour later, which changes ZIP timestamps unless fixed
+    later = time.time() + 3600
+    monkeypatch.setattr(package_writer, 'time', SimpleNamespace(time=lambda: later, localtime=time.localtime))
+    second = _generate(config, base_config, 'DEBUG', markdown)
+
+    assert first == second
+    assert get_artifact_store(config).stats()['count'] == 1
+    assert base_config.get('package', {}).get('deterministic') is None
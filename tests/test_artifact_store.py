@@ -0,0 +1,89 @@
+"""Tests for the on-disk artifact store (artifact_store.ArtifactStore)."""
+
+import hashlib
+import os
+import time
+
+import pytest
+
+from iltci_pptx.artifact_store import ArtifactStore, get_artifact_store
+
+
+def _age(store, handle, seconds):
+    """Move an artifact's last use into the past."""
+    path = store._path(handle)
+    stamp = time.time() - seconds
+    os.utime(path, (stamp, stamp))
+
+
+def test_put_is_content_addressed_and_shared(tmp_path):
+    store = ArtifactStore(tmp_path, max_bytes=1024)
+    handle = store.put(b'deck')
+
+    assert handle == hashlib.sha1(b'deck').hexdigest()
+    assert store.put(b'deck') == handle
+    assert store.read(handle) == b'deck'
+    assert store.stats() == {'count': 1, 'bytes': 4}
+
+
+def test_put_file_under_a_caller_key(tmp_path):
+    source = tmp_path / 'source.pptx'
+    source.write_bytes(b'cached deck')
+    store = ArtifactStore(tmp_path / 'store', max_bytes=1024)
+    key = hashlib.sha1(b'inputs').hexdigest()
+
+    assert store.put_file(source, key) == key
+    assert store.read(key) == b'cached deck'
+
+
+def test_least_recently_used_are_evicted_first(tmp_path):
+    store = ArtifactStore(tmp_path, max_bytes=20)
+    old = store.put(b'a' * 8)
+    used = store.put(b'b' * 8)
+    _age(store, old, 20)
+    _age(store, used, 10)
+    assert store.path(used) is not None
+
+    new = store.put(b'c' * 8)
+    assert store.read(old) is None
+    assert store.read(used) == b'b' * 8
+    assert store.read(new) == b'c' * 8
+
+
+def test_newest_artifact_survives_even_over_the_cap(tmp_path):
+    store = ArtifactStore(tmp_path, max_bytes=10)
+    older = store.put(b'small')
+    _age(store, older, 10)
+
+    big = store.put(b'x' * 64)
+    assert store.read(big) == b'x' * 64
+    assert store.read(older) is None
+
+
+def test_expired_artifacts_are_gone(tmp_path):
+    store = ArtifactStore(tmp_path, max_bytes=1024, ttl_seconds=60)
+    handle = store.put(b'deck')
+    _age(store, handle, 120)
+
+    assert store.path(handle) is None
+    assert store.read(handle) is None
+    assert store.stats()['count'] == 0
+
+
+def test_missing_and_invalid_handles(tmp_path):
+    store = ArtifactStore(tmp_path, max_bytes=1024)
+    handle = store.put(b'deck')
+    store._path(handle).unlink()
+
+    assert store.read(handle) is None
+    with pytest.raises(ValueError):
+        store.read('../../etc/passwd')
+
+
+def test_shared_store_follows_config(config, tmp_path):
+    store = get_artifact_store(config)
+    assert store.root == tmp_path / 'cache' / 'artifacts'
+    assert get_artifact_store(config) is store
+
+    config.set('artifacts.max_mb', 1)
+    assert get_artifact_store(config).max_bytes == 1024 * 1024
@@ -0,0 +1,83 @@
+"""Tests for batch generation (batch)."""
+
+import pytest
+
+from iltci_pptx import batch
+from iltci_pptx.batch import collect_batch_inputs, run_batch
+from iltci_pptx.slide_builders import _content_text_style
+
+from helpers import read_parts
+
+
+@pytest.fixture
+def decks(tmp_path, write_deck):
+    """Two synthetic decks in tmp_path/decks, plus a non-markdown file."""
+    deck_dir = tmp_path / 'decks'
+    deck_dir.mkdir()
+    paths = [write_deck(4, name='decks/alpha.md'), write_deck(6, name='decks/beta.md')]
+    (deck_dir / 'notes.txt').write_text('not a deck', encoding='utf-8')
+    return paths
+
+
+def test_directory_input(decks, tmp_path):
+    pairs = collect_batch_inputs(str(tmp_path / 'decks'), tmp_path / 'out', tmp_path)
+    assert pairs == [(decks[0], tmp_path / 'out' / 'alpha.pptx'),
+                     (decks[1], tmp_path / 'out' / 'beta.pptx')]
+
+
+def test_glob_input_relative_to_the_project_root(decks, tmp_path):
+    pairs = collect_batch_inputs('decks/b*.md', tmp_path / 'out', tmp_path)
+    assert pairs == [(decks[1], tmp_path / 'out' / 'beta.pptx')]
+
+
+def test_manifest_input(decks, tmp_path):
+    manifest = tmp_path / 'batch.yaml'
+    manifest.write_text("- decks/alpha.md\n"
+                        "- content: decks/beta.md\n"
+                        "  output: custom/beta-deck.pptx\n", encoding='utf-8')
+
+    pairs = collect_batch_inputs(str(manifest), tmp_path / 'out', tmp_path)
+    assert pairs == [(decks[0], tmp_path / 'out' / 'alpha.pptx'),
+                     (decks[1], tmp_path / 'custom' / 'beta-deck.pptx')]
+
+
+def test_duplicate_stems_are_rejected(decks, tmp_path, write_deck):
+    write_deck(2, name='alpha.md')
+    manifest = tmp_path / 'batch.yaml'
+    manifest.write_text("- decks/alpha.md\n- alpha.md\n", encoding='utf-8')
+
+    with pytest.raises(ValueError, match='both write to'):
+        collect_batch_inputs(str(manifest), tmp_path / 'out', tmp_path)
+
+
+def test_missing_input(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        collect_batch_inputs('nowhere', tmp_path / 'out', tmp_path)
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_run_batch(config, decks, tmp_path, jobs):
+    pairs = collect_batch_inputs(str(tmp_path / 'decks'), tmp_path / 'out', tmp_path)
+    caller_output = config.get('paths.output')
+
+    results = run_batch(config, pairs, jobs=jobs)
+
+    assert [result['output'] for result in results] == [output for _, output in pairs]
+    assert [result['error'] for result in results] == [None, None]
+    for (content, output), slides in zip(pairs, (4, 6)):
+        parts = read_parts(output)
+        assert len([name for name in parts if '/_rels/' not in name]) == slides
+    # The decks were generated from a copy; the caller's paths are untouched
+    assert config.get('paths.output') == caller_output
+    assert config.get('paths.content') != str(decks[-1])
+    assert batch._worker_config is None
+
+
+def test_switching_decks_keeps_derived_styles(config, decks, tmp_path, monkeypatch):
+    pairs = collect_batch_inputs(str(tmp_path / 'decks'), tmp_path / 'out', tmp_path)
+    calls = []
+    monkeypatch.setattr('iltci_pptx.slide_builders._content_text_style',
+                        lambda config: calls.append(1) or _content_text_style(config))
+
+    run_batch(config, pairs, jobs=1)
+    assert len(calls) == 1
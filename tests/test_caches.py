@@ -0,0 +1,84 @@
+"""Tests for the template snapshot cache and the parsed-slide cache."""
+
+import shutil
+
+import pytest
+
+from iltci_pptx import markdown_parser, template_cache
+from iltci_pptx.generator import PresentationGenerator
+from iltci_pptx.markdown_parser import clear_slide_cache, parse_markdown_text
+from iltci_pptx.template_cache import get_snapshot, get_snapshot_for_bytes, template_digest
+
+from helpers import REPO_ROOT, read_parts
+
+TEMPLATE = REPO_ROOT / 'templates' / 'template.pptx'
+
+
+@pytest.fixture
+def empty_caches(monkeypatch):
+    """Start from empty template and slide caches, restored afterwards."""
+    monkeypatch.setattr(template_cache, '_snapshots', type(template_cache._snapshots)())
+    monkeypatch.setattr(template_cache, '_path_index', {})
+    clear_slide_cache()
+    yield
+    clear_slide_cache()
+
+
+def test_snapshot_is_shared_by_path_and_content(empty_caches):
+    snapshot = get_snapshot(TEMPLATE)
+    assert get_snapshot(TEMPLATE) is snapshot
+    assert get_snapshot_for_bytes(TEMPLATE.read_bytes()) is snapshot
+    assert template_digest(TEMPLATE) == snapshot.sha1
+
+
+def test_clones_are_independent(empty_caches):
+    snapshot = get_snapshot(TEMPLATE)
+    first, layouts, layout_map = snapshot.clone()
+    first.slides.add_slide(layouts[0])
+
+    second, _, second_map = snapshot.clone()
+    assert len(first.slides) == 1
+    assert len(second.slides) == 0
+    assert second_map == layout_map
+    assert sorted(layout_map.values()) == list(range(len(layouts)))
+
+
+def test_changed_template_file_is_reparsed(empty_caches, tmp_path):
+    template = tmp_path / 'template.pptx'
+    shutil.copyfile(TEMPLATE, template)
+    snapshot = get_snapshot(template)
+
+    template.write_bytes(TEMPLATE.read_bytes() + b'\0')
+    assert template_digest(template) != snapshot.sha1
+    assert get_snapshot_for_bytes(template.read_bytes()) is not snapshot
+
+
+def test_snapshot_cache_is_bounded(empty_caches, monkeypatch):
+    monkeypatch.setattr(template_cache, 'MAX_CACHED_TEMPLATES', 2)
+    blob = TEMPLATE.read_bytes()
+    # Trailing bytes after the ZIP directory give distinct digests of the same template
+    for padding in range(3):
+        get_snapshot_for_bytes(blob + b'\0' * padding)
+    assert len(template_cache._snapshots) == 2
+
+
+def test_unchanged_slides_are_not_reparsed(config, empty_caches, monkeypatch):
+    text = "# One\n\n- a\n\n---\n\n# Two\n\n- b\n"
+    _, first = parse_markdown_text(text, config)
+
+    calls = []
+    build = markdown_parser._build_slide_data
+    monkeypatch.setattr(markdown_parser, '_build_slide_data',
+                        lambda *args: calls.append(args) or build(*args))
+    _, second = parse_markdown_text(text.replace('- b', '- c'), config)
+
+    assert second[0] is first[0]
+    assert second[1]['title'] == 'Two'
+    assert len(calls) == 1
+
+
+def test_cached_template_output_matches_a_fresh_parse(config, write_deck, empty_caches):
+    config.set('paths.content', str(write_deck(6)))
+    first = read_parts(PresentationGenerator(config).generate().output_path)
+    second = read_parts(PresentationGenerator(config).generate().output_path)
+    assert first == second
@@ -0,0 +1,59 @@
+"""Tests for the configuration lookup caches (config.Config)."""
+
+import copy
+import pickle
+
+
+def _title_style(config):
+    return {'size': config.get('fonts.title_slide.title')}
+
+
+def test_get_reflects_set(config):
+    config.get('fonts.title_slide.title')
+    config.set('fonts.title_slide.title', 99)
+    assert config.get('fonts.title_slide.title') == 99
+    assert config.get('fonts.title_slide')['title'] == 99
+
+    config.set('settings.new_section.flag', True)
+    assert config.get('settings.new_section') == {'flag': True}
+
+
+def test_derived_recomputes_after_set(config):
+    calls = []
+
+    def factory(config):
+        calls.append(1)
+        return _title_style(config)
+
+    first = config.derived(factory)
+    assert config.derived(factory) is first
+    config.set('fonts.title_slide.title', 99)
+    assert config.derived(factory) == {'size': 99}
+    assert len(calls) == 2
+
+
+def test_path_changes_keep_derived_values(config, tmp_path):
+    first = config.derived(_title_style)
+    config.set('paths.content', str(tmp_path / 'other.md'))
+
+    assert config.get('paths.content') == str(tmp_path / 'other.md')
+    assert config.content_path == tmp_path / 'other.md'
+    assert config.derived(_title_style) is first
+
+
+def test_sections_are_copies(config):
+    section = config.get('fonts.title_slide')
+    section['title'] = -1
+    assert config.get('fonts.title_slide.title') != -1
+    assert config.get('fonts')['title_slide']['title'] != -1
+
+
+def test_pickling_drops_the_caches(config):
+    config.get('fonts.title_slide.title')
+    config.derived(_title_style)
+    assert config._flat is not None and config._derived
+
+    for clone in (pickle.loads(pickle.dumps(config)), copy.deepcopy(config)):
+        assert '_flat' not in vars(clone) and '_derived' not in vars(clone)
+        assert clone.get('fonts.title_slide.title') == config.get('fonts.title_slide.title')
+        assert clone.derived(_title_style) == config.derived(_title_style)
@@ -0,0 +1,34 @@
+"""Tests for the in-memory generation API (generate_bytes, generate_to_stream)."""
+
+import io
+
+from iltci_pptx.generator import PresentationGenerator
+
+from helpers import REPO_ROOT, read_parts
+
+
+def test_generate_bytes_matches_file_output(config, write_deck):
+    deck = write_deck(12)
+    config.set('paths.content', str(deck))
+    report = PresentationGenerator(config).generate()
+
+    data = PresentationGenerator(config).generate_bytes(deck.read_text(encoding='utf-8'))
+    assert read_parts(data) == read_parts(report.output_path)
+
+
+def test_generate_to_stream_accepts_files_and_template_bytes(config, write_deck):
+    deck = write_deck(6)
+    generator = PresentationGenerator(config)
+    expected = read_parts(generator.generate_bytes(deck.read_text(encoding='utf-8')))
+
+    output = io.BytesIO()
+    template = (REPO_ROOT / 'templates' / 'template.pptx').read_bytes()
+    with open(deck, 'rb') as markdown:
+        report = generator.generate_to_stream(markdown, output, template=template)
+    assert read_parts(output.getvalue()) == expected
+    assert len(report.slides) == 6
+
+
+def test_nothing_is_written_to_the_output_path(config, tmp_path):
+    PresentationGenerator(config).generate_bytes("# Only slide\n\nSome text\n")
+    assert not (tmp_path / 'out.pptx').exists()
@@ -0,0 +1,59 @@
+"""Tests for image preprocessing (image_cache)."""
+
+import re
+
+from PIL import Image
+
+from iltci_pptx.generator import PresentationGenerator
+from iltci_pptx.image_cache import prepare_image
+
+from helpers import REPO_ROOT, read_parts
+
+# 1920x1080 PNG, far more pixels than a 2 x 1 inch box needs at 200 DPI
+LARGE_IMAGE = REPO_ROOT / 'assets' / 'title_slide_bg_image1.png'
+
+
+def test_disabled_preprocessing_embeds_original(config):
+    assert prepare_image(LARGE_IMAGE, 2.0, 1.0, config) == LARGE_IMAGE
+
+
+def test_oversized_image_is_resampled_into_cache(config):
+    config.set('image_processing.enabled', True)
+    config.set('image_processing.target_dpi', 100)
+
+    prepared = prepare_image(LARGE_IMAGE, 2.0, 1.0, config)
+
+    assert prepared != LARGE_IMAGE
+    assert prepared.parent == config.project_root / config.get('image_processing.cache_dir')
+    with Image.open(prepared) as img:
+        assert img.width <= 200 and img.height <= 113
+    assert prepared.stat().st_size < LARGE_IMAGE.stat().st_size
+
+
+def test_cached_image_is_reused(config):
+    config.set('image_processing.enabled', True)
+    first = prepare_image(LARGE_IMAGE, 2.0, 1.0, config)
+    mtime = first.stat().st_mtime_ns
+
+    second = prepare_image(LARGE_IMAGE, 2.0, 1.0, config)
+
+    assert second == first
+    assert second.stat().st_mtime_ns == mtime
+
+
+def test_image_fitting_its_box_is_not_processed(config):
+    config.set('image_processing.enabled', True)
+    assert prepare_image(LARGE_IMAGE, 13.33, 7.5, config) == LARGE_IMAGE
+
+
+def test_resampled_pictures_keep_source_names(config):
+    config.set('image_processing.enabled', True)
+
+    PresentationGenerator(config).generate()
+
+    names = []
+    for xml in read_parts(config.output_path).values():
+        names += re.findall(rb'descr="([^"]*)"', xml)
+    assert names
+    for name in names:
+        assert (REPO_ROOT / 'assets' / name.decode()).exists(), name
@@ -0,0 +1,71 @@
+"""Tests for the shared image metadata index (image_index)."""
+
+import hashlib
+import shutil
+
+from PIL import Image
+
+from iltci_pptx import image_index
+from iltci_pptx.generator import PresentationGenerator
+from iltci_pptx.image_index import ImageIndex, get_image_index
+
+from helpers import REPO_ROOT, read_parts
+
+IMAGE = REPO_ROOT / 'assets' / 'git-jj.png'
+
+
+def test_lookup_matches_the_file():
+    entry = ImageIndex().lookup(IMAGE)
+
+    with Image.open(IMAGE) as img:
+        assert (entry['width'], entry['height'], entry['format']) == (*img.size, img.format)
+    assert entry['size'] == IMAGE.stat().st_size
+    assert entry['sha1'] == hashlib.sha1(IMAGE.read_bytes()).hexdigest()
+
+
+def test_persisted_entries_are_reused(tmp_path, monkeypatch):
+    index_path = tmp_path / 'index.json'
+    index = ImageIndex(index_path)
+    entry = index.lookup(IMAGE)
+    index.save()
+
+    reloaded = ImageIndex(index_path)
+    assert len(reloaded) == 1
+    # An unchanged file is answered from the index without opening it
+    def fail(*args, **kwargs):
+        raise AssertionError("image file was read")
+    monkeypatch.setattr(image_index, 'open', fail, raising=False)
+    assert reloaded.lookup(IMAGE) == entry
+
+
+def test_changed_file_is_read_again(tmp_path):
+    image = tmp_path / 'image.png'
+    shutil.copy(IMAGE, image)
+    index = ImageIndex()
+    before = index.lookup(image)
+
+    Image.new('RGB', (10, 20)).save(image)
+
+    after = index.lookup(image)
+    assert (after['width'], after['height']) == (10, 20)
+    assert after['sha1'] != before['sha1']
+
+
+def test_shared_index_follows_config(config):
+    assert get_image_index(config) is get_image_index(config)
+    assert get_image_index(config).index_path == config.project_root / config.get('image_index.path')
+
+
+def test_repeated_images_are_embedded_once(config, write_deck):
+    # 24 slides cycle through the assets, so several images appear more than once
+    config.set('paths.content', str(write_deck(24)))
+
+    PresentationGenerator(config).generate()
+
+    slides = read_parts(config.output_path)
+    references = sum(xml.count(b'relationships/image"') for name, xml in slides.items()
+                     if name.endswith('.rels'))
+    media = read_parts(config.output_path, 'ppt/media/')
+    digests = [hashlib.sha1(blob).hexdigest() for blob in media.values()]
+    assert references > len(media)
+    assert len(digests) == len(set(digests))
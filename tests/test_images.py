@@ -0,0 +1,80 @@
+"""Tests for file-backed image parts and picture embedding (images)."""
+
+import io
+import shutil
+
+import pytest
+from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.parts.image import Image, ImagePart
+from pptx.util import Inches
+
+from iltci_pptx.images import FileImagePart, embed_picture
+from iltci_pptx.image_index import ImageIndex
+from iltci_pptx.package_writer import save_presentation
+
+from helpers import REPO_ROOT, read_parts
+
+IMAGE = REPO_ROOT / 'assets' / 'git-jj.png'
+
+
+def _blank_slide(prs):
+    return prs.slides.add_slide(prs.slide_layouts[6])
+
+
+@pytest.mark.parametrize('name', ['git-jj.png', 'sam-altman-chatgpt.png', 'title_slide_bg_image1.png'])
+def test_file_part_matches_python_pptx(name):
+    img_path = REPO_ROOT / 'assets' / name
+    package = Presentation().part.package
+    part = FileImagePart.from_file(package, img_path, ImageIndex().lookup(img_path))
+    reference = ImagePart.new(package, Image.from_file(str(img_path)))
+
+    assert part._blob is None
+    assert part.blob == img_path.read_bytes()
+    assert part.sha1 == reference.sha1
+    assert part.content_type == reference.content_type
+    assert part._native_size == reference._native_size
+    assert part.desc == name
+
+
+@pytest.mark.parametrize('width, height', [(None, None), (Inches(3), None), (None, Inches(2)),
+                                           (Inches(3), Inches(2))])
+def test_embed_picture_matches_add_picture(config, width, height):
+    expected = Presentation()
+    _blank_slide(expected).shapes.add_picture(str(IMAGE), Inches(1), Inches(1), width, height)
+    actual = Presentation()
+    embed_picture(_blank_slide(actual), IMAGE, Inches(1), Inches(1), width, height, config,
+                  filename=IMAGE.name)
+
+    outputs = []
+    for prs in (expected, actual):
+        stream = io.BytesIO()
+        prs.save(stream)
+        outputs.append(read_parts(stream.getvalue(), prefix='ppt/'))
+    assert outputs[0] == outputs[1]
+
+
+def test_identical_images_share_one_part(config, tmp_path):
+    copy = tmp_path / 'copy.png'
+    shutil.copyfile(IMAGE, copy)
+    prs = Presentation()
+
+    embed_picture(_blank_slide(prs), IMAGE, 0, 0, config=config, filename=IMAGE.name)
+    picture = embed_picture(_blank_slide(prs), copy, 0, 0, config=config, filename=copy.name)
+
+    parts = {rel.target_part for slide in prs.slides for rel in slide.part.rels.values()
+             if rel.reltype == RT.IMAGE}
+    assert len(parts) == 1
+    assert picture._element.nvPicPr.cNvPr.get('descr') == 'copy.png'
+
+
+def test_image_changed_before_save_fails_it(config, tmp_path):
+    img_path = tmp_path / 'image.png'
+    shutil.copyfile(IMAGE, img_path)
+    prs = Presentation()
+    embed_picture(_blank_slide(prs), img_path, 0, 0, config=config, filename=img_path.name)
+
+    with open(img_path, 'ab') as f:
+        f.write(b'\0')
+    with pytest.raises(RuntimeError):
+        save_presentation(prs, io.BytesIO(), config)
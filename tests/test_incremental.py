@@ -0,0 +1,42 @@
+"""Tests for incremental regeneration: the rebuild must equal a full build."""
+
+from iltci_pptx.generator import PresentationGenerator
+
+from helpers import read_parts
+
+# Its image is first embedded by an earlier slide, which the rebuild splices in
+EDITED_TITLE = 'Image Side 44'
+
+
+def _build(config, content, incremental):
+    config.set('paths.content', str(content))
+    config.set('incremental.enabled', incremental)
+    return PresentationGenerator(config).generate()
+
+
+def test_incremental_rebuild_matches_full_build(config, write_deck, tmp_path):
+    deck = write_deck(60)
+    _build(config, deck, incremental=True)
+
+    deck.write_text(deck.read_text(encoding='utf-8').replace(EDITED_TITLE, EDITED_TITLE + ' edited'),
+                    encoding='utf-8')
+    report = _build(config, deck, incremental=True)
+    incremental_parts = read_parts(report.output_path)
+
+    builders = [slide['builder'] for slide in report.slides]
+    assert builders.count('reused') == len(builders) - 1
+    rebuilt = [slide['title'] for slide in report.slides if slide['builder'] != 'reused']
+    assert rebuilt == [EDITED_TITLE + ' edited']
+
+    config.set('paths.output', str(tmp_path / 'full.pptx'))
+    full = _build(config, deck, incremental=False)
+    assert incremental_parts == read_parts(full.output_path)
+
+
+def test_changed_config_rebuilds_everything(config, write_deck):
+    deck = write_deck(6)
+    _build(config, deck, incremental=True)
+
+    config.set('fonts.content_slide.title', config.get('fonts.content_slide.title', 32) + 2)
+    report = _build(config, deck, incremental=True)
+    assert all(slide['builder'] != 'reused' for slide in report.slides)
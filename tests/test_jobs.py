@@ -0,0 +1,75 @@
+"""Tests for background generation jobs (jobs.GenerationJob)."""
+
+import threading
+
+from iltci_pptx import jobs
+from iltci_pptx.generator import PresentationGenerator
+from iltci_pptx.jobs import GenerationJob
+
+from helpers import read_parts
+
+
+def test_job_produces_the_same_deck(config, write_deck):
+    markdown = write_deck(6).read_text(encoding='utf-8')
+    job = GenerationJob(config, markdown).start()
+
+    assert job.wait(timeout=60)
+    assert job.state == jobs.DONE
+    assert job.error is None
+    assert len(job.report.slides) == 6
+    assert job.progress['phase'] == 'done'
+    assert job.elapsed > 0
+    assert read_parts(job.result) == read_parts(PresentationGenerator(config).generate_bytes(markdown))
+
+
+def test_cancel_stops_after_the_current_slide(config, write_deck):
+    markdown = write_deck(12).read_text(encoding='utf-8')
+    job = GenerationJob(config, markdown)
+    building = threading.Event()
+    resume = threading.Event()
+    on_progress = job._on_progress
+
+    def pause_on_first_slide(event):
+        if event['phase'] == 'build' and not building.is_set():
+            building.set()
+            resume.wait(timeout=60)
+        on_progress(event)
+
+    job._on_progress = pause_on_first_slide
+    job.start()
+    assert building.wait(timeout=60)
+    job.cancel()
+    resume.set()
+
+    assert job.wait(timeout=60)
+    assert job.state == jobs.CANCELLED
+    assert job.result is None
+    assert job.progress['slide'] == 1
+
+
+def test_failure_is_recorded(config):
+    job = GenerationJob(config, "# Slide\n", template=b'not a pptx').start()
+
+    assert job.wait(timeout=60)
+    assert job.state == jobs.FAILED
+    assert job.error is not None
+    assert job.result is None
+
+
+def test_cancel_during_save_keeps_the_deck(config, write_deck):
+    markdown = write_deck(6).read_text(encoding='utf-8')
+    job = GenerationJob(config, markdown)
+    on_progress = job._on_progress
+
+    def cancel_once_saving(event):
+        on_progress(event)
+        if event['phase'] == 'save':
+            job.cancel()
+
+    job._on_progress = cancel_once_saving
+    job.start()
+
+    assert job.wait(timeout=60)
+    assert job.state == jobs.DONE
+    assert job.progress['phase'] == 'done'
+    assert read_parts(job.result) == read_parts(PresentationGenerator(config).generate_bytes(markdown))
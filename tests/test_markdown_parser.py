@@ -0,0 +1,132 @@
+"""Token-level tests for the slide tokenizer (markdown_parser)."""
+
+from iltci_pptx.markdown_parser import (
+    BULLET, DIRECTIVE, HEADING, HTML, NUMBERED, SECTION, SPACER, SPACER_MARKER, TEXT, TITLE,
+    Token, split_slides, tokenize_content, tokenize_slide,
+)
+
+TITLE_MARKER = '<!-- _class: title -->'
+
+
+def _kinds(tokens):
+    return [(token.kind, token.text) for token in tokens]
+
+
+def test_split_slides():
+    lines = ['# One', '', '---', '', '# Two', '---', '---', 'text']
+    assert list(split_slides(lines)) == [['# One', ''], ['', '# Two'], ['---', 'text']]
+    # A separator on the first line is slide text
+    assert list(split_slides(['---', '# One'])) == [['---', '# One']]
+    assert list(split_slides([])) == []
+
+
+def test_content_slide_tokens():
+    lines = [
+        '<!-- section: Part 1 -->',
+        '# Title',
+        '<!-- _layout: image-side --> <!-- _image_fit: contain -->',
+        '',
+        '- bullet',
+        '',
+        '',
+        'text',
+        '',
+    ]
+    tokens = list(tokenize_slide(lines, TITLE_MARKER))
+
+    assert _kinds(tokens) == [
+        (SECTION, 'Part 1'),
+        (TITLE, 'Title'),
+        (DIRECTIVE, 'image-side'),
+        (DIRECTIVE, 'contain'),
+        (TEXT, '- bullet'),
+        (SPACER, ''),
+        (SPACER, ''),
+        (TEXT, 'text'),
+    ]
+    assert [token.role for token in tokens if token.kind == DIRECTIVE] == ['layout', 'image_fit']
+    assert {token.role for token in tokens[4:]} == {'content'}
+    assert tokens[5].line == SPACER_MARKER
+
+
+def test_directive_is_removed_wherever_it_appears():
+    lines = ['# Title', 'before <!-- _bg_image: assets/bg.png --> after', '<!-- _bg_image: assets/bg.png -->']
+    tokens = list(tokenize_slide(lines, TITLE_MARKER))
+    assert _kinds(tokens) == [(TITLE, 'Title'), (DIRECTIVE, 'assets/bg.png'), (TEXT, 'before  after')]
+    assert tokens[1].role == 'bg_image'
+
+
+def test_h2_is_the_title_of_a_content_slide_without_h1():
+    tokens = list(tokenize_slide(['## Heading title', '## Second'], TITLE_MARKER))
+    assert _kinds(tokens) == [(TITLE, 'Heading title'), (TEXT, '## Second')]
+
+
+def test_title_slide_subtitle_roles():
+    lines = [
+        TITLE_MARKER,
+        '# Deck title',
+        '## Presenter',
+        '',
+        '### Affiliation',
+        'Plain line',
+        '#### Small print',
+        '##### Footnote',
+    ]
+    tokens = list(tokenize_slide(lines, TITLE_MARKER))
+
+    assert tokens[0] == Token(DIRECTIVE, 'title', role='class')
+    assert tokens[1] == Token(TITLE, 'Deck title')
+    assert [(token.kind, token.text, token.level, token.role) for token in tokens[2:]] == [
+        (HEADING, 'Presenter', 2, 'subtitle'),
+        (SPACER, '', 0, 'subtitle'),
+        (HEADING, 'Affiliation', 3, 'subtitle'),
+        (TEXT, 'Plain line', 0, 'subtitle'),
+        (TEXT, '#### Small print', 0, 'content'),
+        (TEXT, '##### Footnote', 0, 'content'),
+    ]
+
+
+def test_content_tokens_by_kind():
+    lines = ['## Two', '### Three', '#### Four', '##### Five', '###### Six', '- bullet', '-not a bullet',
+             '1. first', '3. third', '10.no space', SPACER_MARKER, 'plain', '']
+    tokens = list(tokenize_content(lines))
+
+    assert [(token.kind, token.text, token.level, token.number) for token in tokens] == [
+        (HEADING, 'Two', 2, 0),
+        (HEADING, 'Three', 3, 0),
+        (HEADING, 'Four', 4, 0),
+        (HEADING, 'Five', 5, 0),
+        (TEXT, '###### Six', 0, 0),
+        (BULLET, 'bullet', 0, 0),
+        (TEXT, '-not a bullet', 0, 0),
+        (NUMBERED, 'first', 0, 1),
+        (NUMBERED, 'third', 0, 3),
+        (TEXT, '10.no space', 0, 0),
+        (SPACER, '', 0, 0),
+        (TEXT, 'plain', 0, 0),
+    ]
+    assert tokens[5].line == '- bullet'
+
+
+def test_html_block_becomes_one_token():
+    lines = [
+        '- before',
+        '<div class="image-container">',
+        '  <img src="assets/a.png"',
+        '    alt="A">',
+        '</div>',
+        'Caption <b>bold</b>',
+    ]
+    tokens = list(tokenize_content(lines))
+
+    assert tokens[0] == Token(BULLET, 'before', line='- before')
+    assert tokens[1].kind == HTML
+    assert tokens[1].text == '\n'.join(lines[1:5])
+    assert tokens[2].kind == HTML
+    assert tokens[2].text == 'Caption <b>bold</b>'
+    assert _kinds(tokens[3:]) == [(TEXT, 'Caption bold')]
+
+
+def test_unclosed_html_runs_to_the_end():
+    tokens = list(tokenize_content(['<div>', '- inside']))
+    assert tokens[0] == Token(HTML, '<div>\n- inside')
@@ -0,0 +1,190 @@
+"""Tests for saving generated decks (package_writer)."""
+
+import io
+import os
+import subprocess
+import sys
+import time
+import zipfile
+from types import SimpleNamespace
+
+import pytest
+from pptx.opc.packuri import PackURI
+
+from iltci_pptx import package_writer
+from iltci_pptx.generator import PresentationGenerator
+from iltci_pptx.package_writer import _ZipWriter, compress_threads, deterministic_timestamp
+
+from helpers import REPO_ROOT
+
+# Generates the deck at argv[1] into argv[2] in deterministic mode, in a fresh
+# process, keeping its image index at argv[3]
+_GENERATE_SCRIPT = """
+import sys
+sys.path[:0] = [{src!r}, {root!r}]
+from iltci_pptx.config import Config
+from iltci_pptx.generator import PresentationGenerator
+config = Config({config!r})
+config.set('image_processing.enabled', False)
+config.set('image_index.path', sys.argv[3])
+config.set('result_cache.enabled', False)
+config.set('package.deterministic', True)
+with open(sys.argv[1], encoding='utf-8') as f:
+    data = PresentationGenerator(config).generate_bytes(f.read())
+with open(sys.argv[2], 'wb') as f:
+    f.write(data)
+""".format(src=str(REPO_ROOT / 'src'), root=str(REPO_ROOT), config=str(REPO_ROOT / 'app' / 'config.yaml'))
+
+
+@pytest.fixture
+def deterministic(config, monkeypatch):
+    """Configuration with package.deterministic set and no SOURCE_DATE_EPOCH."""
+    monkeypatch.delenv('SOURCE_DATE_EPOCH', raising=False)
+    config.set('package.deterministic', True)
+    return config
+
+
+def test_deterministic_output_is_byte_identical(deterministic, write_deck):
+    markdown = write_deck(12).read_text(encoding='utf-8')
+    first = PresentationGenerator(deterministic).generate_bytes(markdown)
+    second = PresentationGenerator(deterministic).generate_bytes(markdown)
+    assert first == second
+
+
+def test_deterministic_output_is_identical_across_processes(deterministic, write_deck, tmp_path):
+    deck = write_deck(12)
+    expected = PresentationGenerator(deterministic).generate_bytes(deck.read_text(encoding='utf-8'))
+
+    output = tmp_path / 'other.pptx'
+    env = dict(os.environ, PYTHONHASHSEED='12345')
+    env.pop('SOURCE_DATE_EPOCH', None)
+    subprocess.run([sys.executable, '-c', _GENERATE_SCRIPT, str(deck), str(output),
+                    str(tmp_path / 'index.json')],
+                   cwd=REPO_ROOT, env=env, check=True)
+    assert output.read_bytes() == expected
+
+
+def test_deterministic_entries(deterministic, write_deck):
+    data = PresentationGenerator(deterministic).generate_bytes(write_deck(6).read_text(encoding='utf-8'))
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        infos = archive.infolist()
+        core = archive.read('docProps/core.xml')
+
+    assert {info.date_time for info in infos} == {(1980, 1, 1, 0, 0, 0)}
+    parts = [info.filename for info in infos
+             if info.filename != '[Content_Types].xml' and '_rels/' not in info.filename]
+    assert parts == sorted(parts)
+    assert b'<dcterms:modified xsi:type="dcterms:W3CDTF">1980-01-01T00:00:00Z</dcterms:modified>' in core
+
+
+def test_source_date_epoch(deterministic, monkeypatch):
+    monkeypatch.setenv('SOURCE_DATE_EPOCH', '1700000000')
+    assert deterministic_timestamp().timestamp() == 1700000000
+    data = PresentationGenerator(deterministic).generate_bytes("# Slide\n")
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        assert {info.date_time for info in archive.infolist()} == {(2023, 11, 14, 22, 13, 20)}
+
+    monkeypatch.setenv('SOURCE_DATE_EPOCH', 'yesterday')
+    with pytest.raises(ValueError):
+        deterministic_timestamp()
+
+
+def test_media_is_stored_and_xml_deflated(config, write_deck):
+    data = PresentationGenerator(config).generate_bytes(write_deck(12).read_text(encoding='utf-8'))
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        infos = archive.infolist()
+
+    media = [info for info in infos if info.filename.startswith('ppt/media/')]
+    assert media
+    assert {info.compress_type for info in media} == {zipfile.ZIP_STORED}
+    assert {info.compress_type for info in infos if info.filename.endswith(('.xml', '.rels'))} == \
+        {zipfile.ZIP_DEFLATED}
+
+
+def test_store_media_off_deflates_everything(config, write_deck):
+    markdown = write_deck(12).read_text(encoding='utf-8')
+    stored = PresentationGenerator(config).generate_bytes(markdown)
+    config.set('package.store_media', False)
+    deflated = PresentationGenerator(config).generate_bytes(markdown)
+
+    with zipfile.ZipFile(io.BytesIO(deflated)) as archive:
+        assert {info.compress_type for info in archive.infolist()} == {zipfile.ZIP_DEFLATED}
+        deflated_parts = {name: archive.read(name) for name in archive.namelist()}
+    with zipfile.ZipFile(io.BytesIO(stored)) as archive:
+        stored_parts = {name: archive.read(name) for name in archive.namelist()}
+    # Only the compression differs, not the parts
+    stored_parts.pop('docProps/core.xml')
+    deflated_parts.pop('docProps/core.xml')
+    assert stored_parts == deflated_parts
+
+
+def test_invalid_compress_level(config):
+    config.set('package.compress_level', 12)
+    with pytest.raises(ValueError):
+        PresentationGenerator(config).generate_bytes("# Slide\n")
+
+
+@pytest.mark.parametrize('deterministic_mode', [False, True])
+def test_threaded_save_matches_sequential(config, write_deck, monkeypatch, deterministic_mode):
+    monkeypatch.delenv('SOURCE_DATE_EPOCH', raising=False)
+    # Fixed entry times, so the two saves can only differ in how parts were written
+    monkeypatch.setattr(package_writer, 'time', SimpleNamespace(
+        time=time.time, localtime=lambda *args: (2024, 1, 2, 3, 4, 5, 1, 2, 0)))
+    config.set('package.deterministic', deterministic_mode)
+    markdown = write_deck(24).read_text(encoding='utf-8')
+    outputs = []
+    for threads in (1, 4):
+        config.set('package.compress_threads', threads)
+        outputs.append(PresentationGenerator(config).generate_bytes(markdown))
+    assert outputs[0] == outputs[1]
+
+
+def test_write_compressed_matches_writestr(tmp_path):
+    members = [
+        (PackURI('/ppt/slides/slide1.xml'), b'<p:sld>' + b'text ' * 5000 + b'</p:sld>'),
+        (PackURI('/ppt/media/image1.png'), bytes(range(256)) * 64),
+        (PackURI('/ppt/empty.xml'), b''),
+    ]
+    date_time = (2024, 1, 2, 3, 4, 5)
+    outputs = []
+    for precompressed in (False, True):
+        stream = io.BytesIO()
+        with _ZipWriter(stream, date_time, 6, store_media=True) as writer:
+            for pack_uri, blob in members:
+                if precompressed:
+                    writer.write_compressed(*writer.compress(pack_uri, blob))
+                else:
+                    writer.write(pack_uri, blob)
+        outputs.append(stream.getvalue())
+
+    assert outputs[0] == outputs[1]
+    with zipfile.ZipFile(io.BytesIO(outputs[1])) as archive:
+        assert archive.testzip() is None
+        assert [archive.read(pack_uri.membername) for pack_uri, _ in members] == \
+            [blob for _, blob in members]
+
+
+def test_write_compressed_to_an_unseekable_stream():
+    class Unseekable(io.RawIOBase):
+        def __init__(self):
+            self.data = bytearray()
+
+        def writable(self):
+            return True
+
+        def write(self, b):
+            self.data += b
+            return len(b)
+
+    target = Unseekable()
+    blob = b'<p:sld>' + b'text ' * 1000 + b'</p:sld>'
+    with _ZipWriter(target, (2024, 1, 2, 3, 4, 5), 6, store_media=True) as writer:
+        writer.write_compressed(*writer.compress(PackURI('/ppt/slides/slide1.xml'), blob))
+    with zipfile.ZipFile(io.BytesIO(bytes(target.data))) as archive:
+        assert archive.read('ppt/slides/slide1.xml') == blob
+
+
+def test_invalid_compress_threads(config):
+    config.set('package.compress_threads', -1)
+    with pytest.raises(ValueError):
+        compress_threads(config)
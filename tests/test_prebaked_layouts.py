@@ -0,0 +1,99 @@
+"""Tests for slides built on the template's pre-baked layouts (template_layouts, slide_builders)."""
+
+import pytest
+from lxml import etree
+from pptx import Presentation
+
+from iltci_pptx.generator import PresentationGenerator
+from iltci_pptx.images import LAYOUT_SPECS
+from iltci_pptx.template_layouts import BODY_IDX
+
+from helpers import REPO_ROOT, read_parts
+
+NS = {
+    'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+    'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
+    'r': 'http://schemas.openxmlformats.org/officeDocument/2006/relationships',
+}
+
+# Slide numbers of the layout slides in a six-slide synthetic deck
+LAYOUT_SLIDES = {3: 'image-side', 4: 'content-bg', 5: 'title-bg', 6: 'dual-image-text-bottom'}
+
+
+def _slides(config, write_deck, template=None):
+    """Generate the six-slide deck and return its slide XML trees by number."""
+    if template is not None:
+        config.set('paths.template', str(template))
+    config.set('paths.content', str(write_deck(6)))
+    report = PresentationGenerator(config).generate()
+    parts = read_parts(report.output_path)
+    return {number: etree.fromstring(parts[f'ppt/slides/slide{number}.xml']) for number in range(1, 7)}, parts
+
+
+def _template(tmp_path, edit):
+    """Copy the repository template with its pre-baked layouts edited."""
+    prs = Presentation(str(REPO_ROOT / 'templates' / 'template.pptx'))
+    for master in prs.slide_masters:
+        for layout in [layout for layout in master.slide_layouts if layout.name in LAYOUT_SPECS]:
+            edit(master, layout)
+    tmp_path.mkdir()
+    path = tmp_path / 'template.pptx'
+    prs.save(str(path))
+    return path
+
+
+def _remove_layout(master, layout):
+    master.slide_layouts.remove(layout)
+
+
+def _remove_body_placeholder(master, layout):
+    for placeholder in layout.placeholders:
+        if placeholder.placeholder_format.idx == BODY_IDX:
+            placeholder._element.getparent().remove(placeholder._element)
+
+
+def test_layout_slides_fill_the_body_placeholder(config, write_deck):
+    slides, _ = _slides(config, write_deck)
+
+    for number in LAYOUT_SLIDES:
+        body = slides[number].xpath(f'.//p:sp[p:nvSpPr/p:nvPr/p:ph[@idx="{BODY_IDX}"]]', namespaces=NS)
+        assert len(body) == 1, LAYOUT_SLIDES[number]
+        assert body[0].xpath('string(.//p:txBody)', namespaces=NS).strip()
+    # Only the placeholders are on the slide; the overlay stays in the layout
+    assert not slides[4].xpath('.//p:sp[not(p:nvSpPr/p:nvPr/p:ph)]', namespaces=NS)
+
+
+def test_no_empty_picture_placeholder_remains(config, write_deck):
+    slides, _ = _slides(config, write_deck)
+
+    for number, slide in slides.items():
+        for placeholder in slide.xpath('.//p:ph[@type="pic"]', namespaces=NS):
+            shape = placeholder.getparent().getparent().getparent()
+            assert shape.tag == f"{{{NS['p']}}}pic" and shape.xpath('.//a:blip/@r:embed', namespaces=NS)
+    assert slides[3].xpath('.//p:pic', namespaces=NS)
+    assert len(slides[6].xpath('.//p:pic', namespaces=NS)) == 2
+
+
+@pytest.mark.parametrize('number', [4, 5])
+def test_background_layouts_use_a_background_fill(config, write_deck, number):
+    slides, parts = _slides(config, write_deck)
+    slide = slides[number]
+
+    rId = slide.xpath('string(p:cSld/p:bg/p:bgPr/a:blipFill/a:blip/@r:embed)', namespaces=NS)
+    assert rId
+    assert rId.encode() in parts[f'ppt/slides/_rels/slide{number}.xml.rels']
+    # No picture shape covers the layout's overlay
+    assert not slide.xpath('.//p:pic', namespaces=NS)
+
+
+def test_templates_without_the_layouts_fall_back(config, write_deck, tmp_path):
+    removed, removed_parts = _slides(config, write_deck, _template(tmp_path / 'removed', _remove_layout))
+    config.set('paths.output', str(tmp_path / 'broken.pptx'))
+    _, broken_parts = _slides(config, write_deck, _template(tmp_path / 'broken', _remove_body_placeholder))
+
+    # Layouts missing or unusable: both built shape by shape on 'Title and Content'
+    assert removed_parts == broken_parts
+    for number in LAYOUT_SLIDES:
+        assert not removed[number].xpath('p:cSld/p:bg', namespaces=NS)
+        assert not removed[number].xpath(f'.//p:ph[@idx="{BODY_IDX}"]', namespaces=NS)
+    assert removed[4].xpath('.//p:sp[not(p:nvSpPr/p:nvPr/p:ph)]', namespaces=NS)
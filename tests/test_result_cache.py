@@ -0,0 +1,82 @@
+"""Tests for the whole-deck result cache (result_cache)."""
+
+import sys
+
+from iltci_pptx.cli import apply_overrides, parse_arguments
+from iltci_pptx.generator import PresentationGenerator
+from iltci_pptx.markdown_parser import parse_markdown_text
+from iltci_pptx.result_cache import deck_fingerprint, get_result_cache
+from iltci_pptx.template_cache import template_digest
+
+from helpers import read_parts
+
+
+def _fingerprint(config, text):
+    frontmatter, slides = parse_markdown_text(text, config)
+    return deck_fingerprint(config, frontmatter, slides, template_digest(config.template_path))
+
+
+def test_disabled_by_default(config):
+    assert get_result_cache(config) is None
+
+
+def test_second_generation_is_a_hit(config, write_deck):
+    config.set('result_cache.enabled', True)
+    config.set('paths.content', str(write_deck(6)))
+
+    first = PresentationGenerator(config).generate()
+    built = first.output_path.read_bytes()
+    first.output_path.unlink()
+    second = PresentationGenerator(config).generate()
+
+    assert not first.cached
+    assert second.cached
+    assert second.slides == []
+    assert second.output_path.read_bytes() == built
+    stats = get_result_cache(config).stats()
+    assert stats['hits'] == 1
+    assert stats['count'] == 1
+
+
+def test_in_memory_hit_returns_the_same_deck(config, write_deck):
+    config.set('result_cache.enabled', True)
+    markdown = write_deck(6).read_text(encoding='utf-8')
+    generator = PresentationGenerator(config)
+
+    built = generator.generate_bytes(markdown)
+    assert generator.generate_bytes(markdown) == built
+
+
+def test_fingerprint_follows_every_input(config):
+    text = "# One\n\n- a\n"
+    key = _fingerprint(config, text)
+
+    assert _fingerprint(config, text) == key
+    assert _fingerprint(config, text.replace('- a', '- b')) != key
+    config.set('fonts.content_slide.title', config.get('fonts.content_slide.title', 32) + 2)
+    assert _fingerprint(config, text) != key
+
+
+def test_fingerprint_ignores_output_settings(config, tmp_path):
+    text = "# One\n\n- a\n"
+    key = _fingerprint(config, text)
+    config.set('paths.output', str(tmp_path / 'elsewhere.pptx'))
+    assert _fingerprint(config, text) == key
+
+
+def test_profile_bypasses_the_cache(config, monkeypatch):
+    config.set('result_cache.enabled', True)
+    monkeypatch.setattr(sys, 'argv', ['apply-template', '--profile', 'profile.prof'])
+    apply_overrides(config, parse_arguments())
+    assert get_result_cache(config) is None
+
+
+def test_cached_deck_matches_a_fresh_build(config, write_deck):
+    config.set('paths.content', str(write_deck(6)))
+    fresh = read_parts(PresentationGenerator(config).generate().output_path)
+
+    config.set('result_cache.enabled', True)
+    PresentationGenerator(config).generate()
+    report = PresentationGenerator(config).generate()
+    assert report.cached
+    assert read_parts(report.output_path) == fresh
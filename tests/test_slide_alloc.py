@@ -0,0 +1,69 @@
+"""Tests for counter-based slide and image name allocation (slide_alloc)."""
+
+import io
+
+from pptx import Presentation
+from pptx.util import Inches
+
+from iltci_pptx.images import embed_picture
+from iltci_pptx.slide_alloc import add_slide, get_allocator
+
+from helpers import REPO_ROOT, read_parts
+
+IMAGES = [REPO_ROOT / 'assets' / name for name in ('git-jj.png', 'rpec.png', 'menugen-upload.png')]
+
+
+def _saved_parts(prs):
+    stream = io.BytesIO()
+    prs.save(stream)
+    return read_parts(stream.getvalue(), prefix='')
+
+
+def test_slides_match_python_pptx():
+    expected, actual = Presentation(), Presentation()
+    for idx in range(12):
+        layout = idx % len(expected.slide_layouts)
+        expected.slides.add_slide(expected.slide_layouts[layout])
+        add_slide(actual, actual.slide_layouts[layout])
+
+    assert _saved_parts(actual) == _saved_parts(expected)
+
+
+def test_images_match_python_pptx(config):
+    expected, actual = Presentation(), Presentation()
+    for idx in range(6):
+        img_path = IMAGES[idx % len(IMAGES)]
+        slide = expected.slides.add_slide(expected.slide_layouts[6])
+        slide.shapes.add_picture(str(img_path), Inches(1), Inches(1))
+        slide = add_slide(actual, actual.slide_layouts[6])
+        embed_picture(slide, img_path, Inches(1), Inches(1), config=config, filename=img_path.name)
+
+    assert _saved_parts(actual) == _saved_parts(expected)
+
+
+def test_slides_added_behind_the_allocators_back():
+    prs = Presentation()
+    add_slide(prs, prs.slide_layouts[0])
+    prs.slides.add_slide(prs.slide_layouts[0])
+    slide = add_slide(prs, prs.slide_layouts[0])
+
+    assert slide.part.partname == '/ppt/slides/slide3.xml'
+    assert [s.slide_id for s in prs.slides] == [256, 257, 258]
+
+
+def test_image_names_skip_existing_media():
+    prs = Presentation()
+    prs.slides.add_slide(prs.slide_layouts[6]).shapes.add_picture(str(IMAGES[0]), 0, 0)
+    allocator = get_allocator(prs.part.package)
+
+    assert allocator.next_image_partname('png') == '/ppt/media/image2.png'
+    assert allocator.next_image_partname('jpg') == '/ppt/media/image3.jpg'
+
+
+def test_picture_placeholders_can_be_left_out():
+    prs = Presentation()
+    layout = next(layout for layout in prs.slide_layouts if layout.name == 'Picture with Caption')
+
+    with_pictures = add_slide(prs, layout)
+    without_pictures = add_slide(prs, layout, clone_pictures=False)
+    assert len(without_pictures.placeholders) == len(with_pictures.placeholders) - 1
@@ -0,0 +1,59 @@
+"""Tests for streaming generation (package.streaming)."""
+
+import pytest
+
+from iltci_pptx import generator as generator_module
+from iltci_pptx.generator import PresentationGenerator
+
+from helpers import read_parts
+
+
+def _generate(config, streaming, events=None):
+    config.set('package.streaming', streaming)
+    return PresentationGenerator(config, progress=events.append if events is not None else None).generate()
+
+
+def test_streaming_writes_the_same_parts(config, write_deck, tmp_path):
+    config.set('paths.content', str(write_deck(24)))
+    streamed = read_parts(_generate(config, True).output_path, prefix='')
+
+    config.set('paths.output', str(tmp_path / 'saved.pptx'))
+    saved = read_parts(_generate(config, False).output_path, prefix='')
+    # Core properties carry the save time; everything else must match
+    streamed.pop('docProps/core.xml')
+    saved.pop('docProps/core.xml')
+    assert streamed == saved
+
+
+def test_done_event_counts_the_slides(config, write_deck):
+    config.set('paths.content', str(write_deck(17)))
+    events = []
+    report = _generate(config, True, events)
+
+    assert len(report.slides) == 17
+    assert events[-1]['phase'] == 'done'
+    assert events[-1]['total'] == 17
+
+
+def test_result_cache_hit_counts_the_slides(config, write_deck):
+    config.set('paths.content', str(write_deck(17)))
+    config.set('result_cache.enabled', True)
+    _generate(config, True)
+
+    events = []
+    report = _generate(config, True, events)
+    assert report.cached
+    assert events[-1]['total'] == 17
+
+
+def test_failed_build_leaves_no_output(config, write_deck, tmp_path, monkeypatch):
+    config.set('paths.content', str(write_deck(6)))
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("builder failed")
+    monkeypatch.setattr(generator_module, 'build_content_slide', fail)
+
+    with pytest.raises(RuntimeError):
+        _generate(config, True)
+    assert list(tmp_path.glob('*.pptx*')) == []
+    assert list(tmp_path.glob('.*.partial')) == []
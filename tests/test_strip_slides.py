@@ -0,0 +1,85 @@
+"""Tests for removing a template's slides (template_cache.strip_slides)."""
+
+import io
+
+from lxml import etree
+from pptx import Presentation
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+
+from iltci_pptx.template_cache import collect_layouts, strip_slides
+
+from helpers import REPO_ROOT, read_parts
+
+_P14 = 'http://schemas.microsoft.com/office/powerpoint/2010/main'
+
+
+def _template_with_slides():
+    """A presentation with pictures, notes, a custom show and sections on its slides."""
+    prs = Presentation()
+    for idx in range(3):
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        slide.shapes.add_picture(str(REPO_ROOT / 'assets' / 'git-jj.png'), 0, 0)
+        slide.notes_slide.notes_text_frame.text = f"Notes {idx}"
+
+    presentation = prs.part._element
+    slide_ids = list(presentation.sldIdLst)
+    presentation.find(qn('p:notesSz')).addnext(parse_xml(
+        f'<p:custShowLst {nsdecls("p", "r")}><p:custShow name="Short" id="0"><p:sldLst>'
+        f'<p:sld r:id="{slide_ids[0].rId}"/></p:sldLst></p:custShow></p:custShowLst>'))
+    section_ids = ''.join(f'<p14:sldId id="{sld_id.id}"/>' for sld_id in slide_ids)
+    presentation.append(parse_xml(
+        f'<p:extLst {nsdecls("p")}><p:ext uri="{{521415D9-36F7-43E2-AB2F-B90AF26B5E84}}">'
+        f'<p14:sectionLst xmlns:p14="{_P14}">'
+        f'<p14:section name="All" id="{{00000000-0000-0000-0000-000000000001}}">'
+        f'<p14:sldIdLst>{section_ids}</p14:sldIdLst></p14:section></p14:sectionLst></p:ext></p:extLst>'))
+    return prs
+
+
+def _save(prs):
+    stream = io.BytesIO()
+    prs.save(stream)
+    return stream.getvalue()
+
+
+def test_strip_removes_slides_and_their_parts():
+    prs = _template_with_slides()
+    layouts_before = [layout.name for layout in collect_layouts(prs)]
+
+    removed, pruned, dead_bytes = strip_slides(prs)
+    assert removed == 3
+    # Three slides, their notes and the image they share; the notes master stays
+    assert pruned == 7
+    assert dead_bytes > (REPO_ROOT / 'assets' / 'git-jj.png').stat().st_size
+
+    data = _save(prs)
+    names = read_parts(data, prefix='ppt/')
+    assert not [name for name in names if name.startswith(('ppt/slides/', 'ppt/notesSlides/', 'ppt/media/'))]
+    presentation = etree.fromstring(names['ppt/presentation.xml'])
+    assert presentation.find(qn('p:custShowLst')) is None
+    assert presentation.find(qn('p:extLst')) is None
+
+    reopened = Presentation(io.BytesIO(data))
+    assert len(reopened.slides) == 0
+    assert [layout.name for layout in collect_layouts(reopened)] == layouts_before
+
+
+def test_strip_keeps_unrelated_extensions():
+    prs = _template_with_slides()
+    presentation = prs.part._element
+    ext_lst = presentation.find(qn('p:extLst'))
+    ext_lst.append(parse_xml(f'<p:ext {nsdecls("p")} uri="{{custom}}"/>'))
+
+    strip_slides(prs)
+    assert [ext.get('uri') for ext in ext_lst] == ['{custom}']
+    assert ext_lst.getparent() is presentation
+
+
+def test_stripped_repo_template_accepts_new_slides():
+    prs = Presentation(str(REPO_ROOT / 'templates' / 'template.pptx'))
+    removed, _, _ = strip_slides(prs)
+    assert removed == 2
+
+    prs.slides.add_slide(prs.slide_layouts[0])
+    reopened = Presentation(io.BytesIO(_save(prs)))
+    assert len(reopened.slides) == 1
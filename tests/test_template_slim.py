@@ -0,0 +1,71 @@
+"""Tests for slimmed template copies (template_slim)."""
+
+from pptx import Presentation
+
+from iltci_pptx.generator import PresentationGenerator
+from iltci_pptx.template_cache import collect_layouts
+from iltci_pptx.template_slim import format_slim_report, slim_template
+
+from helpers import REPO_ROOT, read_parts
+
+TEMPLATE = REPO_ROOT / 'templates' / 'template.pptx'
+
+
+def _total(sizes):
+    return sum(size for size, _ in sizes.values())
+
+
+def _slide_xml(data):
+    """Slide XML parts of a deck, without their relationships.
+
+    Media numbers may differ between templates: re-encoded template images no
+    longer deduplicate with identical deck images.
+    """
+    return {name: xml for name, xml in read_parts(data).items() if '/_rels/' not in name}
+
+
+def test_slim_repo_template(config, write_deck, tmp_path):
+    report = slim_template(TEMPLATE, tmp_path / 'slim.pptx', config)
+
+    assert report['removed_slides'] == 2
+    assert _total(report['after']) < _total(report['before'])
+    assert report['layout_indices'] == {'layouts.title_slide_index': (0, 0),
+                                        'layouts.content_slide_index': (1, 1)}
+    slim = Presentation(str(tmp_path / 'slim.pptx'))
+    assert len(slim.slides) == 0
+    assert [layout.name for layout in collect_layouts(slim)] == \
+        [layout.name for layout in collect_layouts(Presentation(str(TEMPLATE)))]
+    assert 'after KB' in format_slim_report(report)
+
+    markdown = write_deck(24).read_text(encoding='utf-8')
+    generator = PresentationGenerator(config)
+
+    expected = generator.generate_bytes(markdown)
+    actual = generator.generate_bytes(markdown, template=(tmp_path / 'slim.pptx').read_bytes())
+    assert _slide_xml(actual) == _slide_xml(expected)
+
+
+def test_unused_layouts_are_dropped_and_indices_remapped(config, tmp_path):
+    template = tmp_path / 'default.pptx'
+    Presentation().save(str(template))
+    config.set('layouts.title_slide_index', 5)
+    config.set('layouts.content_slide_index', 1)
+    config.set('template_slim.keep_layouts', ['Blank'])
+
+    report = slim_template(template, tmp_path / 'slim.pptx', config)
+    names = [layout.name for layout in collect_layouts(Presentation(str(tmp_path / 'slim.pptx')))]
+    assert names == ['Title and Content', 'Title Only', 'Blank']
+    assert len(report['removed_layouts']) == 8
+    assert report['layout_indices'] == {'layouts.title_slide_index': (5, 1),
+                                        'layouts.content_slide_index': (1, 0)}
+
+
+def test_oversized_layout_image_is_downsampled(config, tmp_path):
+    config.set('template_slim.target_dpi', 50)
+    report = slim_template(TEMPLATE, tmp_path / 'slim.pptx', config)
+
+    background = next(image for image in report['images'] if image['pixels'][0] == (1920, 1080))
+    assert background['pixels'][1][0] < 1920
+    assert background['bytes'][1] < background['bytes'][0]
+    media = read_parts(tmp_path / 'slim.pptx', prefix='ppt/media/')
+    assert len(media[background['new_partname'][1:]]) == background['bytes'][1]
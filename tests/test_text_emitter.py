@@ -0,0 +1,47 @@
+"""Tests for direct XML emission of content text (text_emitter)."""
+
+import pytest
+
+from iltci_pptx.generator import PresentationGenerator
+
+from helpers import read_parts
+
+EDGE_CASES = {
+    'markup': "# Escapes\n\n- 5 < 6 & 7 > 3, \"quoted\" and 'single'\n- <b>not a tag</b>\n",
+    'control_chars': "# Control\n\nBell\x07 and vertical\x0btab\n\n- Escape\x1b char\n",
+    'formatting': ("# Formatting\n\n- **bold** *italic* ***both*** plain\n"
+                   "- **bold [link](https://example.com/a?b=1&c=2)** after\n"
+                   "- [empty]() link\n"),
+    'numbering': "# Numbers\n\n3. Starts at three\n4. Four\n\n1. Restart\n",
+    'headers': "# Headers\n\n## Two\n### Three **bold**\n#### Four\n##### Five\n###### Six\n",
+    'spacers': "# Spacers\n\nFirst\n\n<!-- spacer -->\n\nSecond\n\n<!-- spacer -->\n<!-- spacer -->\n",
+    'empty_spans': "# Empty\n\n- ****\n- ** **\n",
+    'unicode': "# Unicode\n\n- Ünïcödé — “quotes” 🚀\n-  non-breaking\n",
+}
+
+
+def _both_emitters(config, markdown):
+    outputs = []
+    for emitter in ('pptx', 'lxml'):
+        config.set('formatting.text_emitter', emitter)
+        outputs.append(read_parts(PresentationGenerator(config).generate_bytes(markdown)))
+    return outputs
+
+
+def test_synthetic_deck_is_identical(config, write_deck):
+    reference, emitted = _both_emitters(config, write_deck(36).read_text(encoding='utf-8'))
+    assert emitted == reference
+
+
+@pytest.mark.parametrize('case', sorted(EDGE_CASES))
+def test_edge_cases_are_identical(config, case):
+    reference, emitted = _both_emitters(config, EDGE_CASES[case])
+    assert emitted == reference
+
+
+def test_custom_numbering_and_sizes(config):
+    config.set('bullets.numbering_type', 'romanUcPeriod')
+    config.set('fonts.content_slide.bullet', 19.5)
+    markdown = "# Custom\n\n1. One\n2. Two\n\n- Bullet\n"
+    reference, emitted = _both_emitters(config, markdown)
+    assert emitted == reference
@@ -0,0 +1,102 @@
+"""Tests for generation timing reports (timing) and the CLI profiler hook."""
+
+import pstats
+
+import pytest
+
+from iltci_pptx.cli import run_profiled
+from iltci_pptx.generator import PresentationGenerator
+from iltci_pptx.timing import GenerationReport, recording, timed
+
+
+def _report():
+    report = GenerationReport()
+    report.add_slide(0, 'Intro', 'title', None, 0.002)
+    report.add_slide(1, 'Agenda', 'content', None, 0.004)
+    report.add_slide(2, 'Chart', 'layout', 'image-side', 0.010)
+    report.add_slide(3, 'Photo', 'layout', 'image-side', 0.006)
+    report.add_slide(4, 'Wrap up', 'content', None, 0.001)
+    report.add('save', 0.020)
+    report.total_seconds = 0.050
+    return report
+
+
+def test_phases_accumulate():
+    report = GenerationReport()
+    report.add('parse', 0.25)
+    report.add('parse', 0.5)
+    with report.phase('save'):
+        pass
+
+    assert report.phases['parse'] == 0.75
+    assert report.phase_counts == {'parse': 2, 'save': 1}
+    assert report.phases['save'] >= 0
+
+
+def test_timed_without_an_active_report_does_nothing():
+    with timed('image_embed'):
+        with timed('text'):
+            pass
+    # Nothing leaked from an earlier recording either
+    report = GenerationReport()
+    with recording(report):
+        pass
+    with timed('text'):
+        pass
+    assert report.phases == {}
+
+
+def test_nested_recording_targets_the_innermost_report():
+    outer, inner = GenerationReport(), GenerationReport()
+    with recording(outer):
+        with timed('image_prepare'):
+            with recording(inner):
+                with timed('image_embed'):
+                    pass
+            with timed('image_embed'):
+                pass
+
+    assert inner.phase_counts == {'image_embed': 1}
+    assert outer.phase_counts == {'image_prepare': 1, 'image_embed': 1}
+
+
+def test_builder_totals_and_slowest_slides():
+    report = _report()
+
+    assert report.builder_totals() == {
+        'title': {'count': 1, 'seconds': 0.002},
+        'content': {'count': 2, 'seconds': pytest.approx(0.005)},
+        'layout:image-side': {'count': 2, 'seconds': pytest.approx(0.016)},
+    }
+    assert [slide['title'] for slide in report.slowest_slides(3)] == ['Chart', 'Photo', 'Agenda']
+    assert report.phase_counts['build'] == 5
+    assert report.phases['build'] == pytest.approx(0.023)
+
+
+def test_format_summary():
+    lines = _report().format_summary(slowest=2).splitlines()
+
+    assert lines[0] == 'Generated 5 slide(s) in 50 ms'
+    # Phases in pipeline order, not insertion order
+    assert [line.split()[0] for line in lines[1:3]] == ['build', 'save']
+    assert lines[3] == 'Per builder:'
+    assert lines[4].split() == ['content', '2', 'slide(s)', '2.50', 'ms/slide']
+    assert lines[7] == 'Slowest slides:'
+    assert lines[8].split() == ['#3', '10.00', 'ms', 'layout:image-side', 'Chart']
+    assert len(lines) == 10
+
+    cached = GenerationReport()
+    cached.cached = True
+    cached.total_seconds = 0.003
+    assert cached.format_summary() == 'Copied from the result cache in 3 ms'
+
+
+def test_run_profiled_writes_a_cprofile_dump(config, write_deck, tmp_path):
+    config.set('paths.content', str(write_deck(3)))
+    profile_path = tmp_path / 'profiles' / 'run.prof'
+
+    report = run_profiled(PresentationGenerator(config).generate, profile_path)
+
+    assert len(report.slides) == 3
+    stats = pstats.Stats(str(profile_path))
+    assert any(name == 'generate' for _, _, name in stats.stats)
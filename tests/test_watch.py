@@ -0,0 +1,143 @@
+"""Tests for watch mode (watch)."""
+
+import os
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from iltci_pptx import watch as watch_module
+from iltci_pptx.watch import changed_paths, collect_watch_paths, take_stamps, watch
+
+from helpers import REPO_ROOT
+
+
+def _touch(path, text):
+    """Rewrite a file with a new size and a later mtime."""
+    path.write_text(text, encoding='utf-8')
+    stamp = time.time() + 10
+    os.utime(path, (stamp, stamp))
+
+
+@pytest.fixture
+def deck(config, tmp_path):
+    """A one-slide deck set as the config's content."""
+    path = tmp_path / 'deck.md'
+    path.write_text("# Slide\n\n- point\n", encoding='utf-8')
+    config.set('paths.content', str(path))
+    return path
+
+
+class FakeClock:
+    """Replaces watch's time module: runs a script of actions per sleep, then stops the loop."""
+
+    def __init__(self, actions=None, max_sleeps=50):
+        self.actions = dict(actions or {})
+        self.max_sleeps = max_sleeps
+        self.sleeps = 0
+
+    def sleep(self, seconds):
+        self.sleeps += 1
+        if self.sleeps > self.max_sleeps:
+            raise KeyboardInterrupt
+        action = self.actions.pop(self.sleeps, None)
+        if action:
+            action()
+
+    perf_counter = staticmethod(time.perf_counter)
+
+
+def _run_watch(config, monkeypatch, clock, on_build=None, max_rebuilds=None):
+    """Run watch() with a fake clock and a generator that records builds."""
+    builds = []
+
+    class Generator:
+        def __init__(self, config):
+            self.config = config
+
+        def generate(self):
+            builds.append(self.config.content_path.read_text(encoding='utf-8'))
+            if on_build:
+                on_build(len(builds))
+
+    monkeypatch.setattr(watch_module, 'time', clock)
+    monkeypatch.setattr(watch_module, 'PresentationGenerator', Generator)
+    assert watch(lambda: config, interval=0.01, debounce=0.01, max_rebuilds=max_rebuilds) == 0
+    return builds
+
+
+def test_changed_paths(tmp_path):
+    kept, edited, created, removed = (tmp_path / name for name in ('kept', 'edited', 'created', 'removed'))
+    for path in (kept, edited, removed):
+        path.write_text('x', encoding='utf-8')
+    paths = [kept, edited, created, removed]
+    before = take_stamps(paths)
+
+    _touch(edited, 'xy')
+    created.write_text('new', encoding='utf-8')
+    removed.unlink()
+    after = take_stamps(paths)
+
+    assert before[created.resolve()] is None
+    assert after[removed.resolve()] is None
+    assert changed_paths(before, after) == [edited.resolve(), created.resolve(), removed.resolve()]
+    assert changed_paths(after, take_stamps(paths)) == []
+
+
+def test_collect_watch_paths(config, tmp_path):
+    deck = tmp_path / 'deck.md'
+    deck.write_text("# Slide\n<!-- _bg_image: assets/git-jj.png -->\n\n"
+                    '<img src="assets/rpec.png">\n', encoding='utf-8')
+    config.set('paths.content', str(deck))
+
+    config_files, input_files = collect_watch_paths(config)
+    assert config.config_path in config_files
+    resolved = {path.resolve() for path in input_files}
+    assert {deck, config.template_path.resolve(), REPO_ROOT / 'assets' / 'git-jj.png',
+            REPO_ROOT / 'assets' / 'rpec.png'} <= resolved
+
+
+def test_burst_of_edits_rebuilds_once(config, deck, monkeypatch):
+    # Sleep 1 polls and sees the first edit; sleeps 2 and 3 are debounce
+    # waits with two more edits, sleep 4 is quiet, so the rebuild follows it
+    clock = FakeClock({
+        1: lambda: _touch(deck, "# Slide\n\n- one\n"),
+        2: lambda: _touch(deck, "# Slide\n\n- one\n- two\n"),
+        3: lambda: _touch(deck, "# Slide\n\n- one\n- two\n- three\n"),
+    })
+    builds = _run_watch(config, monkeypatch, clock, max_rebuilds=1)
+
+    assert builds == ["# Slide\n\n- point\n", "# Slide\n\n- one\n- two\n- three\n"]
+    assert clock.sleeps == 4
+
+
+def test_no_rebuild_without_changes(config, deck, monkeypatch):
+    builds = _run_watch(config, monkeypatch, FakeClock(max_sleeps=10))
+    assert len(builds) == 1
+
+
+def test_edit_during_build_triggers_a_rebuild(config, deck, monkeypatch):
+    def edit_during_first_build(count):
+        if count == 1:
+            _touch(deck, "# Slide\n\n- saved while building\n")
+
+    builds = _run_watch(config, monkeypatch, FakeClock(max_sleeps=10), on_build=edit_during_first_build)
+    assert builds == ["# Slide\n\n- point\n", "# Slide\n\n- saved while building\n"]
+
+
+def test_config_change_reloads_the_config(config, deck, tmp_path, monkeypatch):
+    config_file = tmp_path / 'config.yaml'
+    config_file.write_text('settings: {}\n', encoding='utf-8')
+    config.config_path = config_file
+    loads = []
+
+    def load_config():
+        loads.append(1)
+        return config
+
+    clock = FakeClock({1: lambda: _touch(config_file, 'settings: {logging: {}}\n')}, max_sleeps=10)
+    monkeypatch.setattr(watch_module, 'time', clock)
+    monkeypatch.setattr(watch_module, 'PresentationGenerator',
+                        lambda config: SimpleNamespace(generate=lambda: None))
+    watch(load_config, interval=0.01, debounce=0.01)
+    assert len(loads) == 2